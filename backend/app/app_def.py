@@ -7,6 +7,7 @@
 
 # app/app_def.py
 
+import datetime
 import os
 import pathlib
 from dataclasses import dataclass, field
@@ -28,17 +29,39 @@ class DBTarget(str, Enum):
     ALL = "ALL"
 
 
+class ListView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+
 @dataclass
 class DBIndex:
     keys: list[tuple[str, int]]
     index_name: str
+    unique: bool = True
+    collation: Optional[dict] = None
+    expire_after_seconds: Optional[int] = None
+
+
+@dataclass
+class DBQueryShape:
+    name: str
+    query: dict
+    sort: Optional[list[tuple[str, int]]] = None
 
 
 @dataclass
 class DBCollection:
     name: str
     schema: Optional[dict] = field(default_factory=dict)
-    index: Optional[DBIndex] = None
+    indexes: list[DBIndex] = field(default_factory=list)
+    query_shapes: list[DBQueryShape] = field(default_factory=list)
+    # Extra create_collection options, e.g. timeseries / expireAfterSeconds
+    options: dict = field(default_factory=dict)
+    # Fields returned by list endpoints for each named ListView other than full
+    views: dict[str, list[str]] = field(default_factory=dict)
+    # List filter query parameter -> (field, operator) it is pushed down as
+    filters: dict[str, tuple[str, str]] = field(default_factory=dict)
 
 
 @dataclass
@@ -70,6 +93,7 @@ except Exception as err:
 GITHUB_API_URL = os.getenv("GITHUB_API_URL", "").strip()
 GITHUB_OWNER = os.getenv("GITHUB_OWNER", "").strip()
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "").strip()
+GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET", "").strip()
 
 # MongoDB Connection Details
 MONGODB_HOST = os.getenv("MONGODB_HOST", "localhost").strip()
@@ -78,68 +102,413 @@ MONGODB_USER = os.getenv("MONGODB_USER", "admin").strip()
 MONGODB_PASS = os.getenv("MONGODB_PASS", "password").strip()
 MONGODB_URL = f"mongodb://{MONGODB_USER}:{MONGODB_PASS}@{MONGODB_HOST}:{MONGODB_PORT}"
 
+# Serving Constants (index.py defaults, see build_parser)
+API_WORKERS = int(os.getenv("API_WORKERS", "1"))
+API_BACKLOG = 2048
+# Longer than the usual 60 s proxy idle timeout, so proxies close idle connections before the server does
+API_KEEP_ALIVE = 65
+# Seconds in-flight requests get to finish on shutdown before they are cancelled
+API_GRACEFUL_SHUTDOWN = 30
+
+# Response Cache Constants (see app/cache.py)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").strip()
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "").strip() or "redis://localhost:6379/0"
+CACHE_MAXSIZE = 256
+CACHE_TTL = 60
+# Seconds an expired entry may still be served while it is refreshed in the background (0 = off)
+CACHE_STALE_TTL = int(os.getenv("CACHE_STALE_TTL", "0"))
+
 # DB Constants
 DB_RESET_TOKEN = os.getenv("DB_RESET_TOKEN", "default").strip()
 DB_CORE = "orbit"
+# Documents per cursor round trip when streaming large result sets
+DB_STREAM_BATCH_SIZE = 1000
 
 # Runner Constants
 API_QUERY_INTERVAL = 60
+GITHUB_MAX_CONCURRENCY = 10
+GITHUB_PER_PAGE = 100
+GITHUB_TIMEOUT = 30
+# Conditional requests: URLs whose ETag and payload are kept, least recently used evicted first,
+# and how long a URL not fetched again (e.g. the jobs of a finished run) is kept
+GITHUB_ETAG_CACHE_MAXSIZE = 1024
+GITHUB_ETAG_CACHE_TTL = 10 * API_QUERY_INTERVAL
 RUNNER_STATUS_CACHE = "runner_status_cache"
+RUNNER_POLLER_STATUS = "runner_poller_status"
+RUNNER_STREAM_BROKER = "runner_stream_broker"
+# Seconds between API process checks of the shared runner snapshot version
+RUNNER_SNAPSHOT_REFRESH = 2
+# Cluster-wide lease held by the worker running the background jobs
+WORKER_LEASE_NAME = "background-jobs"
+WORKER_LEASE_TTL = 30
+# Diffs buffered per SSE client before it is resynced, and seconds between keep-alive comments
+RUNNER_STREAM_QUEUE_SIZE = 100
+RUNNER_STREAM_KEEPALIVE = 15
+# Poll interval while webhooks are flowing, and how long after the last event they count as flowing
+RUNNER_RECONCILE_INTERVAL = 600
+RUNNER_WEBHOOK_TIMEOUT = 300
+# Retention of per-minute runner samples and of their hourly rollups (daily rollups are kept)
+RUNNER_HISTORY_TTL_DAYS = int(os.getenv("RUNNER_HISTORY_TTL_DAYS", "30"))
+RUNNER_HISTORY_HOURLY_TTL_DAYS = int(os.getenv("RUNNER_HISTORY_HOURLY_TTL_DAYS", "400"))
+RUNNER_HISTORY_MAX_POINTS = 5000
+# Longest gap between two samples of a runner that is still credited to its usage rollups
+RUNNER_USAGE_MAX_GAP = 2 * RUNNER_RECONCILE_INTERVAL
 
 # DB TM Prefixes
 TC_KEY_PREFIX = "T"
 TE_KEY_PREFIX = "E"
 TCY_KEY_PREFIX = "C"
 
+# Execution results tracked by per-cycle result counters
+CYCLE_RESULT_TYPES = ["PASS", "FAIL", "BLOCKED", "NOT_EXECUTED"]
+
+# Pagination
+PAGE_LIMIT_MAX = 1000
+
 # DB Schemas
 PROJECT_SCHEMA = pydantic_to_mongo_jsonschema(Project.model_json_schema())
 TEST_CASE_SCHEMA = pydantic_to_mongo_jsonschema(TestCase.model_json_schema())
 TEST_EXECUTION_SCHEMA = pydantic_to_mongo_jsonschema(TestExecution.model_json_schema())
 TEST_CYCLE_SCHEMA = pydantic_to_mongo_jsonschema(TestCycle.model_json_schema())
 
-# DB Indexes
-TEST_CASE_INDEX = DBIndex(
-    keys=[("project_key", 1), ("test_case_key", 1)],
-    index_name="idx_tc_project_key_test_case_key"
-)
-TEST_EXECUTION_INDEX = DBIndex(
-    keys=[("project_key", 1), ("execution_key", 1)],
-    index_name="idx_te_project_key_test_case_key"
-)
-TEST_CYCLE_INDEX = DBIndex(
-    keys=[("project_key", 1), ("test_cycle_key", 1)],
-    index_name="idx_tcy_project_key_test_case_key"
-)
+# DB List Views - what list tables need, without the long free-text fields
+TEST_CASE_VIEWS = {
+    ListView.SUMMARY.value: ["test_case_key", "project_key", "seq", "title", "status", "last_result", "labels"]
+}
+TEST_EXECUTION_VIEWS = {
+    ListView.SUMMARY.value: ["execution_key", "project_key", "seq", "test_case_key", "test_cycle_key", "result",
+                             "finished_at"]
+}
+
+# DB List Filters - the only fields list endpoints filter on, each served within a project by a
+# (project_key, field, seq) index; across projects the (project_key, seq) order is kept
+TEST_CASE_FILTERS = {
+    "status": ("status", "$in"),
+    "label": ("labels", "$in"),
+    "folder": ("folder", "$in"),
+    "priority": ("priority", "$in"),
+    "last_result": ("last_result", "$in")
+}
+TEST_EXECUTION_FILTERS = {
+    "result": ("result", "$in"),
+    "started_after": ("started_at", "$gte"),
+    "started_before": ("started_at", "$lt")
+}
+
+# DB Indexes - every query shape a route issues must be served by one of these.
+# Created idempotently at startup; existing index names are kept stable so
+# re-running create_index on an upgraded database is a no-op.
+PROJECT_INDEXES = [
+    DBIndex(
+        keys=[("project_key", 1)],
+        index_name="idx_prj_project_key"
+    )
+]
+TEST_CASE_INDEXES = [
+    DBIndex(
+        keys=[("project_key", 1), ("test_case_key", 1)],
+        index_name="idx_tc_project_key_test_case_key"
+    ),
+    DBIndex(
+        keys=[("test_case_key", 1)],
+        index_name="idx_tc_test_case_key"
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("seq", 1)],
+        index_name="idx_tc_project_key_seq",
+        unique=False
+    ),
+    # List filters and sorts: the filtered / sorted field, then seq for the page order
+    DBIndex(
+        keys=[("project_key", 1), ("status", 1), ("seq", 1)],
+        index_name="idx_tc_project_key_status_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("labels", 1), ("seq", 1)],
+        index_name="idx_tc_project_key_labels_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("folder", 1), ("seq", 1)],
+        index_name="idx_tc_project_key_folder_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("priority", 1), ("seq", 1)],
+        index_name="idx_tc_project_key_priority_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("last_result", 1), ("seq", 1)],
+        index_name="idx_tc_project_key_last_result_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("updated_at", 1), ("seq", 1)],
+        index_name="idx_tc_project_key_updated_at_seq",
+        unique=False
+    ),
+    # The updated_at sort across projects, tie-broken by the usual (project_key, seq) order
+    DBIndex(
+        keys=[("updated_at", 1), ("project_key", 1), ("seq", 1)],
+        index_name="idx_tc_updated_at_project_key_seq",
+        unique=False
+    )
+]
+TEST_EXECUTION_INDEXES = [
+    DBIndex(
+        keys=[("project_key", 1), ("execution_key", 1)],
+        index_name="idx_te_project_key_test_case_key"
+    ),
+    DBIndex(
+        keys=[("execution_key", 1)],
+        index_name="idx_te_execution_key"
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("seq", 1)],
+        index_name="idx_te_project_key_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("result", 1), ("seq", 1)],
+        index_name="idx_te_project_key_result_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("started_at", 1), ("seq", 1)],
+        index_name="idx_te_project_key_started_at_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("test_case_key", 1), ("seq", 1)],
+        index_name="idx_te_project_key_test_case_key_seq",
+        unique=False
+    ),
+    DBIndex(
+        keys=[("test_cycle_key", 1), ("test_case_key", 1)],
+        index_name="idx_te_test_cycle_key_test_case_key",
+        unique=False
+    )
+]
+TEST_CYCLE_INDEXES = [
+    DBIndex(
+        keys=[("project_key", 1), ("test_cycle_key", 1)],
+        index_name="idx_tcy_project_key_test_case_key"
+    ),
+    DBIndex(
+        keys=[("test_cycle_key", 1)],
+        index_name="idx_tcy_test_cycle_key"
+    ),
+    DBIndex(
+        keys=[("project_key", 1), ("seq", 1)],
+        index_name="idx_tcy_project_key_seq",
+        unique=False
+    )
+]
+
+# DB Query Shapes - representative filters/sorts issued by the routes, with
+# placeholder values. Checked with explain() by GET /db-index-audit; full
+# collection recounts in module/maintenance.py scan by design and are not listed.
+PROJECT_QUERY_SHAPES = [
+    DBQueryShape("by project_key", {"project_key": "PRJ"}),
+    DBQueryShape("list", {}, [("project_key", 1)])
+]
+TEST_CASE_QUERY_SHAPES = [
+    DBQueryShape("by project_key + test_case_key", {"project_key": "PRJ", "test_case_key": "PRJ-T1"}),
+    DBQueryShape("by test_case_key", {"test_case_key": "PRJ-T1"}),
+    DBQueryShape("by test_case_key $in", {"test_case_key": {"$in": ["PRJ-T1", "PRJ-T2"]}}),
+    DBQueryShape("by project_key + test_case_key $in",
+                 {"project_key": "PRJ", "test_case_key": {"$in": ["PRJ-T1", "PRJ-T2"]}}),
+    DBQueryShape("by project_key", {"project_key": "PRJ"}),
+    DBQueryShape("page by project_key", {"project_key": "PRJ"}, [("seq", 1)]),
+    DBQueryShape("page by project_key after cursor",
+                 {"$and": [{"project_key": "PRJ"}, {"seq": {"$gt": 1}}]}, [("seq", 1)]),
+    DBQueryShape("page all", {}, [("project_key", 1), ("seq", 1)]),
+    DBQueryShape("page by project_key + status", {"project_key": "PRJ", "status": {"$in": ["READY"]}}, [("seq", 1)]),
+    DBQueryShape("page by project_key + labels", {"project_key": "PRJ", "labels": {"$in": ["smoke"]}}, [("seq", 1)]),
+    DBQueryShape("page by project_key + folder", {"project_key": "PRJ", "folder": {"$in": ["api"]}}, [("seq", 1)]),
+    DBQueryShape("page by project_key + priority", {"project_key": "PRJ", "priority": {"$in": ["HIGH"]}},
+                 [("seq", 1)]),
+    DBQueryShape("page by project_key + last_result", {"project_key": "PRJ", "last_result": {"$in": ["FAIL"]}},
+                 [("seq", 1)]),
+    DBQueryShape("page by project_key sorted by updated_at", {"project_key": "PRJ"},
+                 [("updated_at", -1), ("seq", -1)]),
+    DBQueryShape("page all + status", {"status": {"$in": ["READY"]}}, [("project_key", 1), ("seq", 1)]),
+    DBQueryShape("page all + labels", {"labels": {"$in": ["smoke"]}}, [("project_key", 1), ("seq", 1)]),
+    DBQueryShape("page all + folder", {"folder": {"$in": ["api"]}}, [("project_key", 1), ("seq", 1)]),
+    DBQueryShape("page all + priority", {"priority": {"$in": ["HIGH"]}}, [("project_key", 1), ("seq", 1)]),
+    DBQueryShape("page all + last_result", {"last_result": {"$in": ["FAIL"]}}, [("project_key", 1), ("seq", 1)]),
+    DBQueryShape("page all sorted by updated_at", {},
+                 [("updated_at", -1), ("project_key", -1), ("seq", -1)]),
+    DBQueryShape("page all + status sorted by updated_at", {"status": {"$in": ["READY"]}},
+                 [("updated_at", -1), ("project_key", -1), ("seq", -1)]),
+    DBQueryShape("page all after cursor",
+                 {"$and": [{}, {"$or": [{"project_key": {"$gt": "PRJ"}},
+                                        {"project_key": "PRJ", "seq": {"$gt": 1}}]}]},
+                 [("project_key", 1), ("seq", 1)])
+]
+TEST_EXECUTION_QUERY_SHAPES = [
+    DBQueryShape("by execution_key", {"execution_key": "PRJ-E1"}),
+    DBQueryShape("by execution_key $in", {"execution_key": {"$in": ["PRJ-E1", "PRJ-E2"]}}),
+    DBQueryShape("by project_key", {"project_key": "PRJ"}),
+    DBQueryShape("page by project_key", {"project_key": "PRJ"}, [("seq", 1)]),
+    DBQueryShape("page by project_key + result", {"project_key": "PRJ", "result": {"$in": ["FAIL"]}}, [("seq", 1)]),
+    DBQueryShape("page by project_key + started_at range",
+                 {"project_key": "PRJ", "started_at": {"$gte": "2026-01-01T00:00:00Z", "$lt": "2026-01-02T00:00:00Z"}},
+                 [("started_at", 1), ("seq", 1)]),
+    DBQueryShape("page by project_key + test_case_key",
+                 {"project_key": "PRJ", "test_case_key": "PRJ-T1"}, [("seq", -1)]),
+    DBQueryShape("linked by project_key + test_case_key",
+                 {"project_key": "PRJ", "test_case_key": "PRJ-T1", "test_cycle_key": {"$ne": None}}),
+    DBQueryShape("by test_cycle_key", {"test_cycle_key": "PRJ-C1"}),
+    DBQueryShape("by test_cycle_key + test_case_key",
+                 {"test_cycle_key": "PRJ-C1", "test_case_key": "PRJ-T1", "execution_key": {"$ne": "PRJ-E1"}}),
+    DBQueryShape("by test_cycle_key + test_case_key $in",
+                 {"test_cycle_key": "PRJ-C1", "test_case_key": {"$in": ["PRJ-T1", "PRJ-T2"]}})
+]
+TEST_CYCLE_QUERY_SHAPES = [
+    DBQueryShape("by test_cycle_key", {"test_cycle_key": "PRJ-C1"}),
+    DBQueryShape("by test_cycle_key with member",
+                 {"test_cycle_key": "PRJ-C1", "executions.PRJ-E1": {"$exists": True}}),
+    DBQueryShape("by project_key", {"project_key": "PRJ"}),
+    DBQueryShape("page by project_key", {"project_key": "PRJ"}, [("seq", -1)])
+]
 
 # DB COLLECTIONS - TM
 DB_COLLECTION_TM_PRJ = DBCollection(
     name="projects",
-    schema=PROJECT_SCHEMA
+    schema=PROJECT_SCHEMA,
+    indexes=PROJECT_INDEXES,
+    query_shapes=PROJECT_QUERY_SHAPES
 )
 DB_COLLECTION_TM_TC = DBCollection(
     name="test-cases",
     schema=TEST_CASE_SCHEMA,
-    index=TEST_CASE_INDEX
+    indexes=TEST_CASE_INDEXES,
+    query_shapes=TEST_CASE_QUERY_SHAPES,
+    views=TEST_CASE_VIEWS,
+    filters=TEST_CASE_FILTERS
 )
 DB_COLLECTION_TM_TE = DBCollection(
     name="test-executions",
     schema=TEST_EXECUTION_SCHEMA,
-    index=TEST_EXECUTION_INDEX
+    indexes=TEST_EXECUTION_INDEXES,
+    query_shapes=TEST_EXECUTION_QUERY_SHAPES,
+    views=TEST_EXECUTION_VIEWS,
+    filters=TEST_EXECUTION_FILTERS
 )
 DB_COLLECTION_TM_TCY = DBCollection(
     name="test-cycles",
     schema=TEST_CYCLE_SCHEMA,
-    index=TEST_CYCLE_INDEX
+    indexes=TEST_CYCLE_INDEXES,
+    query_shapes=TEST_CYCLE_QUERY_SHAPES
 )
 
 # DB COLLECTIONS - RUNNER
-# DB_COLLECTION_RUNNERS_TIMESTAMP_STATS = DBCollection(name="timestamp-stats")
-DB_COLLECTION_RUNNERS_STATS_HISTORIC = DBCollection(name="runner-stats-historic")
-# DB_COLLECTION_RUNNERS_STATS_CURRENT = DBCollection(name="runner-stats-current")
-# DB_COLLECTION_RUNNERS_BUSY_STATS = DBCollection(name="runners-stats-busy")
-# DB_COLLECTION_RUNNERS_BUSY_STATS_BY_JOB = DBCollection(name="runners-stats-busy-by-job")
-# DB_COLLECTION_RUNNERS_ONLINE_STATS = DBCollection(name="runners-stats-online")
-# DB_COLLECTION_USER_LEADERBOARD_STATS = DBCollection(name="user-leaderboard-stats")
+# Fleet busy / online / total runner counts per poll
+DB_COLLECTION_RUNNERS_TIMESTAMP_STATS = DBCollection(
+    name="timestamp-stats",
+    indexes=[
+        DBIndex(keys=[("ts", 1)], index_name="idx_tss_ts",
+                expire_after_seconds=RUNNER_HISTORY_TTL_DAYS * 86400)
+    ],
+    query_shapes=[
+        DBQueryShape("range", {"ts": {"$gte": datetime.datetime(2025, 1, 1),
+                                      "$lt": datetime.datetime(2025, 1, 2)}}, [("ts", 1)])
+    ]
+)
+RUNNER_HISTORY_QUERY_SHAPE = DBQueryShape(
+    "range by name",
+    {"name": "runner-1", "queried_ts": {"$gte": datetime.datetime(2025, 1, 1),
+                                        "$lt": datetime.datetime(2025, 1, 2)}}
+)
+RUNNER_ROLLUP_QUERY_SHAPE = DBQueryShape(
+    "range by name",
+    {"name": "runner-1", "ts": {"$gte": datetime.datetime(2025, 1, 1),
+                                "$lt": datetime.datetime(2025, 4, 1)}}
+)
+
+# One sample per runner per poll or webhook event, bucketed by runner name
+DB_COLLECTION_RUNNERS_STATS_HISTORIC = DBCollection(
+    name="runner-stats-historic",
+    indexes=[
+        # Time-series secondary indexes cannot be unique
+        DBIndex(keys=[("name", 1), ("queried_ts", 1)], index_name="idx_rs_name_queried_ts", unique=False)
+    ],
+    query_shapes=[RUNNER_HISTORY_QUERY_SHAPE],
+    options={
+        "timeseries": {"timeField": "queried_ts", "metaField": "name", "granularity": "minutes"},
+        "expireAfterSeconds": RUNNER_HISTORY_TTL_DAYS * 86400
+    }
+)
+DB_COLLECTION_RUNNERS_STATS_HOURLY = DBCollection(
+    name="runner-stats-hourly",
+    indexes=[
+        DBIndex(keys=[("name", 1), ("ts", 1)], index_name="idx_rsh_name_ts"),
+        DBIndex(keys=[("ts", 1)], index_name="idx_rsh_ts_ttl", unique=False,
+                expire_after_seconds=RUNNER_HISTORY_HOURLY_TTL_DAYS * 86400)
+    ],
+    query_shapes=[RUNNER_ROLLUP_QUERY_SHAPE]
+)
+DB_COLLECTION_RUNNERS_STATS_DAILY = DBCollection(
+    name="runner-stats-daily",
+    indexes=[
+        DBIndex(keys=[("name", 1), ("ts", 1)], index_name="idx_rsd_name_ts")
+    ],
+    query_shapes=[RUNNER_ROLLUP_QUERY_SHAPE]
+)
+# Shared current runner snapshot, {name, repo, runner} per runner, written by the worker and webhooks
+DB_COLLECTION_RUNNERS_STATS_CURRENT = DBCollection(
+    name="runner-stats-current",
+    indexes=[
+        DBIndex(keys=[("name", 1)], index_name="idx_rsc_name"),
+        DBIndex(keys=[("repo", 1)], index_name="idx_rsc_repo", unique=False)
+    ],
+    query_shapes=[
+        DBQueryShape("by name", {"name": "runner-1"}),
+        DBQueryShape("by repo", {"repo": "repo-1"})
+    ]
+)
+# Single {_id: "current"} document: snapshot version, poller status and webhook activity
+DB_COLLECTION_RUNNERS_STATE = DBCollection(name="runner-state")
+# Leader leases, {_id: lease name, owner, expires_at}
+DB_COLLECTION_LEASES = DBCollection(name="leases")
+
+# Daily usage rollups, {key, day} documents maintained with $inc upserts
+RUNNER_USAGE_QUERY_SHAPE = DBQueryShape(
+    "range by day", {"day": {"$gte": datetime.datetime(2025, 1, 1), "$lt": datetime.datetime(2025, 4, 1)}}
+)
+
+
+def _runner_usage_collection(name: str, prefix: str) -> DBCollection:
+    return DBCollection(
+        name=name,
+        indexes=[
+            DBIndex(keys=[("key", 1), ("day", 1)], index_name=f"idx_{prefix}_key_day"),
+            DBIndex(keys=[("day", 1)], index_name=f"idx_{prefix}_day", unique=False)
+        ],
+        query_shapes=[RUNNER_USAGE_QUERY_SHAPE]
+    )
+
+
+# Busy minutes per runner and per designation, told apart by the "by" field
+DB_COLLECTION_RUNNERS_BUSY_STATS = DBCollection(
+    name="runners-stats-busy",
+    indexes=[
+        DBIndex(keys=[("by", 1), ("key", 1), ("day", 1)], index_name="idx_rsb_by_key_day"),
+        DBIndex(keys=[("by", 1), ("day", 1)], index_name="idx_rsb_by_day", unique=False)
+    ],
+    query_shapes=[
+        DBQueryShape("range by day", {"by": "runner",
+                                      "day": {"$gte": datetime.datetime(2025, 1, 1),
+                                              "$lt": datetime.datetime(2025, 4, 1)}})
+    ]
+)
+# Busy minutes per job (workflow) path, per triggering user, and online / offline minutes per runner
+DB_COLLECTION_RUNNERS_BUSY_STATS_BY_JOB = _runner_usage_collection("runners-stats-busy-by-job", "rsbj")
+DB_COLLECTION_USER_LEADERBOARD_STATS = _runner_usage_collection("user-leaderboard-stats", "uls")
+DB_COLLECTION_RUNNERS_ONLINE_STATS = _runner_usage_collection("runners-stats-online", "rso")
 
 # DB
 DB_NAME_TM = DB(
@@ -155,15 +524,20 @@ DB_NAME_TM = DB(
 DB_NAME_RUNNERS = DB(
     name=f"{DB_CORE}-runners",
     collections=[
-        # DB_COLLECTION_RUNNERS_TIMESTAMP_STATS,
+        DB_COLLECTION_RUNNERS_TIMESTAMP_STATS,
         DB_COLLECTION_RUNNERS_STATS_HISTORIC,
-        # DB_COLLECTION_RUNNERS_STATS_CURRENT,
-        # DB_COLLECTION_RUNNERS_BUSY_STATS,
-        # DB_COLLECTION_RUNNERS_BUSY_STATS_BY_JOB,
-        # DB_COLLECTION_RUNNERS_ONLINE_STATS,
-        # DB_COLLECTION_USER_LEADERBOARD_STATS
+        DB_COLLECTION_RUNNERS_STATS_HOURLY,
+        DB_COLLECTION_RUNNERS_STATS_DAILY,
+        DB_COLLECTION_RUNNERS_STATS_CURRENT,
+        DB_COLLECTION_RUNNERS_STATE,
+        DB_COLLECTION_LEASES,
+        DB_COLLECTION_RUNNERS_BUSY_STATS,
+        DB_COLLECTION_RUNNERS_BUSY_STATS_BY_JOB,
+        DB_COLLECTION_RUNNERS_ONLINE_STATS,
+        DB_COLLECTION_USER_LEADERBOARD_STATS
     ]
 )
 
 # DB Mapping
 DB_ALL = [DB_NAME_TM, DB_NAME_RUNNERS]
+DB_COLLECTIONS = {collection.name: collection for db in DB_ALL for collection in db.collections}
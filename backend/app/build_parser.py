@@ -9,7 +9,13 @@
 
 import argparse
 
-from backend.app.app_def import TMP_DIR
+from backend.app.app_def import (
+    API_BACKLOG,
+    API_GRACEFUL_SHUTDOWN,
+    API_KEEP_ALIVE,
+    API_WORKERS,
+    TMP_DIR
+)
 
 
 def build_parser():
@@ -30,6 +36,48 @@ def build_parser():
         default=5000,
         help='Set server listening port (default: 5000)'
     )
+    parser.add_argument(
+        '-w', '--workers',
+        dest='workers',
+        type=int,
+        default=API_WORKERS,
+        help=f'Set number of server worker processes, ignored in debug mode (default: {API_WORKERS})'
+    )
+    parser.add_argument(
+        '--loop',
+        dest='loop',
+        choices=['auto', 'asyncio', 'uvloop'],
+        default='auto',
+        help='Set event loop, auto picks uvloop when installed (default: auto)'
+    )
+    parser.add_argument(
+        '--http',
+        dest='http',
+        choices=['auto', 'h11', 'httptools'],
+        default='auto',
+        help='Set HTTP parser, auto picks httptools when installed (default: auto)'
+    )
+    parser.add_argument(
+        '--backlog',
+        dest='backlog',
+        type=int,
+        default=API_BACKLOG,
+        help=f'Set listen socket backlog (default: {API_BACKLOG})'
+    )
+    parser.add_argument(
+        '--keep-alive',
+        dest='keep_alive',
+        type=int,
+        default=API_KEEP_ALIVE,
+        help=f'Set idle keep-alive connection timeout in seconds (default: {API_KEEP_ALIVE})'
+    )
+    parser.add_argument(
+        '--graceful-timeout',
+        dest='graceful_timeout',
+        type=int,
+        default=API_GRACEFUL_SHUTDOWN,
+        help=f'Set seconds to drain in-flight requests on shutdown (default: {API_GRACEFUL_SHUTDOWN})'
+    )
     parser.add_argument(
         '-o', '--output',
         dest='output',
@@ -43,6 +91,13 @@ def build_parser():
         default=False,
         help='Set skip background task mode'
     )
+    parser.add_argument(
+        '--run-worker',
+        dest='run_worker',
+        action='store_true',
+        default=False,
+        help='Also run the background worker jobs in this process (single process deployments)'
+    )
     parser.add_argument(
         '--debug',
         dest='debug',
@@ -7,51 +7,580 @@
 
 # app/cache.py
 
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pathlib
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import (
+    Awaitable,
+    Callable,
+    NamedTuple
+)
+
 from cachetools import TTLCache
+from fastapi import (
+    Request,
+    status
+)
+from starlette.responses import Response
+
+from backend.app.app_def import (
+    DB_COLLECTION_TM_PRJ,
+    DB_COLLECTION_TM_TC,
+    CACHE_BACKEND,
+    CACHE_MAXSIZE,
+    CACHE_REDIS_URL,
+    CACHE_STALE_TTL,
+    CACHE_TTL
+)
+from backend.app.responses import encode_json
 
 # ---------------------------------------------------------------------------
 # Cache configuration
 # ---------------------------------------------------------------------------
-# maxsize  – maximum number of distinct cache entries before LRU eviction.
-# ttl      – seconds before a cached entry automatically expires.
+# CACHE_BACKEND – "memory" (default) or "redis".
+# CACHE_MAXSIZE – maximum number of distinct cache entries before LRU eviction.
+# CACHE_TTL     – seconds before a cached entry automatically expires.
+# CACHE_STALE_TTL – seconds an expired entry may still be served while one
+#                 background refresh runs (stale-while-revalidate, 0 = off).
+#
+# Cache keys used across the application, and the tags they are filed under:
+#   "projects:all"              → GET /tm/projects                          projects
+#   "projects:<project_key>"    → GET /tm/projects/{project_key}            projects:<project_key>
+#   "test_cases:all"            → GET /tm/test-cases                        test-cases
+#   "test_cases:<project_key>"  → GET /tm/projects/{project_key}/test-cases test-cases:<project_key>
+#   "<key>:<f1>,<f2>,..."       → the same listing with ?view= / ?fields=     (same tags as <key>)
+#
+# Entries are filed under dependency tags (a collection, or a collection
+# scoped to a project) in a reverse index. Writes declare the tags they dirty
+# (project_tags / test_case_tags) and only the entries filed under them are
+# dropped, whatever their keys.
+#
+# Reads go through cache_get_or_compute. On a miss only one coroutine per key
+# and worker computes the value; concurrent misses await the same task
+# (single-flight). Every lookup carries the invalidation epoch it saw: a
+# request joins a computation only if no invalidation happened since it
+# started, and a computed value is filled only if none happened since its
+# lookup, so a value that may predate a write is never served after it.
+# Entries dropped by an invalidation are never served stale, only entries
+# that merely outlived CACHE_TTL.
 #
-# Cache keys used across the application:
-#   "projects:all"              → GET /tm/projects
-#   "projects:<project_key>"    → GET /tm/projects/{project_key}
-#   "test_cases:all"            → GET /tm/test-cases
-#   "test_cases:<project_key>"  → GET /tm/projects/{project_key}/test-cases
+# Values are cached as their encoded JSON response body plus a strong ETag,
+# both computed once at fill time (CachedBody). cached_response sends the
+# bytes as they are, or a bodiless 304 when the client's If-None-Match
+# already holds the ETag, so polling an unchanged listing costs no encoding.
+#
+# memory: every worker process keeps its own TTLCache. Invalidations must
+# reach all of them, so they also bump generation counters: slot 0 for a
+# full clear, one slot per tag hash bucket, and an epoch counting all
+# invalidations. An entry is stamped with its tags' counters when it is
+# filled and is served only while they are unchanged. With several workers
+# the counters live in a file mapped by every worker (see
+# share_cache_generations), so a write handled by one worker is never
+# followed by a stale read on another.
+#
+# redis: one cache shared by every worker (and every host pointing at the
+# same server), so a value computed by one worker is a hit for all of them.
+# Tags are Redis sets of keys. Needs the redis package.
 # ---------------------------------------------------------------------------
 
-_cache: TTLCache = TTLCache(maxsize=256, ttl=60)
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the shared generations file for worker processes
+CACHE_GENERATIONS_ENV = "ORBIT_CACHE_GENERATIONS"
+CACHE_GENERATION_SLOTS = 1024
+
+
+def cache_tag(collection: str, project_key: str | None = None) -> str:
+    """ Tag of a whole collection, or of its documents in one project. """
+
+    return collection if project_key is None else f"{collection}:{project_key}"
+
+
+def project_tags(project_key: str) -> tuple[str, ...]:
+    """ Tags dirtied by a change to a project document (fields or counts). """
+
+    return cache_tag(DB_COLLECTION_TM_PRJ.name), cache_tag(DB_COLLECTION_TM_PRJ.name, project_key)
+
+
+def test_case_tags(project_key: str) -> tuple[str, ...]:
+    """ Tags dirtied by a change to test cases of a project. """
+
+    return cache_tag(DB_COLLECTION_TM_TC.name), cache_tag(DB_COLLECTION_TM_TC.name, project_key)
+
+
+class CacheStats:
+    """ Per-worker cache counters. """
+
+    def __init__(self):
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.fills = 0
+        self.skipped_fills = 0
+        self.invalidated = 0
+
+    def to_dict(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {"hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else None,
+                "coalesced": self.coalesced,
+                "fills": self.fills,
+                "skipped_fills": self.skipped_fills,
+                "invalidated": self.invalidated}
+
+
+class CachedBody(NamedTuple):
+    """ Encoded JSON response body and its strong ETag. """
+
+    body: bytes
+    etag: str
+
+
+def encode_body(value) -> CachedBody:
+    """ Encode value the way JSONResponse does, and tag the bytes. """
+
+    body = encode_json(value)
+
+    return CachedBody(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+
+class CacheLookup(NamedTuple):
+    """ Cached body (None on a miss), whether it outlived its TTL, and the invalidation epoch seen. """
+
+    value: CachedBody | None
+    stale: bool
+    epoch: int
+
+
+class CacheBackend(ABC):
+    """ Abstract base class for cache implementations. """
+
+    def __init__(self):
+        self.stats_counters = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheLookup:
+        """ Look key up. """
+
+    @abstractmethod
+    async def set(self, key: str, value: CachedBody, tags: tuple[str, ...], epoch: int) -> bool:
+        """ Cache an encoded body under key, filed under tags, unless an
+            invalidation happened since the lookup that saw epoch. """
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> None:
+        """ Drop every entry filed under any of tags, in every worker. """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """ Drop every entry, in every worker. """
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """ Hit / miss / fill counters of this worker. """
+
+
+class _Generations:
+    """ Invalidation counters, process-local or shared through a mapped file. """
+
+    def __init__(self, path: str | None = None):
+        size = (CACHE_GENERATION_SLOTS + 2) * 8
+        self._file = None
+
+        if path:
+            self._file = open(path, "r+b")
+            buffer = mmap.mmap(self._file.fileno(), size)
+
+        else:
+            buffer = bytearray(size)
+
+        self._counters = memoryview(buffer).cast("Q")
+
+    @staticmethod
+    def _slot(tag: str) -> int:
+        return 1 + zlib.crc32(tag.encode()) % CACHE_GENERATION_SLOTS
+
+    @property
+    def epoch(self) -> int:
+        """ Number of invalidations so far. """
+
+        return self._counters[CACHE_GENERATION_SLOTS + 1]
+
+    def stamp(self, tags: tuple[str, ...]) -> tuple:
+        """ Current counters covering tags. """
+
+        return self._counters[0], *[self._counters[self._slot(tag)] for tag in tags]
+
+    def bump(self, tags: tuple[str, ...] | None = None) -> None:
+        """ Invalidate tags everywhere, or everything when tags is None. """
+
+        slots = {0} if tags is None else {self._slot(tag) for tag in tags}
+
+        if self._file is not None:
+            # Increments from concurrent workers must not be lost
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+
+        try:
+            for slot in slots:
+                self._counters[slot] += 1
+
+            self._counters[CACHE_GENERATION_SLOTS + 1] += 1
+
+        finally:
+            if self._file is not None:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+
+
+def share_cache_generations(path: pathlib.Path) -> None:
+    """ Create the generations file shared by the worker processes started after this call. """
+
+    path.write_bytes(bytes((CACHE_GENERATION_SLOTS + 2) * 8))
+    os.environ[CACHE_GENERATIONS_ENV] = str(path)
+
+
+class _IndexedTTLCache(TTLCache):
+    """ TTLCache calling on_remove for entries it expires or evicts on its own. """
+
+    def __init__(self, maxsize: int, ttl: float, on_remove):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._on_remove = on_remove
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, value in expired:
+            self._on_remove(key, value)
+
+        return expired
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._on_remove(key, value)
+
+        return key, value
+
+
+class MemoryCacheBackend(CacheBackend):
+    """ Per-process TTLCache kept coherent across workers by generation counters. """
+
+    def __init__(self,
+                 maxsize: int = CACHE_MAXSIZE,
+                 ttl: float = CACHE_TTL,
+                 stale_ttl: float = CACHE_STALE_TTL,
+                 generations_path: str | None = None):
+        # key -> (tags, stamp, fresh_until, value); tag -> keys filed under it
+        self._cache = _IndexedTTLCache(maxsize, ttl + stale_ttl, self._unindex)
+        self._index = {}
+        self._ttl = ttl
+        super().__init__()
+        self._generations = _Generations(generations_path)
 
+    def _unindex(self, key: str, entry: tuple) -> None:
+        for tag in entry[0]:
+            keys = self._index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[tag]
 
-def cache_get(key: str):
-    """Return cached value for key, or None if missing / expired."""
+    def _drop(self, key: str) -> bool:
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
 
-    return _cache.get(key)
+        self._unindex(key, entry)
+        return True
 
+    async def get(self, key: str) -> CacheLookup:
+        epoch = self._generations.epoch
+        entry = self._cache.get(key)
 
-def cache_set(key: str, value) -> None:
-    """Store value in cache under key."""
+        if entry is None or entry[1] != self._generations.stamp(entry[0]):
+            self.stats_counters.misses += 1
+            return CacheLookup(None, False, epoch)
 
-    _cache[key] = value
+        if time.monotonic() >= entry[2]:
+            self.stats_counters.stale_hits += 1
+            return CacheLookup(entry[3], True, epoch)
 
+        self.stats_counters.hits += 1
+        return CacheLookup(entry[3], False, epoch)
 
-def cache_invalidate(*keys: str) -> None:
-    """Remove one or more specific keys from the cache."""
+    async def set(self, key: str, value: CachedBody, tags: tuple[str, ...], epoch: int) -> bool:
+        if epoch != self._generations.epoch:
+            self.stats_counters.skipped_fills += 1
+            return False
 
-    for key in keys:
-        _cache.pop(key, None)
+        self._drop(key)
+        self._cache[key] = (tags, self._generations.stamp(tags), time.monotonic() + self._ttl, value)
+        for tag in tags:
+            self._index.setdefault(tag, set()).add(key)
 
+        self.stats_counters.fills += 1
+        return True
 
-def cache_invalidate_prefix(prefix: str | None = None) -> None:
-    """Remove all cache entries whose key starts with prefix."""
+    async def invalidate_tags(self, *tags: str) -> None:
+        self._generations.bump(tags)
 
-    for key in list(_cache.keys()):
-        if prefix and key.startswith(prefix):
-            # If prefix provided and key matches, invalidate it
-            _cache.pop(key, None)
+        for tag in tags:
+            for key in list(self._index.get(tag, ())):
+                self.stats_counters.invalidated += self._drop(key)
+
+    async def clear(self) -> None:
+        self._generations.bump()
+        self.stats_counters.invalidated += len(self._cache)
+        self._cache.clear()
+        self._index.clear()
+
+    def stats(self) -> dict:
+        return {"backend": "memory", "size": len(self._cache), "tags": len(self._index),
+                **self.stats_counters.to_dict()}
+
+
+class RedisCacheBackend(CacheBackend):
+    """ Cache shared by every worker in a Redis (or Redis-compatible) server. """
+
+    # Fill only if no invalidation happened since the lookup: KEYS[1] epoch, KEYS[2] entry,
+    # KEYS[3:] tag sets; ARGV[1] epoch at the lookup, ARGV[2] entry, ARGV[3] expiry
+    _FILL_SCRIPT = """
+        if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+            return 0
+        end
+        redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+        for i = 3, #KEYS do
+            redis.call('SADD', KEYS[i], KEYS[2])
+            redis.call('EXPIRE', KEYS[i], ARGV[3])
+        end
+        return 1
+    """
+
+    # Invalidate atomically, so no fill can land between reading a tag set and bumping the epoch:
+    # KEYS[1] epoch, KEYS[2:] tag sets. Bumps the epoch first, as the memory backend bumps its
+    # generations before dropping entries; returns the number of entries dropped
+    _INVALIDATE_SCRIPT = """
+        redis.call('INCR', KEYS[1])
+        local dropped = 0
+        for i = 2, #KEYS do
+            local keys = redis.call('SMEMBERS', KEYS[i])
+            for j = 1, #keys, 1000 do
+                dropped = dropped + redis.call('DEL', unpack(keys, j, math.min(j + 999, #keys)))
+            end
+            redis.call('DEL', KEYS[i])
+        end
+        return dropped
+    """
+
+    def __init__(self,
+                 url: str = CACHE_REDIS_URL,
+                 ttl: float = CACHE_TTL,
+                 stale_ttl: float = CACHE_STALE_TTL,
+                 namespace: str = "orbit:cache:"):
+        try:
+            import redis.asyncio as redis
+
+        except ImportError as err:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package") from err
+
+        # Connections are opened lazily, in the event loop of the worker using them
+        self._redis = redis.from_url(url)
+        self._fill = self._redis.register_script(self._FILL_SCRIPT)
+        self._invalidate = self._redis.register_script(self._INVALIDATE_SCRIPT)
+        self._ttl = ttl
+        self._expiry = int(ttl + stale_ttl)
+        self._namespace = namespace
+        self._epoch_key = f"{namespace}epoch"
+        super().__init__()
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._namespace}tag:{tag}"
+
+    async def get(self, key: str) -> CacheLookup:
+        entry, epoch = await self._redis.mget(f"{self._namespace}key:{key}", self._epoch_key)
+        epoch = int(epoch or 0)
+
+        if entry is None:
+            self.stats_counters.misses += 1
+            return CacheLookup(None, False, epoch)
+
+        # b'[fresh_until,"etag"]\n' + body, so the body is never re-encoded
+        header, body = entry.split(b"\n", 1)
+        fresh_until, etag = json.loads(header)
+        value = CachedBody(body, etag)
+
+        if time.time() >= fresh_until:
+            self.stats_counters.stale_hits += 1
+            return CacheLookup(value, True, epoch)
+
+        self.stats_counters.hits += 1
+        return CacheLookup(value, False, epoch)
+
+    async def set(self, key: str, value: CachedBody, tags: tuple[str, ...], epoch: int) -> bool:
+        filled = await self._fill(
+            keys=[self._epoch_key, f"{self._namespace}key:{key}", *[self._tag_key(tag) for tag in tags]],
+            args=[epoch, json.dumps([time.time() + self._ttl, value.etag]).encode() + b"\n" + value.body,
+                  self._expiry])
+
+        if filled:
+            self.stats_counters.fills += 1
 
         else:
-            # If no prefix provided, invalidate all entries
-            _cache.pop(key, None)
\ No newline at end of file
+            self.stats_counters.skipped_fills += 1
+
+        return bool(filled)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        if not tags:
+            return
+
+        dropped = await self._invalidate(keys=[self._epoch_key, *[self._tag_key(tag) for tag in tags]])
+
+        self.stats_counters.invalidated += dropped
+
+    async def clear(self) -> None:
+        await self._redis.incr(self._epoch_key)
+
+        keys = [key async for key in self._redis.scan_iter(match=f"{self._namespace}key:*")]
+        keys += [key async for key in self._redis.scan_iter(match=f"{self._namespace}tag:*")]
+        if keys:
+            await self._redis.delete(*keys)
+
+    def stats(self) -> dict:
+        return {"backend": "redis", **self.stats_counters.to_dict()}
+
+
+def create_cache_backend(name: str = CACHE_BACKEND) -> CacheBackend:
+    """ Cache backend selected by CACHE_BACKEND. """
+
+    if name == "redis":
+        return RedisCacheBackend()
+
+    if name == "memory":
+        return MemoryCacheBackend(generations_path=os.getenv(CACHE_GENERATIONS_ENV))
+
+    raise ValueError(f"Unknown cache backend {name}")
+
+
+class _Flight(NamedTuple):
+    """ A computation of one key, shared by the requests that missed it. """
+
+    task: asyncio.Task
+    epoch: int
+
+
+_backend: CacheBackend = create_cache_backend()
+_flights: dict[str, _Flight] = {}
+
+
+def _start_flight(key: str,
+                  compute: Callable[[], Awaitable],
+                  tags: tuple[str, ...],
+                  epoch: int) -> _Flight:
+    """ Compute key once in the background and fill it, registered for others to join. """
+
+    async def run():
+        value = await compute()
+        if value is None:
+            return None
+
+        cached = encode_body(value)
+        await _backend.set(key, cached, tags, epoch)
+
+        return cached
+
+    def done(task: asyncio.Task):
+        if _flights.get(key) is flight:
+            del _flights[key]
+
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Computing cache key {key} failed: {task.exception()}")
+
+    flight = _Flight(asyncio.create_task(run()), epoch)
+    flight.task.add_done_callback(done)
+    _flights[key] = flight
+
+    return flight
+
+
+async def cache_get_or_compute(key: str,
+                               compute: Callable[[], Awaitable],
+                               tags: tuple[str, ...]) -> CachedBody | None:
+    """Return the body cached under key, or compute it (once per worker however many
+    requests miss at the same time) and cache it encoded, filed under tags.
+
+    compute returns the JSON-serializable value, or None for something not to cache
+    (e.g. not found), which is returned as is.
+    """
+
+    lookup = await _backend.get(key)
+    if lookup.value is not None and not lookup.stale:
+        return lookup.value
+
+    flight = _flights.get(key)
+    if flight is not None and flight.epoch == lookup.epoch:
+        _backend.stats_counters.coalesced += 1
+
+    else:
+        # Nothing in flight, or it started before an invalidation this request must see
+        flight = _start_flight(key, compute, tags, lookup.epoch)
+
+    if lookup.value is not None:
+        # Stale-while-revalidate: serve the expired value while the refresh runs
+        return lookup.value
+
+    # Shielded so a disconnecting client does not cancel the computation others wait on
+    return await asyncio.shield(flight.task)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """ Whether an If-None-Match header holds etag (weak comparison, as for GET). """
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def cached_response(request: Request, cached: CachedBody) -> Response:
+    """ 200 with the cached body, or 304 if the client already has it. """
+
+    # no-cache: clients may store the body but must revalidate it on every use
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=cached.body,
+                    status_code=status.HTTP_200_OK,
+                    media_type="application/json",
+                    headers=headers)
+
+
+async def cache_invalidate_tags(*tags: str) -> None:
+    """Remove every cache entry filed under any of tags."""
+
+    await _backend.invalidate_tags(*tags)
+
+
+async def cache_clear() -> None:
+    """Remove every cache entry."""
+
+    await _backend.clear()
+
+
+def cache_stats() -> dict:
+    """Cache counters of this worker."""
+
+    return _backend.stats()
@@ -0,0 +1,103 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# app/filters.py
+#
+# Server-side filtering and sorting for list endpoints.
+#
+# Filters and sort are typed query parameter models (e.g. TestCaseListFilter:
+# ?status=READY&status=DRAFT&label=smoke&sort=-updated_at). Only the
+# parameters declared in the collection's DBCollection.filters allow-list
+# are pushed down, each as (field, operator):
+#   $in        any of the repeated values
+#   $gte / $lt a datetime bound, compared with the stored ISO strings
+# Within a project, every filtered field has a (project_key, field, seq)
+# index, so a selective filter reads only the matching index entries.
+#
+# list_sort turns the sort parameter into a keyset-compatible sort spec: the
+# requested field, then the listing's usual order as tie-breaker in the same
+# direction, so cursors stay unique and the same index serves both
+# directions.
+#
+# FastAPI only expands a query parameter model declared on its own, so list
+# routes, which also take limit / after / fields, declare the model through
+# query_params, a dependency taking each of its fields as a query parameter.
+#
+# Usage in route handlers:
+#     filters: TestCaseListFilter = Depends(query_params(TestCaseListFilter))
+#     query = {"project_key": project_key, **list_filter_query(DB_COLLECTION_TM_TC, filters)}
+#     sort = list_sort(filters.sort, ("seq",))
+#     docs, next_cursor = await find_page(db, DB_NAME_TM, DB_COLLECTION_TM_TC, query, sort, limit, after)
+
+import datetime
+import inspect
+from typing import Callable
+
+from fastapi import Query
+from pydantic import BaseModel
+
+from backend.app.app_def import DB_COLLECTIONS
+
+
+def filter_value(value):
+    """ Stored representation of a filter value; datetimes as UTC ISO strings to the second. """
+
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+
+        return value.astimezone(datetime.timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+    return value
+
+
+def query_params(model: type[BaseModel]) -> Callable[..., BaseModel]:
+    """ Dependency reading model's fields from the query string (repeated for list fields). """
+
+    def dependency(**values) -> BaseModel:
+        return model(**values)
+
+    dependency.__signature__ = inspect.Signature(
+        [inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY,
+                           default=Query(field.default), annotation=field.annotation)
+         for name, field in model.model_fields.items()],
+        return_annotation=model
+    )
+
+    return dependency
+
+
+def list_filter_query(table: str, filters: BaseModel) -> dict:
+    """ MongoDB predicates for the allow-listed filters set on a list request on table. """
+
+    query = {}
+    for parameter, (field, operator) in DB_COLLECTIONS[table].filters.items():
+        value = getattr(filters, parameter)
+        if value is None or value == []:
+            continue
+
+        query.setdefault(field, {})[operator] = filter_value(value)
+
+    return query
+
+
+def is_filtered(filters: BaseModel) -> bool:
+    """ Whether a list request sets any filter or a non-default sort. """
+
+    return filters.model_dump(exclude_defaults=True) != {}
+
+
+def list_sort(sort: str, order: tuple[str, ...]) -> list[tuple[str, int]]:
+    """ Sort spec for a sort parameter (field, or -field for descending) over a listing ordered by order. """
+
+    field, direction = (sort[1:], -1) if sort.startswith("-") else (sort, 1)
+
+    spec = [(name, direction) for name in order]
+    if field in order:
+        return spec
+
+    return [(field, direction)] + spec
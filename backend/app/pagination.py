@@ -0,0 +1,147 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# app/pagination.py
+#
+# Keyset (cursor) pagination for list endpoints.
+#
+# Pages are ordered by an indexed sort spec, typically the integer seq
+# field minted alongside every key (so PRJ1-T2 sorts before PRJ1-T10), e.g.
+# [("seq", 1)] within a project or [("project_key", 1), ("seq", 1)] across
+# projects. The next page starts strictly after the sort values of the last
+# record of the current one, which seeks into the (project_key, seq) index
+# instead of skipping over earlier pages.
+#
+# The cursor handed to clients is opaque: URL-safe base64 of a small JSON
+# document holding those sort values. It is returned in the X-Next-Cursor
+# header and as a Link: <...>; rel="next" header, and is absent on the last
+# page.
+#
+# Usage in route handlers:
+#     docs, next_cursor = await find_page(db, DB_NAME_TM, DB_COLLECTION_TM_TC,
+#                                         {"project_key": project_key},
+#                                         [("seq", 1)], limit, after)
+#     return page_response(request, docs, next_cursor)
+
+import base64
+import binascii
+import json
+
+from fastapi import (
+    Request,
+    status
+)
+
+from backend.app.responses import JSONResponse
+from backend.db.db import DatabaseClient
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: list) -> str:
+    """ Encode the sort values of the last record of a page as an opaque cursor. """
+
+    payload = json.dumps({"k": values}, separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """ Decode a cursor back to its sort values, raising ValueError if malformed. """
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)["k"]
+
+    except (binascii.Error, ValueError, KeyError, TypeError) as err:
+        raise ValueError(f"Invalid cursor {cursor}") from err
+
+    if (not isinstance(values, list) or len(values) != size
+            or not all(isinstance(v, (str, int)) and not isinstance(v, bool) for v in values)):
+        raise ValueError(f"Invalid cursor {cursor}")
+
+    return values
+
+
+def keyset_query(sort: list[tuple[str, int]], values: list) -> dict:
+    """ Build the filter matching records strictly after values in sort order. """
+
+    # (a > x) or (a == x and b > y) or ...
+    clauses = []
+    for index, (field, direction) in enumerate(sort):
+        clause = {prior: value for (prior, _), value in zip(sort[:index], values)}
+        clause[field] = {"$gt" if direction == 1 else "$lt": values[index]}
+        clauses.append(clause)
+
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def page_query(query: dict,
+               sort: list[tuple[str, int]],
+               after: str | None = None) -> dict:
+    """ Restrict query to records after the cursor, raising ValueError if it is malformed. """
+
+    if after is None:
+        return query
+
+    return {"$and": [query, keyset_query(sort, decode_cursor(after, len(sort)))]}
+
+
+async def find_page(db: DatabaseClient,
+                    db_name: str,
+                    table: str,
+                    query: dict,
+                    sort: list[tuple[str, int]],
+                    limit: int | None = None,
+                    after: str | None = None,
+                    projection: dict | None = None) -> tuple[list, str | None]:
+    """ Return one page of records in sort order, plus the next cursor.
+
+    Without a limit every record after the cursor is returned in one page.
+    A projection must keep the sort fields. Raises ValueError if after is
+    not a valid cursor.
+    """
+
+    query = page_query(query, sort, after)
+
+    # Fetch one extra record to learn whether another page follows
+    docs = await db.find(db_name, table, query,
+                         projection=projection,
+                         sort=sort,
+                         limit=limit + 1 if limit else 0)
+
+    next_cursor = None
+    if limit and len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor([docs[-1][field] for field, _ in sort])
+
+    return docs, next_cursor
+
+
+def page_response(request: Request,
+                  docs: list,
+                  next_cursor: str | None) -> JSONResponse:
+    """ Build a 200 response for a page, advertising the next cursor in headers. """
+
+    headers = {}
+    if next_cursor is not None:
+        next_url = request.url.include_query_params(after=next_cursor)
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content=docs,
+                        headers=headers)
+
+
+def invalid_cursor_response(after: str) -> JSONResponse:
+    """ Build the 400 response for a malformed cursor. """
+
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"error": f"Invalid cursor {after}"}
+    )
@@ -0,0 +1,85 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# app/projections.py
+#
+# Sparse fieldsets for list endpoints.
+#
+# List tables rarely need whole documents; long free-text fields such as a
+# test case's description, test_script and failing_steps dominate payloads.
+# A list request may ask for
+#   ?view=summary       a named set of fields (DBCollection.views), or
+#   ?fields=a,b,c       any fields of the collection's schema,
+# which become a MongoDB projection, so the omitted fields never leave the
+# database. The collection's key, project_key and seq (cursor and identity
+# fields) are always returned, as is _id.
+#
+# Each projection caches separately: projection_cache_suffix names it in the
+# cache key, under the same tags as the full listing, so writes invalidate
+# every variant at once.
+#
+# Usage in route handlers:
+#     try:
+#         projection = list_projection(DB_COLLECTION_TM_TC, fields, view, ("test_case_key",))
+#     except ValueError as err:
+#         return invalid_projection_response(err)
+#     docs, next_cursor = await find_page(..., projection=projection)
+
+from fastapi import status
+
+from backend.app.app_def import (
+    DB_COLLECTIONS,
+    ListView
+)
+from backend.app.responses import JSONResponse
+
+# Fields every projected list record keeps, besides the collection's own key
+LIST_REQUIRED_FIELDS = ("project_key", "seq")
+
+
+def list_projection(table: str,
+                    fields: str | None,
+                    view: ListView,
+                    key_fields: tuple[str, ...]) -> dict | None:
+    """ MongoDB projection for a list request on table, None for full documents.
+
+    Raises ValueError for unknown fields, or for fields combined with a view.
+    """
+
+    collection = DB_COLLECTIONS[table]
+
+    if fields is None:
+        if view == ListView.FULL:
+            return None
+
+        names = collection.views[view.value]
+
+    else:
+        if view != ListView.FULL:
+            raise ValueError("Use either fields or view, not both")
+
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(collection.schema.get("properties", {})))
+        if not names or unknown:
+            raise ValueError(f"Unknown fields {', '.join(unknown)}" if unknown else "No fields requested")
+
+    return {name: 1 for name in sorted({*key_fields, *LIST_REQUIRED_FIELDS, *names})}
+
+
+def projection_cache_suffix(projection: dict | None) -> str:
+    """ Cache key suffix naming a projection; empty for full documents. """
+
+    return "" if projection is None else ":" + ",".join(projection)
+
+
+def invalid_projection_response(err: ValueError) -> JSONResponse:
+    """ Build the 400 response for an invalid fields / view request. """
+
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"error": str(err)}
+    )
@@ -0,0 +1,46 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# app/responses.py
+#
+# Project-wide JSON encoding.
+#
+# JSONResponse is a drop-in for starlette's that renders with orjson instead
+# of the stdlib json encoder. It is the app's default_response_class and is
+# imported by every router, so handlers building responses explicitly and
+# handlers returning plain values encode the same way. encode_json is the
+# same encoder for bodies built outside a response (cache fills, SSE).
+#
+# Documents reach the routes with string _ids (MongoClient._convert_object_id);
+# any ObjectId left elsewhere is encoded as its hex string as well. Output is
+# compact UTF-8, as JSONResponse's, with non-string dict keys stringified.
+
+import orjson
+from bson import ObjectId
+from starlette.responses import JSONResponse as StarletteJSONResponse
+
+
+def _default(obj):
+    """ Encode types orjson does not know natively. """
+
+    if isinstance(obj, ObjectId):
+        return str(obj)
+
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def encode_json(content) -> bytes:
+    """ Encode content as compact UTF-8 JSON. """
+
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class JSONResponse(StarletteJSONResponse):
+    """ JSONResponse rendered with orjson. """
+
+    def render(self, content) -> bytes:
+        return encode_json(content)
@@ -0,0 +1,77 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# app/streaming.py
+#
+# Streaming NDJSON responses for large list endpoints.
+#
+# A list endpoint normally loads its whole result set, converts it and
+# encodes it as one JSON array, so the records are held several times over.
+# Clients asking for application/x-ndjson (Accept header, or ?stream=true)
+# instead get one JSON document per line, encoded as the database cursor
+# yields them (DatabaseClient.find_stream) and written out in chunks of about
+# STREAM_CHUNK_SIZE bytes. Memory stays at one cursor batch plus one chunk,
+# whatever the result size.
+#
+# Usage in route handlers:
+#     if wants_ndjson(request, stream):
+#         return ndjson_response(db.find_stream(DB_NAME_TM, DB_COLLECTION_TM_TE,
+#                                               {"project_key": project_key},
+#                                               sort=[("seq", 1)]))
+
+import logging
+from typing import AsyncIterator
+
+from fastapi import (
+    Request,
+    status
+)
+from starlette.responses import StreamingResponse
+
+from backend.app.responses import encode_json
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def wants_ndjson(request: Request, stream: bool = False) -> bool:
+    """ Whether the client asked for a streamed NDJSON response. """
+
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def encode_ndjson(docs: AsyncIterator[dict],
+                        chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """ Encode documents as NDJSON lines, yielded in chunks of about chunk_size bytes. """
+
+    chunk = bytearray()
+    try:
+        async for doc in docs:
+            chunk += encode_json(doc)
+            chunk += b"\n"
+
+            if len(chunk) >= chunk_size:
+                yield bytes(chunk)
+                chunk.clear()
+
+        if chunk:
+            yield bytes(chunk)
+
+    except Exception as e:
+        # Headers are already sent; the client sees a truncated stream
+        logger.warning(f"NDJSON stream aborted: {e}")
+        raise
+
+
+def ndjson_response(docs: AsyncIterator[dict]) -> StreamingResponse:
+    """ Build a 200 response streaming documents as NDJSON. """
+
+    return StreamingResponse(encode_ndjson(docs),
+                             status_code=status.HTTP_200_OK,
+                             media_type=NDJSON_MEDIA_TYPE)
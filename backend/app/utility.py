@@ -6,13 +6,17 @@
 # ================================================================
 
 import pathlib
+import re
 # app/utility.py
 from collections import Counter
 from datetime import datetime, timezone
 
 import yaml
 
-from backend.app.app_def import TMP_DIR
+from backend.app.app_def import (
+    TMP_DIR,
+    CYCLE_RESULT_TYPES
+)
 
 
 def configure_logging(file_path: pathlib.Path,
@@ -45,25 +49,193 @@ def get_current_utc_time():
     return current_utc_iso
 
 
+def key_sequence(key: str) -> int:
+    """ Return the numeric sequence suffix of a key, e.g. PRJ1-T10 -> 10. """
+
+    return int(re.search(r"(\d+)$", key).group(1))
+
+
+def key_sequence_expression(key_field: str) -> dict:
+    """ Aggregation expression equivalent of key_sequence for a stored key field. """
+
+    return {"$let": {
+        "vars": {"match": {"$regexFind": {"input": f"${key_field}", "regex": r"(\d+)$"}}},
+        "in": {"$toInt": {"$arrayElemAt": ["$$match.captures", 0]}}
+    }}
+
+
+def cycle_status_from_counts(result_counts: dict, execution_count: int) -> str:
+    """Derive cycle status from its result counters in O(1)."""
+
+    not_executed = result_counts.get("NOT_EXECUTED", 0)
+
+    # Empty cycle or nothing executed yet
+    if not_executed == execution_count:
+        return "NOT_STARTED"
+
+    if not_executed > 0:
+        return "IN_PROGRESS"
+
+    return "COMPLETE"
+
+
 def calculate_cycle_status(cycle_data: dict):
-    """Calculate cycle status from cycle data."""
+    """Calculate cycle result counters and status from cycle data.
+
+    Full recount over the executions map, only used where the whole map is
+    supplied at once (cycle create / update). Incremental membership writes
+    go through cycle_membership_pipeline instead.
+    """
 
     # Count cycle status
     counts = Counter(cycle_data["executions"].values())
 
-    # assign status of cycle base on execution status
-    if counts.get("NOT_EXECUTED", 0) > 0:
-        if counts.get("NOT_EXECUTED", 0) == len(cycle_data["executions"]):
-            cycle_data["status"] = "NOT_STARTED"
+    cycle_data["result_counts"] = {r: counts.get(r, 0) for r in CYCLE_RESULT_TYPES}
+    cycle_data["execution_count"] = len(cycle_data["executions"])
+    cycle_data["status"] = cycle_status_from_counts(cycle_data["result_counts"],
+                                                    cycle_data["execution_count"])
 
-        else:
-            cycle_data["status"] = "IN_PROGRESS"
-
-    else:
-        if len(cycle_data["executions"]) == 0:
-            cycle_data["status"] = "NOT_STARTED"
+    return cycle_data
 
-        else:
-            cycle_data["status"] = "COMPLETE"
 
-    return cycle_data
+def cycle_status_expression(not_executed=None, total=None) -> dict:
+    """Aggregation expression deriving cycle status from its counters.
+
+    Server-side mirror of cycle_status_from_counts. Reads the stored
+    `result_counts.NOT_EXECUTED` / `execution_count` unless other
+    expressions are given, so it is O(1) regardless of cycle size.
+    """
+
+    if not_executed is None:
+        not_executed = {"$ifNull": ["$result_counts.NOT_EXECUTED", 0]}
+
+    if total is None:
+        total = {"$ifNull": ["$execution_count", 0]}
+
+    return {
+        "$switch": {
+            "branches": [
+                # Empty cycle or nothing executed yet
+                {"case": {"$eq": [not_executed, total]}, "then": "NOT_STARTED"},
+                {"case": {"$gt": [not_executed, 0]}, "then": "IN_PROGRESS"}
+            ],
+            "default": "COMPLETE"
+        }
+    }
+
+
+def cycle_recount_expressions() -> dict:
+    """Aggregation expressions recounting cycle counters from `executions`.
+
+    Keyed by the counter field path. O(cycle size); used only by the
+    repair job to rebuild and verify the incrementally maintained counters.
+    """
+
+    results = {"$map": {"input": {"$objectToArray": {"$ifNull": ["$executions", {}]}},
+                        "in": "$$this.v"}}
+
+    expressions = {
+        f"result_counts.{r}": {"$size": {"$filter": {"input": results,
+                                                     "cond": {"$eq": ["$$this", r]}}}}
+        for r in CYCLE_RESULT_TYPES
+    }
+    expressions["execution_count"] = {"$size": results}
+
+    return expressions
+
+
+def cycle_membership_pipeline(updated_at: str,
+                              set_executions: dict | None = None,
+                              unset_executions: list | None = None,
+                              test_cases: dict | None = None) -> list:
+    """Build an update pipeline changing cycle membership in place.
+
+    Sets/unsets individual `executions.<execution_key>` entries instead of
+    rewriting the whole dict, so concurrent writers to the same cycle never
+    conflict. Result counters are adjusted $inc-style (+1 per new result,
+    -1 per result replaced or removed) from the values stored at write time,
+    and status is derived from the counters, all in one atomic write.
+
+    test_cases maps set executions to their test case. `test_case_executions`
+    records the member of each test case, and the member of a set execution's
+    test case is displaced in the same write, so a cycle never holds two
+    executions of one test case however concurrent adds interleave.
+    """
+
+    set_executions = set_executions or {}
+    unset_executions = [k for k in unset_executions or [] if k not in set_executions]
+    touched = list(set_executions) + unset_executions
+    members = [(key, test_cases[key]) for key in set_executions if key in (test_cases or {})]
+
+    # Stored results of the touched entries (null where missing)
+    values = [f"$executions.{k}" for k in touched]
+
+    pipeline = []
+    if members:
+        # Current members of the set executions' test cases, other than the touched entries
+        pipeline.append({"$set": {"_membership.displaced": {"$filter": {
+            "input": [f"$test_case_executions.{test_case_key}" for _, test_case_key in members],
+            "cond": {"$and": [{"$ne": [{"$ifNull": ["$$this", None]}, None]},
+                              {"$not": [{"$in": ["$$this", {"$literal": touched}]}]}]}
+        }}}})
+        values = {"$concatArrays": [values, {"$map": {
+            "input": {"$filter": {"input": {"$objectToArray": {"$ifNull": ["$executions", {}]}},
+                                  "cond": {"$in": ["$$this.k", "$_membership.displaced"]}}},
+            "in": "$$this.v"
+        }}]}
+
+    pipeline.append({"$set": {"_membership.values": {"$filter": {"input": values,
+                                                                 "cond": {"$ne": ["$$this", None]}}}}})
+
+    def stored_with_result(result):
+        return {"$size": {"$filter": {"input": "$_membership.values",
+                                      "cond": {"$eq": ["$$this", result]}}}}
+
+    added = Counter(set_executions.values())
+
+    counters = {
+        f"result_counts.{r}": {"$subtract": [
+            {"$add": [{"$ifNull": [f"$result_counts.{r}", 0]}, added.get(r, 0)]},
+            stored_with_result(r)
+        ]}
+        for r in CYCLE_RESULT_TYPES
+    }
+    counters["execution_count"] = {"$subtract": [
+        {"$add": [{"$ifNull": ["$execution_count", 0]}, len(set_executions)]},
+        {"$size": "$_membership.values"}
+    ]}
+    pipeline.append({"$set": counters})
+
+    # Displaced members (keyed by value) and unset executions leave both maps
+    removed = {"$literal": unset_executions}
+    if members:
+        removed = {"$concatArrays": [removed, "$_membership.displaced"]}
+
+    def without_removed(field: str, part: str) -> dict:
+        return {"$arrayToObject": {"$filter": {
+            "input": {"$objectToArray": {"$ifNull": [f"${field}", {}]}},
+            "cond": {"$not": [{"$in": [f"$$this.{part}", removed]}]}
+        }}}
+
+    if members or unset_executions:
+        # Unset entries alone are dropped by path below, displaced ones (known only here) by key
+        cleanup = {"test_case_executions": without_removed("test_case_executions", "v")}
+        if members:
+            cleanup["executions"] = without_removed("executions", "k")
+
+        pipeline.append({"$set": cleanup})
+
+    if set_executions:
+        pipeline.append({"$set": {f"executions.{key}": {"$literal": result}
+                                  for key, result in set_executions.items()}})
+
+    if members:
+        pipeline.append({"$set": {f"test_case_executions.{test_case_key}": {"$literal": key}
+                                  for key, test_case_key in members}})
+
+    unset_paths = [] if members else [f"executions.{key}" for key in unset_executions]
+    pipeline.append({"$unset": ["_membership"] + unset_paths})
+    pipeline.append({"$set": {"status": cycle_status_expression(),
+                              "updated_at": updated_at}})
+
+    return pipeline
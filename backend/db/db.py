@@ -102,6 +102,14 @@ class DatabaseClient(ABC):
     def create(self, db_name: str, table: str, data: dict):
         """Insert a new record into the database."""
 
+    @abstractmethod
+    def create_many(self, db_name: str, table: str, data: list):
+        """Insert multiple new records into the database."""
+
+    @abstractmethod
+    def create_many_unique(self, db_name: str, table: str, data: list):
+        """Insert multiple new records, skipping those whose key already exists."""
+
     @abstractmethod
     def count(self, db_name: str, table: str, query: dict):
         """count record from the database."""
@@ -110,14 +118,39 @@ class DatabaseClient(ABC):
     def find(self, db_name: str, table: str, query: dict):
         """Retrieve records from the database."""
 
+    @abstractmethod
+    def find_stream(self, db_name: str, table: str, query: dict):
+        """ Stream matching records one at a time,
+            without loading the result set into memory. """
+
     @abstractmethod
     def find_one(self, db_name: str, table: str, query: dict):
         """Retrieve records from the database."""
 
+    @abstractmethod
+    def aggregate(self, db_name: str, table: str, pipeline: list):
+        """Run an aggregation pipeline and return the resulting records."""
+
+    @abstractmethod
+    def explain(self, db_name: str, table: str, query: dict):
+        """Return the query plan the database would use for a query."""
+
     @abstractmethod
     def update(self, db_name: str, table: str, query: dict, data: dict):
         """Update records in the database."""
 
+    @abstractmethod
+    def increment(self, db_name: str, table: str, counters: dict, query: dict):
+        """Atomically add to numeric fields of records in the database."""
+
+    @abstractmethod
+    def bulk_update(self, db_name: str, table: str, updates: list):
+        """Apply a batch of per-record updates to the database."""
+
+    @abstractmethod
+    def bulk_increment(self, db_name: str, table: str, increments: list):
+        """Apply a batch of per-record counter increments, creating missing records."""
+
     @abstractmethod
     def delete(self, db_name: str, table: str, query: dict):
         """Delete records from the database."""
@@ -8,18 +8,27 @@
 # db/mongodb.py
 
 import asyncio
+import datetime
 import logging
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ReturnDocument
+from pymongo import (
+    ReturnDocument,
+    UpdateOne
+)
+from pymongo.errors import (
+    BulkWriteError,
+    DuplicateKeyError
+)
 
 from backend.app.app_def import (
     MONGODB_URL,
     MONGODB_HOST,
     MONGODB_PORT,
     MONGODB_USER,
-    DB_ALL
+    DB_ALL,
+    DB_STREAM_BATCH_SIZE
 )
 from backend.db.db import (
     DatabaseClient,
@@ -109,16 +118,43 @@ class MongoClient(DatabaseClient):
                 if collection.name not in collections:
                     await self._db_client[db.name].create_collection(
                         collection.name,
-                        validator={"$jsonSchema": collection.schema}
+                        validator={"$jsonSchema": collection.schema},
+                        **collection.options
                     )
 
-                if collection.index:
+                elif "expireAfterSeconds" in collection.options:
+                    # Apply a changed retention to an existing time-series collection
+                    await self._sync_collection_ttl(db.name, collection)
+
+                # create_index is a no-op when an identical index already exists
+                for index in collection.indexes:
+                    options = {"collation": index.collation} if index.collation else {}
+                    if index.expire_after_seconds is not None:
+                        options["expireAfterSeconds"] = index.expire_after_seconds
+
                     await self._db_client[db.name][collection.name].create_index(
-                        keys=collection.index.keys,
-                        name=collection.index.index_name,
-                        unique=True
+                        keys=index.keys,
+                        name=index.index_name,
+                        unique=index.unique,
+                        **options
                     )
 
+    async def _sync_collection_ttl(self, db_name: str, collection) -> None:
+        """ collMod an existing collection to the registered expireAfterSeconds. """
+
+        infos = await self._db_client[db_name].list_collections(filter={"name": collection.name})
+        info = (await infos.to_list(length=1) or [{}])[0]
+
+        if "timeseries" in collection.options and "timeseries" not in info.get("options", {}):
+            logging.warning(f"{db_name}.{collection.name} predates its time-series layout; "
+                            f"drop or rename it to have it recreated")
+            return
+
+        expire = collection.options["expireAfterSeconds"]
+        if info.get("options", {}).get("expireAfterSeconds") != expire:
+            await self._db_client[db_name].command("collMod", collection.name,
+                                                   expireAfterSeconds=expire)
+
     async def export(self, db_name: str, **kwargs) -> dict:
         """Export the entire contents of a database as a dict. """
 
@@ -157,6 +193,45 @@ class MongoClient(DatabaseClient):
 
         return True
 
+    async def create_many(self,
+                          db_name: str,
+                          table: str,
+                          data: list) -> int:
+        """Insert multiple records into the database in a single round trip."""
+
+        if not data:
+            return 0
+
+        result = await self._db_client[db_name][table].insert_many(data, ordered=False)
+
+        return len(result.inserted_ids)
+
+    async def create_many_unique(self,
+                                 db_name: str,
+                                 table: str,
+                                 data: list) -> list:
+        """Insert multiple records in a single round trip, skipping duplicates.
+
+        Records whose unique key already exists are left out while the rest
+        are still inserted. Returns the indexes (into data) of the skipped
+        records; any other write error is raised.
+        """
+
+        if not data:
+            return []
+
+        try:
+            await self._db_client[db_name][table].insert_many(data, ordered=False)
+
+        except BulkWriteError as err:
+            write_errors = err.details.get("writeErrors", [])
+            if err.details.get("writeConcernErrors") or any(e["code"] != 11000 for e in write_errors):
+                raise
+
+            return sorted(e["index"] for e in write_errors)
+
+        return []
+
     async def count(self,
                     db_name: str,
                     table: str,
@@ -169,26 +244,83 @@ class MongoClient(DatabaseClient):
                    db_name: str,
                    table: str,
                    query: dict,
-                   projection: dict | None = None) -> list:
-        """Retrieve records from the database."""
+                   projection: dict | None = None,
+                   sort: list | None = None,
+                   limit: int = 0,
+                   collation: dict | None = None) -> list:
+        """Retrieve records from the database.
+
+        Optional sort, limit and collation are applied server-side; a
+        limit of 0 returns every matching record.
+        """
 
-        cursor = self._db_client[db_name][table].find(query, projection)
+        cursor = self._db_client[db_name][table].find(query, projection,
+                                                      sort=sort,
+                                                      limit=limit,
+                                                      collation=collation)
         results = await cursor.to_list()
         results = [self._convert_object_id(p) for p in results]
 
         return results
 
+    async def find_stream(self,
+                          db_name: str,
+                          table: str,
+                          query: dict,
+                          projection: dict | None = None,
+                          sort: list | None = None,
+                          limit: int = 0,
+                          batch_size: int = DB_STREAM_BATCH_SIZE):
+        """Yield matching records one at a time, fetched batch_size per round trip.
+
+        Only the current batch is held in memory. The server cursor is closed
+        when the consumer stops early (e.g. a client disconnects).
+        """
+
+        cursor = self._db_client[db_name][table].find(query, projection,
+                                                      sort=sort,
+                                                      limit=limit,
+                                                      batch_size=batch_size)
+        try:
+            async for doc in cursor:
+                yield self._convert_object_id(doc)
+
+        finally:
+            await cursor.close()
+
     async def find_one(self,
                        db_name: str,
                        table: str,
-                       query: dict) -> dict:
+                       query: dict,
+                       projection: dict | None = None) -> dict:
         """Retrieve a single record from the database."""
 
-        result = await self._db_client[db_name][table].find_one(query)
+        result = await self._db_client[db_name][table].find_one(query, projection)
         result = self._convert_object_id(result)
 
         return result
 
+    async def explain(self,
+                      db_name: str,
+                      table: str,
+                      query: dict,
+                      sort: list | None = None) -> dict:
+        """Return the query planner's explain output for a find."""
+
+        return await self._db_client[db_name][table].find(query, sort=sort).explain()
+
+    async def aggregate(self,
+                        db_name: str,
+                        table: str,
+                        pipeline: list) -> list:
+        """Run an aggregation pipeline and return the resulting records."""
+
+        cursor = self._db_client[db_name][table].aggregate(pipeline)
+        results = await cursor.to_list()
+        results = [self._convert_object_id(p) for p in results]
+
+        return results
+
     async def update(self,
                      db_name: str,
                      table: str,
@@ -200,6 +332,98 @@ class MongoClient(DatabaseClient):
 
         return result, result.matched_count
 
+    async def increment(self,
+                        db_name: str,
+                        table: str,
+                        counters: dict,
+                        query: dict,
+                        data: dict | None = None,
+                        upsert: bool = False,
+                        add_to_set: dict | None = None) -> tuple:
+        """Atomically add to numeric fields of matching records.
+
+        Uses $inc, so concurrent writers never overwrite each other's
+        changes. Optional data is $set, and optional add_to_set values
+        (field -> list) are merged into array fields, in the same update.
+        """
+
+        update = {"$inc": counters} if counters else {}
+        if data:
+            update["$set"] = data
+        if add_to_set:
+            update["$addToSet"] = {field: {"$each": values} for field, values in add_to_set.items()}
+
+        result = await self._db_client[db_name][table].update_many(query, update, upsert=upsert)
+
+        return result, result.matched_count
+
+    async def update_pipeline(self,
+                              db_name: str,
+                              table: str,
+                              pipeline: list,
+                              query: dict) -> tuple:
+        """Update records in the database with an aggregation pipeline.
+
+        Lets derived fields (e.g. cycle status) be recomputed server-side
+        in the same atomic write that changes their inputs.
+        """
+
+        result = await self._db_client[db_name][table].update_many(query, pipeline)
+
+        return result, result.matched_count
+
+    async def update_one_and_fetch(self,
+                                   db_name: str,
+                                   table: str,
+                                   update: dict | list,
+                                   query: dict) -> dict | None:
+        """Atomically update a single record and return it as updated.
+
+        update is passed through as-is, so it may be an operator document
+        ($set/$unset/$inc) or an aggregation pipeline. Returns None when no
+        record matches the query.
+        """
+
+        result = await self._db_client[db_name][table].find_one_and_update(
+            query,
+            update,
+            return_document=ReturnDocument.AFTER,
+        )
+
+        return self._convert_object_id(result)
+
+    async def bulk_update(self,
+                          db_name: str,
+                          table: str,
+                          updates: list,
+                          upsert: bool = False) -> tuple:
+        """Apply a list of (query, data) $set updates with one bulk_write."""
+
+        if not updates:
+            return None, 0
+
+        operations = [UpdateOne(query, {"$set": data}, upsert=upsert) for query, data in updates]
+        result = await self._db_client[db_name][table].bulk_write(operations, ordered=False)
+
+        return result, result.matched_count
+
+    async def bulk_increment(self,
+                             db_name: str,
+                             table: str,
+                             increments: list) -> tuple:
+        """Apply a list of (query, counters) $inc upserts with one bulk_write.
+
+        A missing record is created from the query fields and the counters.
+        """
+
+        if not increments:
+            return None, 0
+
+        operations = [UpdateOne(query, {"$inc": counters}, upsert=True) for query, counters in increments]
+        result = await self._db_client[db_name][table].bulk_write(operations, ordered=False)
+
+        return result, result.upserted_count + result.modified_count
+
     async def delete(self,
                      db_name: str,
                      table: str,
@@ -243,6 +467,55 @@ class MongoClient(DatabaseClient):
 
         return int(result["seq"])
 
+    async def reserve_sequence(self, db_name: str, sequence_name: str, count: int) -> int:
+        """Reserve a contiguous block of count values from a named sequence.
+
+        Same atomic $inc as get_next_sequence, but advances the counter by
+        count in one round trip. Returns the first value of the block; the
+        caller owns [first, first + count - 1].
+        """
+
+        result = await self._db_client[db_name]["counters"].find_one_and_update(
+            {"_id": sequence_name},
+            {"$inc": {"seq": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
+        return int(result["seq"]) - count + 1
+
+    async def acquire_lease(self,
+                            db_name: str,
+                            table: str,
+                            name: str,
+                            owner: str,
+                            expires_at) -> bool:
+        """Take or renew the named lease for owner until expires_at.
+
+        Succeeds when the lease is free, expired or already held by owner.
+        Returns False while another owner holds an unexpired lease.
+        """
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+        try:
+            await self._db_client[db_name][table].update_one(
+                {"_id": name, "$or": [{"owner": owner}, {"expires_at": {"$lt": now}}]},
+                {"$set": {"owner": owner, "expires_at": expires_at}},
+                upsert=True
+            )
+
+        except DuplicateKeyError:
+            # The lease exists and is held by someone else
+            return False
+
+        return True
+
+    async def release_lease(self, db_name: str, table: str, name: str, owner: str) -> None:
+        """Give up the named lease if owner holds it."""
+
+        await self._db_client[db_name][table].delete_one({"_id": name, "owner": owner})
+
     async def sync_sequence(self, db_name: str, sequence_name: str, min_value: int) -> None:
         """Advance the named counter to at least min_value.
 
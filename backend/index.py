@@ -7,6 +7,7 @@
 
 import asyncio
 import logging.config
+import os
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -15,13 +16,17 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 from pyinstrument import Profiler
 
-from backend.app.app_def import API_VERSION, BACKEND_DIR
+from backend.app.app_def import API_VERSION, BACKEND_DIR, TMP_DIR
 from backend.app.build_parser import build_parser
+from backend.app.cache import share_cache_generations
 from backend.app.correlation import set_request_id
+from backend.app.responses import JSONResponse
 from backend.app.utility import configure_logging
 from backend.db.mongodb import MongoClient
-from backend.module.runners import save_runner_status
+from backend.module.runner_state import follow_runner_snapshot
+from backend.module.runner_stream import RunnerStatusBroker
 from backend.routes import routers
+from backend.worker import run_background_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -32,31 +37,35 @@ async def lifespan(app):
         and shutdown events.
     """
 
-    global runner_task
+    tasks = []
 
     # Initialize mongo client
     mongodb_client = MongoClient()
     await mongodb_client.connect()
     await mongodb_client.configure()
 
-    if not args.skip_background_tasks:
-        # Start the background task to save runner status periodically
-        runner_task = asyncio.create_task(save_runner_status(app, mongodb_client))
-        logger.info("Started background task")
-
     # Attach the database client to the app state
     app.state.mdb = mongodb_client
+    app.state.runner_stream_broker = RunnerStatusBroker()
+
+    if not args.skip_background_tasks:
+        # Follow the runner status written by the background worker
+        tasks.append(asyncio.create_task(follow_runner_snapshot(app, mongodb_client)))
+
+        if args.run_worker:
+            # Single process deployment: compete for the worker lease here as well
+            tasks.append(asyncio.create_task(run_background_jobs(mongodb_client)))
+
+        logger.info("Started background tasks")
 
     yield
 
-    if args.skip_background_tasks:
-        # Cleanup: Cancel the background task
-        try:
-            runner_task.cancel()
-            await runner_task
+    # Cleanup: Cancel the background tasks
+    for task in tasks:
+        task.cancel()
 
-        except asyncio.CancelledError:
-            logger.info("Background task cancelled successfully")
+    await asyncio.gather(*tasks, return_exceptions=True)
+    logger.info("Background tasks cancelled successfully")
 
     # Close the mongo client connection
     await mongodb_client.close()
@@ -72,6 +81,7 @@ app = FastAPI(title="ORBIT",
               redoc_url=f"/api/{API_VERSION}/redoc",
               openapi_url=f"/api/{API_VERSION}/openapi.json",
               debug=args.debug,
+              default_response_class=JSONResponse,
               lifespan=lifespan)
 
 app.add_middleware(
@@ -80,6 +90,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Link", "ETag"],
 )
 
 
@@ -119,8 +130,24 @@ for router in routers:
 
 if __name__ == "__main__":
     log_conf = configure_logging(BACKEND_DIR / 'log_conf.yaml', args.debug)
-    uvicorn.run("index:app",
-                host=args.host,
-                port=int(args.port),
-                reload=args.debug,
-                log_config=log_conf)
+    workers = 1 if args.debug else args.workers
+
+    if workers > 1:
+        # Cache invalidations in one worker must reach the others
+        share_cache_generations(TMP_DIR / f"cache-generations-{os.getpid()}")
+
+    try:
+        uvicorn.run("index:app",
+                    host=args.host,
+                    port=int(args.port),
+                    reload=args.debug,
+                    workers=workers,
+                    loop=args.loop,
+                    http=args.http,
+                    backlog=args.backlog,
+                    timeout_keep_alive=args.keep_alive,
+                    timeout_graceful_shutdown=args.graceful_timeout,
+                    log_config=log_conf)
+
+    finally:
+        (TMP_DIR / f"cache-generations-{os.getpid()}").unlink(missing_ok=True)
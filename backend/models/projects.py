@@ -22,6 +22,7 @@ class Project(BaseModel):
     is_active: bool
     test_case_count: int | None
     test_cycle_count: int | None
+    test_execution_count: int | None = 0
     labels: list = []
     model_config = {"extra": "forbid"}
 
@@ -7,6 +7,8 @@
 
 # routes/test_cases.py
 
+from typing import Literal
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
@@ -16,6 +18,7 @@ router = APIRouter()
 class TestCase(BaseModel):
     _id: str
     test_case_key: str
+    seq: int | None = None
     project_key: str
     title: str | None
     description: str | None
@@ -63,3 +66,12 @@ class TestCaseUpdate(BaseModel):
     test_frequency: list = None
     labels: list = None
     links: list = None
+
+
+class TestCaseListFilter(BaseModel):
+    status: list[str] | None = None
+    label: list[str] | None = None
+    folder: list[str] | None = None
+    priority: list[str] | None = None
+    last_result: list[str] | None = None
+    sort: Literal["seq", "-seq", "updated_at", "-updated_at"] = "seq"
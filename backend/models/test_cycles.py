@@ -16,6 +16,7 @@ router = APIRouter()
 class TestCycle(BaseModel):
     _id: str
     test_cycle_key: str
+    seq: int | None = None
     project_key: str
     title: str | None
     description: str | None
@@ -24,6 +25,9 @@ class TestCycle(BaseModel):
     status: str | None
     folder: str | None
     executions: dict = {}
+    test_case_executions: dict = {}
+    result_counts: dict = {}
+    execution_count: int = 0
     model_config = {"extra": "forbid"}
 
 
@@ -7,6 +7,9 @@
 
 # model/execution.py
 
+import datetime
+from typing import Literal
+
 from fastapi import APIRouter
 from pydantic import BaseModel
 
@@ -16,6 +19,7 @@ router = APIRouter()
 class TestExecution(BaseModel):
     _id: str
     execution_key: str
+    seq: int | None = None
     project_key: str
     test_case_key: str
     test_cycle_key: str | None
@@ -49,3 +53,16 @@ class TestExecutionUpdate(BaseModel):
     finished_at: str = None
     links: list = None
     model_config = {"extra": "forbid"}
+
+
+class TestExecutionBulkCreate(BaseModel):
+    test_cycle_key: str = None
+    executions: list[TestExecutionCreate] = []
+    model_config = {"extra": "forbid"}
+
+
+class TestExecutionListFilter(BaseModel):
+    result: list[str] | None = None
+    started_after: datetime.datetime | None = None
+    started_before: datetime.datetime | None = None
+    sort: Literal["seq", "-seq", "started_at", "-started_at"] = "seq"
@@ -0,0 +1,87 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/cycle_membership.py
+#
+# Cycle membership shared by the cycle and execution routes.
+#
+# - A cycle's test_case_executions maps each test case to its one member
+#   execution. cycle_membership_pipeline maintains it together with the
+#   executions map in a single document update, so it is the source of
+#   truth when adds of one test case race.
+# - The test_cycle_key link on executions follows it: sync_cycle_links
+#   links each member and unlinks every other execution of its test case.
+
+import asyncio
+
+from backend.app.app_def import (
+    DB_NAME_TM,
+    DB_COLLECTION_TM_TE,
+    DB_COLLECTION_TM_TCY
+)
+from backend.db.db import DatabaseClient
+
+
+async def test_case_executions(db: DatabaseClient, executions: dict) -> dict:
+    """ Member of each test case in a whole executions map, keyed by test case. """
+
+    if not executions:
+        return {}
+
+    docs = await db.find(DB_NAME_TM.name, DB_COLLECTION_TM_TE.name,
+                         {"execution_key": {"$in": list(executions)}},
+                         {"execution_key": 1, "test_case_key": 1})
+
+    return {doc["test_case_key"]: doc["execution_key"] for doc in docs}
+
+
+async def _cycle_members(db: DatabaseClient, test_cycle_key: str, test_case_keys: list) -> dict | None:
+    """ Current member of each given test case (None where it has none). """
+
+    cycle = await db.find_one(DB_NAME_TM.name, DB_COLLECTION_TM_TCY.name,
+                              {"test_cycle_key": test_cycle_key},
+                              {"test_case_executions": 1})
+    if cycle is None:
+        return None
+
+    members = cycle.get("test_case_executions") or {}
+
+    return {tc_key: members.get(tc_key) for tc_key in test_case_keys}
+
+
+async def sync_cycle_links(db: DatabaseClient, test_cycle_key: str, test_case_keys: list) -> None:
+    """ Point the test_cycle_key links of the given test cases at the cycle's members.
+
+    Repeats until the members read before the writes are still current after
+    them: a concurrent add that changed a member after our read runs its own
+    sync after its update, so its writes land after ours.
+    """
+
+    members = await _cycle_members(db, test_cycle_key, test_case_keys)
+
+    while members is not None:
+        tasks = []
+        for tc_key, execution_key in members.items():
+            if execution_key is not None:
+                tasks.append(db.update(DB_NAME_TM.name, DB_COLLECTION_TM_TE.name,
+                                       {"test_cycle_key": test_cycle_key},
+                                       {"execution_key": execution_key,
+                                        "test_cycle_key": {"$in": [None, test_cycle_key]}}))
+
+            tasks.append(db.update(DB_NAME_TM.name, DB_COLLECTION_TM_TE.name,
+                                   {"test_cycle_key": None},
+                                   {"test_cycle_key": test_cycle_key,
+                                    "test_case_key": tc_key,
+                                    "execution_key": {"$ne": execution_key}}))
+
+        await asyncio.gather(*tasks)
+
+        current = await _cycle_members(db, test_cycle_key, test_case_keys)
+        if current == members:
+            break
+
+        members = current
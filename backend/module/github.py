@@ -0,0 +1,230 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/github.py
+#
+# Async GitHub REST client used by the runner poller.
+#
+# - One pooled httpx.AsyncClient per poller, so connections to the API are
+#   kept alive between requests and polls.
+# - A semaphore caps the number of requests in flight across all repos.
+# - List endpoints are followed page by page through the Link rel="next"
+#   header, so results are not truncated at per_page=100.
+# - Every page is fetched conditionally: the ETag of the last 200 response
+#   is sent back as If-None-Match, and a 304 (which does not count against
+#   the GitHub rate limit) is answered from the cached payload. The cache is
+#   bounded (GITHUB_ETAG_CACHE_MAXSIZE URLs, LRU, GITHUB_ETAG_CACHE_TTL), since
+#   every workflow run brings its own jobs URL.
+# - X-RateLimit-* headers are recorded so the poller can pace itself.
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+import httpx
+from cachetools import TTLCache
+
+from backend.app.app_def import (
+    GITHUB_API_URL,
+    GITHUB_OWNER,
+    GITHUB_TOKEN,
+    GITHUB_ETAG_CACHE_MAXSIZE,
+    GITHUB_ETAG_CACHE_TTL,
+    GITHUB_MAX_CONCURRENCY,
+    GITHUB_PER_PAGE,
+    GITHUB_TIMEOUT
+)
+
+
+class GitHubError(Exception):
+    """ A GitHub request that failed, so its result is unknown (not empty). """
+
+
+@dataclass
+class RequestStats:
+    requests: int = 0
+    not_modified: int = 0
+    failed: int = 0
+
+    @property
+    def cost(self) -> int:
+        """ Requests that counted against the rate limit (304s are free). """
+
+        return self.requests - self.not_modified
+
+    def to_dict(self) -> dict:
+        return {"requests": self.requests, "not_modified": self.not_modified,
+                "failed": self.failed, "cost": self.cost}
+
+
+@dataclass
+class RateLimit:
+    limit: int | None = None
+    remaining: int | None = None
+    reset: int | None = None
+    used: int | None = None
+
+    def update(self, headers) -> None:
+        """ Record the X-RateLimit-* headers of a response, if present. """
+
+        for name in ("limit", "remaining", "reset", "used"):
+            value = headers.get(f"x-ratelimit-{name}")
+            if value is not None and value.isdigit():
+                setattr(self, name, int(value))
+
+    def to_dict(self) -> dict:
+        return {"limit": self.limit, "remaining": self.remaining,
+                "reset": self.reset, "used": self.used}
+
+
+class GitHubClient:
+
+    def __init__(self,
+                 api_url: str = GITHUB_API_URL,
+                 owner: str = GITHUB_OWNER,
+                 token: str = GITHUB_TOKEN,
+                 max_concurrency: int = GITHUB_MAX_CONCURRENCY,
+                 timeout: float = GITHUB_TIMEOUT,
+                 etag_cache_size: int = GITHUB_ETAG_CACHE_MAXSIZE,
+                 etag_cache_ttl: float = GITHUB_ETAG_CACHE_TTL):
+        """ Initialize the GitHub client. """
+
+        self._owner = owner
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._etag_cache = TTLCache(etag_cache_size, etag_cache_ttl)
+        self.rate_limit = RateLimit()
+        self.stats = RequestStats()
+        self._client = httpx.AsyncClient(
+            base_url=api_url,
+            headers={"Authorization": f"bearer {token}",
+                     "Accept": "application/vnd.github+json"},
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency,
+                                max_keepalive_connections=max_concurrency)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """ Close pooled connections. """
+
+        await self._client.aclose()
+
+    async def _get(self,
+                   url: str,
+                   params: dict | None = None,
+                   stats: RequestStats | None = None) -> tuple[dict, str | None]:
+        """ Conditionally GET a URL under the concurrency cap.
+
+        Returns the JSON body and the next page URL. Raises GitHubError on a
+        transport error or any status but 200 / 304 (e.g. 403 / 429 once the
+        rate limit is exhausted, or a 5xx).
+        """
+
+        request = self._client.build_request("GET", url, params=params)
+        cache_key = str(request.url)
+
+        cached = self._etag_cache.get(cache_key)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached[0]
+
+        async with self._semaphore:
+            try:
+                resp = await self._client.send(request)
+
+            except httpx.HTTPError as err:
+                logging.warning(f"GitHub request {url} failed: {err}")
+                resp = None
+
+        for counter in filter(None, (self.stats, stats)):
+            counter.requests += 1
+            if resp is None or resp.status_code not in (200, 304):
+                counter.failed += 1
+
+            elif resp.status_code == 304:
+                counter.not_modified += 1
+
+        if resp is None:
+            raise GitHubError(f"GitHub request {url} failed")
+
+        # Recorded for failures too, so an exhausted budget paces the next poll
+        self.rate_limit.update(resp.headers)
+
+        if resp.status_code == 304 and cached is not None:
+            # Unchanged since last time; the payload and next link are still valid
+            return cached[1], cached[2]
+
+        if resp.status_code != 200:
+            logging.debug(resp.content)
+            raise GitHubError(f"GitHub request {url} failed with status {resp.status_code}")
+
+        # The next link already carries the query string
+        body = resp.json()
+        next_url = resp.links.get("next", {}).get("url")
+
+        etag = resp.headers.get("etag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, body, next_url)
+
+        return body, next_url
+
+    async def get_paginated(self,
+                            url: str,
+                            key: str,
+                            params: dict | None = None,
+                            stats: RequestStats | None = None) -> list:
+        """ GET every page of a list endpoint and concatenate the items under key.
+
+        Raises GitHubError if any page fails, rather than returning a truncated list.
+        """
+
+        items = []
+        params = {"per_page": GITHUB_PER_PAGE, **(params or {})}
+
+        while url:
+            # Copy items so callers never mutate the cached payload
+            body, url = await self._get(url, params, stats)
+            items += [dict(item) for item in body[key]]
+            params = None
+
+        return items
+
+    async def get_runners(self, repo: str, stats: RequestStats | None = None) -> list:
+        """ Get all self-hosted runners for the repository. """
+
+        return await self.get_paginated(f"/repos/{self._owner}/{repo}/actions/runners", "runners",
+                                        stats=stats)
+
+    async def get_in_progress_jobs(self, repo: str, stats: RequestStats | None = None) -> list:
+        """ Get the jobs of every in_progress workflow run, each merged with its run's fields. """
+
+        runs = await self.get_paginated(f"/repos/{self._owner}/{repo}/actions/runs",
+                                        "workflow_runs",
+                                        {"status": "in_progress"},
+                                        stats)
+
+        # Fetch the jobs of every run concurrently; all of them, or none if any fails
+        run_jobs = await asyncio.gather(*[
+            self.get_paginated(run["jobs_url"], "jobs", stats=stats) for run in runs
+        ], return_exceptions=True)
+        for jobs in run_jobs:
+            if isinstance(jobs, Exception):
+                raise jobs
+
+        running_jobs = []
+        for run, jobs in zip(runs, run_jobs):
+            # Append run info to each job item
+            for item in jobs:
+                item.update(run)
+
+            running_jobs += jobs
+
+        return running_jobs
@@ -0,0 +1,91 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/index_audit.py
+#
+# Runs explain() on every query shape registered in app_def.py and reports
+# the winning plan's stages, flagging any shape that falls back to a
+# collection scan (COLLSCAN) because no registered index serves it.
+#
+# Usage:
+#     python -m backend.module.index_audit
+# or  GET /api/v1/db-index-audit
+
+import asyncio
+import json
+import logging
+
+from backend.app.app_def import DB_ALL
+from backend.db.mongodb import MongoClient
+
+
+def plan_stages(plan: dict) -> list[str]:
+    """ Flatten a winning plan tree into its stage names, outermost first. """
+
+    # Slot-based execution nests the classic plan under queryPlan
+    plan = plan.get("queryPlan", plan)
+
+    stages = [plan["stage"]] if "stage" in plan else []
+    if "inputStage" in plan:
+        stages += plan_stages(plan["inputStage"])
+
+    for child in plan.get("inputStages", []):
+        stages += plan_stages(child)
+
+    return stages
+
+
+async def audit_query_shapes(mdb: MongoClient) -> dict:
+    """ Explain every registered query shape and report which ones scan a collection. """
+
+    shapes = [(db, collection, shape)
+              for db in DB_ALL
+              for collection in db.collections
+              for shape in collection.query_shapes]
+
+    explains = await asyncio.gather(*[
+        mdb.explain(db.name, collection.name, shape.query, shape.sort)
+        for db, collection, shape in shapes
+    ])
+
+    results = []
+    for (db, collection, shape), explain in zip(shapes, explains):
+        # Time-series finds are rewritten to a pipeline over the bucket collection
+        planner = explain.get("queryPlanner") or explain["stages"][0]["$cursor"]["queryPlanner"]
+        stages = plan_stages(planner["winningPlan"])
+        results.append({"db": db.name,
+                        "collection": collection.name,
+                        "shape": shape.name,
+                        "stages": stages,
+                        "collscan": "COLLSCAN" in stages})
+
+    collscans = [r for r in results if r["collscan"]]
+    for result in collscans:
+        logging.warning(f"COLLSCAN on {result['collection']}: {result['shape']}")
+
+    logging.info(f"Index audit: {len(results)} query shapes, {len(collscans)} collection scans")
+
+    return {"shapes": len(results), "collscans": len(collscans), "results": results}
+
+
+async def main() -> dict:
+    """ Connect, create registered indexes, audit all query shapes and disconnect. """
+
+    mdb = MongoClient()
+    await mdb.connect()
+
+    try:
+        await mdb.configure()
+        return await audit_query_shapes(mdb)
+
+    finally:
+        await mdb.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(json.dumps(asyncio.run(main()), indent=2))
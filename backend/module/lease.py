@@ -0,0 +1,115 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/lease.py
+#
+# MongoDB-backed leader lease.
+#
+# Any number of workers may run; each tries to take the named lease and
+# only the holder runs the guarded job. The holder renews the lease every
+# ttl / 3 seconds. If it dies or loses the database, the lease expires
+# after ttl and a standby worker takes over. If the holder fails to renew
+# in time, its job is cancelled before anyone else can have taken over.
+
+import asyncio
+import datetime
+import logging
+import os
+import socket
+import uuid
+from typing import Awaitable, Callable
+
+from backend.app.app_def import (
+    DB_NAME_RUNNERS,
+    DB_COLLECTION_LEASES,
+    WORKER_LEASE_TTL
+)
+from backend.db.mongodb import MongoClient
+
+
+class Lease:
+
+    def __init__(self,
+                 mdb: MongoClient,
+                 name: str,
+                 ttl: float = WORKER_LEASE_TTL,
+                 owner: str | None = None):
+        """ Initialize a lease handle; nothing is taken until acquire(). """
+
+        self._mdb = mdb
+        self.name = name
+        self.ttl = ttl
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    async def acquire(self) -> bool:
+        """ Take or renew the lease, returning whether this owner holds it. """
+
+        expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=self.ttl)
+
+        return await self._mdb.acquire_lease(DB_NAME_RUNNERS.name, DB_COLLECTION_LEASES.name,
+                                             self.name, self.owner, expires_at)
+
+    async def release(self) -> None:
+        """ Give the lease up so a standby can take over without waiting for expiry. """
+
+        await self._mdb.release_lease(DB_NAME_RUNNERS.name, DB_COLLECTION_LEASES.name,
+                                      self.name, self.owner)
+
+    async def _renew(self) -> None:
+        """ Renew every ttl / 3 seconds; return once the lease could not be renewed. """
+
+        while True:
+            await asyncio.sleep(self.ttl / 3)
+
+            try:
+                if not await self.acquire():
+                    logging.warning(f"Lease {self.name} taken over by another owner")
+                    return
+
+            except Exception as err:
+                logging.warning(f"Lease {self.name} renewal failed: {err}")
+                return
+
+    async def run(self, job: Callable[[], Awaitable]) -> None:
+        """ Run job whenever this owner holds the lease, standing by otherwise. Never returns. """
+
+        while True:
+            try:
+                acquired = await self.acquire()
+
+            except Exception as err:
+                logging.warning(f"Lease {self.name} acquire failed: {err}")
+                acquired = False
+
+            if not acquired:
+                await asyncio.sleep(self.ttl / 3)
+                continue
+
+            logging.info(f"Lease {self.name} acquired by {self.owner}")
+
+            job_task = asyncio.create_task(job())
+            renew_task = asyncio.create_task(self._renew())
+
+            try:
+                # Whichever ends first: a lost lease stops the job, a finished job frees the lease
+                await asyncio.wait({job_task, renew_task}, return_when=asyncio.FIRST_COMPLETED)
+
+            finally:
+                for task in (job_task, renew_task):
+                    task.cancel()
+
+                await asyncio.gather(job_task, renew_task, return_exceptions=True)
+
+                # Also on shutdown, so a standby takes over without waiting for expiry
+                try:
+                    await self.release()
+
+                except Exception as err:
+                    logging.warning(f"Lease {self.name} release failed: {err}")
+
+            if not job_task.cancelled() and job_task.exception():
+                logging.error(f"Job under lease {self.name} failed", exc_info=job_task.exception())
@@ -0,0 +1,188 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/maintenance.py
+#
+# Repair jobs for denormalized fields that write paths maintain
+# incrementally (counters, key sequence numbers). Each job detects drift
+# server-side and rewrites only the drifted documents in one bulk update.
+# Running it once after upgrading also backfills fields that older
+# documents were created without.
+#
+# Usage:
+#     python -m backend.module.maintenance [--dry-run]
+# or  POST /api/v1/db-repair
+
+import argparse
+import asyncio
+import json
+import logging
+
+from backend.app.app_def import (
+    DB_NAME_TM,
+    DB_COLLECTION_TM_PRJ,
+    DB_COLLECTION_TM_TC,
+    DB_COLLECTION_TM_TE,
+    DB_COLLECTION_TM_TCY
+)
+from backend.app.utility import (
+    cycle_recount_expressions,
+    cycle_status_expression,
+    key_sequence_expression
+)
+from backend.db.mongodb import MongoClient
+
+
+async def repair_cycle_counters(mdb: MongoClient,
+                                dry_run: bool = False) -> dict:
+    """ Recompute result counters and status for all cycles in bulk. """
+
+    recount = cycle_recount_expressions()
+    recount_status = cycle_status_expression(not_executed=recount["result_counts.NOT_EXECUTED"],
+                                             total=recount["execution_count"])
+
+    # A cycle has drifted if any stored counter or its status differs from a full recount
+    drift_query = {"$expr": {"$or": [
+        *[{"$ne": [f"${path}", expression]} for path, expression in recount.items()],
+        {"$ne": ["$status", recount_status]}
+    ]}}
+
+    checked, drifted = await asyncio.gather(
+        mdb.count(DB_NAME_TM.name, DB_COLLECTION_TM_TCY.name, {}),
+        mdb.count(DB_NAME_TM.name, DB_COLLECTION_TM_TCY.name, drift_query)
+    )
+
+    repaired = 0
+    if drifted and not dry_run:
+        _, repaired = await mdb.update_pipeline(DB_NAME_TM.name,
+                                                DB_COLLECTION_TM_TCY.name,
+                                                [{"$set": recount},
+                                                 {"$set": {"status": cycle_status_expression()}}],
+                                                drift_query)
+
+    logging.info(f"Cycle counters: {checked} checked, "
+                 f"{drifted} drifted, {repaired} repaired")
+
+    return {"checked": checked, "drifted": drifted, "repaired": repaired}
+
+
+async def count_by_project(mdb: MongoClient,
+                           table: str) -> dict:
+    """ Count records per project_key in one $group aggregation. """
+
+    groups = await mdb.aggregate(DB_NAME_TM.name, table, [
+        {"$group": {"_id": "$project_key", "count": {"$sum": 1}}}
+    ])
+
+    return {group["_id"]: group["count"] for group in groups}
+
+
+async def reconcile_project_counters(mdb: MongoClient,
+                                     dry_run: bool = False) -> dict:
+    """ Recount test cases, cycles and executions per project and fix drift. """
+
+    counters = {
+        "test_case_count": DB_COLLECTION_TM_TC.name,
+        "test_cycle_count": DB_COLLECTION_TM_TCY.name,
+        "test_execution_count": DB_COLLECTION_TM_TE.name
+    }
+
+    # One find plus one $group per linked collection, independent of project count
+    projects, *counts = await asyncio.gather(
+        mdb.find(DB_NAME_TM.name, DB_COLLECTION_TM_PRJ.name, {},
+                 {"project_key": 1, **{field: 1 for field in counters}}),
+        *[count_by_project(mdb, table) for table in counters.values()]
+    )
+
+    updates = []
+    for project in projects:
+        actual = {field: count.get(project["project_key"], 0)
+                  for field, count in zip(counters, counts)}
+        if any(project.get(field) != value for field, value in actual.items()):
+            updates.append(({"project_key": project["project_key"]}, actual))
+
+    repaired = 0
+    if updates and not dry_run:
+        _, repaired = await mdb.bulk_update(DB_NAME_TM.name, DB_COLLECTION_TM_PRJ.name, updates)
+
+    logging.info(f"Project counters: {len(projects)} checked, "
+                 f"{len(updates)} drifted, {repaired} repaired")
+
+    return {"checked": len(projects), "drifted": len(updates), "repaired": repaired}
+
+
+async def backfill_sequence_fields(mdb: MongoClient,
+                                   dry_run: bool = False) -> dict:
+    """ Set the integer seq field from the key suffix wherever it is missing or stale. """
+
+    key_fields = {
+        DB_COLLECTION_TM_TC.name: "test_case_key",
+        DB_COLLECTION_TM_TE.name: "execution_key",
+        DB_COLLECTION_TM_TCY.name: "test_cycle_key"
+    }
+
+    checked = drifted = repaired = 0
+    for table, key_field in key_fields.items():
+        expression = key_sequence_expression(key_field)
+        drift_query = {"$expr": {"$ne": ["$seq", expression]}}
+
+        table_checked, table_drifted = await asyncio.gather(
+            mdb.count(DB_NAME_TM.name, table, {}),
+            mdb.count(DB_NAME_TM.name, table, drift_query)
+        )
+        checked += table_checked
+        drifted += table_drifted
+
+        if table_drifted and not dry_run:
+            _, table_repaired = await mdb.update_pipeline(DB_NAME_TM.name, table,
+                                                          [{"$set": {"seq": expression}}],
+                                                          drift_query)
+            repaired += table_repaired
+
+    logging.info(f"Sequence fields: {checked} checked, "
+                 f"{drifted} drifted, {repaired} repaired")
+
+    return {"checked": checked, "drifted": drifted, "repaired": repaired}
+
+
+async def repair_all(mdb: MongoClient,
+                     dry_run: bool = False) -> dict:
+    """ Run every repair job and return a report keyed by job. """
+
+    return {
+        "cycles": await repair_cycle_counters(mdb, dry_run),
+        "projects": await reconcile_project_counters(mdb, dry_run),
+        "sequences": await backfill_sequence_fields(mdb, dry_run)
+    }
+
+
+async def main(dry_run: bool = False) -> dict:
+    """ Connect, run all repair jobs and disconnect. """
+
+    mdb = MongoClient()
+    await mdb.connect()
+
+    try:
+        return await repair_all(mdb, dry_run)
+
+    finally:
+        await mdb.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Orbit counter repair')
+    parser.add_argument(
+        '--dry-run',
+        dest='dry_run',
+        action='store_true',
+        default=False,
+        help='Only report drifted documents, do not repair them'
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    print(json.dumps(asyncio.run(main(args.dry_run)), indent=2))
@@ -0,0 +1,205 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/runner_history.py
+#
+# Runner history storage.
+#
+# - runner-stats-historic is a time-series collection (timeField queried_ts,
+#   metaField name) holding one sample per runner per poll or webhook event,
+#   expired after RUNNER_HISTORY_TTL_DAYS. Each poll writes its samples with
+#   one insert_many.
+# - runner-stats-hourly and runner-stats-daily hold per-runner bucket counts
+#   (samples, busy, online). They are recomputed from the finer level with a
+#   $group + $merge over the current hour / day on every pass, so long range
+#   history queries read a few hundred bucket documents instead of months
+#   of raw samples.
+# - runner_history() answers a range query for one runner by bucketing the
+#   coarsest level that still resolves the requested unit with $dateTrunc,
+#   and returns parallel ts / samples / busy / online arrays.
+
+import datetime
+import logging
+
+from backend.app.app_def import (
+    RUNNER_HISTORY_MAX_POINTS,
+    DB_NAME_RUNNERS,
+    DB_COLLECTION_RUNNERS_STATS_HISTORIC,
+    DB_COLLECTION_RUNNERS_STATS_HOURLY,
+    DB_COLLECTION_RUNNERS_STATS_DAILY
+)
+from backend.db.db import DatabaseClient
+from backend.models.runner import Runner
+
+# Re-roll this far back on the first pass to catch up after downtime
+ROLLUP_CATCH_UP = datetime.timedelta(days=1)
+
+HISTORY_UNITS = {
+    "minute": datetime.timedelta(minutes=1),
+    "hour": datetime.timedelta(hours=1),
+    "day": datetime.timedelta(days=1)
+}
+
+# Collection and time field read for each unit
+HISTORY_SOURCES = {
+    "minute": (DB_COLLECTION_RUNNERS_STATS_HISTORIC.name, "queried_ts"),
+    "hour": (DB_COLLECTION_RUNNERS_STATS_HOURLY.name, "ts"),
+    "day": (DB_COLLECTION_RUNNERS_STATS_DAILY.name, "ts")
+}
+
+
+def history_document(runner: dict) -> dict:
+    """ Time-series sample of a runner status, timestamped as a BSON date. """
+
+    data = Runner(**runner).model_dump()
+    data["queried_ts"] = datetime.datetime.fromtimestamp(data["queried_ts"], datetime.timezone.utc)
+
+    return data
+
+
+async def save_runner_history(db: DatabaseClient, runners: list) -> int:
+    """ Append runner samples to the history in a single insert_many. """
+
+    return await db.create_many(DB_NAME_RUNNERS.name,
+                                DB_COLLECTION_RUNNERS_STATS_HISTORIC.name,
+                                [history_document(r) for r in runners])
+
+
+def truncate(ts: datetime.datetime, unit: str) -> datetime.datetime:
+    """ Start of the hour or day containing ts. """
+
+    ts = ts.replace(minute=0, second=0, microsecond=0)
+
+    return ts.replace(hour=0) if unit == "day" else ts
+
+
+def bucket_counts(time_field: str) -> dict:
+    """ $group accumulators for samples / busy / online counts of a bucket. """
+
+    if time_field == "queried_ts":
+        # Raw samples: count them
+        return {"samples": {"$sum": 1},
+                "busy": {"$sum": {"$cond": ["$busy", 1, 0]}},
+                "online": {"$sum": {"$cond": [{"$eq": ["$status", "online"]}, 1, 0]}}}
+
+    # Finer buckets: add their counts up
+    return {field: {"$sum": f"${field}"} for field in ("samples", "busy", "online")}
+
+
+def rollup_pipeline(unit: str,
+                    time_field: str,
+                    start: datetime.datetime,
+                    end: datetime.datetime,
+                    into: str) -> list:
+    """ $group the [start, end) range into unit buckets per runner and $merge them into into. """
+
+    return [
+        {"$match": {time_field: {"$gte": start, "$lt": end}}},
+        {"$group": {"_id": {"name": "$name",
+                            "ts": {"$dateTrunc": {"date": f"${time_field}", "unit": unit}}},
+                    **bucket_counts(time_field),
+                    "designation": {"$last": "$designation"}}},
+        {"$project": {"_id": 0,
+                      "name": "$_id.name",
+                      "ts": "$_id.ts",
+                      "samples": 1,
+                      "busy": 1,
+                      "online": 1,
+                      "designation": 1}},
+        {"$merge": {"into": into,
+                    "on": ["name", "ts"],
+                    "whenMatched": "replace",
+                    "whenNotMatched": "insert"}}
+    ]
+
+
+class RunnerHistoryRollup:
+    """ Keeps the hourly and daily rollups current as samples arrive. """
+
+    def __init__(self):
+        self.since = None
+
+    async def run(self, db: DatabaseClient, now: datetime.datetime | None = None):
+        """ Recompute the hourly and daily buckets touched since the last pass. """
+
+        now = datetime.datetime.now(datetime.timezone.utc) if now is None else now
+        since = now - ROLLUP_CATCH_UP if self.since is None else self.since
+        end = now + datetime.timedelta(seconds=1)
+
+        # Hourly buckets from raw samples, then daily buckets from hourly ones
+        await db.aggregate(DB_NAME_RUNNERS.name,
+                           DB_COLLECTION_RUNNERS_STATS_HISTORIC.name,
+                           rollup_pipeline("hour", "queried_ts", truncate(since, "hour"), end,
+                                           DB_COLLECTION_RUNNERS_STATS_HOURLY.name))
+
+        await db.aggregate(DB_NAME_RUNNERS.name,
+                           DB_COLLECTION_RUNNERS_STATS_HOURLY.name,
+                           rollup_pipeline("day", "ts", truncate(since, "day"), end,
+                                           DB_COLLECTION_RUNNERS_STATS_DAILY.name))
+
+        logging.debug(f"Runner history rolled up since {since.isoformat()}")
+
+        # The current hour / day are still filling up; the next pass redoes them
+        self.since = now
+
+
+def auto_resolution(start: datetime.datetime, end: datetime.datetime) -> str:
+    """ Finest unit that keeps the range within RUNNER_HISTORY_MAX_POINTS buckets. """
+
+    for unit, width in HISTORY_UNITS.items():
+        if (end - start) / width <= RUNNER_HISTORY_MAX_POINTS:
+            return unit
+
+    return "day"
+
+
+def history_pipeline(name: str,
+                     start: datetime.datetime,
+                     end: datetime.datetime,
+                     unit: str,
+                     bin_size: int = 1) -> list:
+    """ Bucket one runner's history in [start, end) and fold it into parallel arrays. """
+
+    _, time_field = HISTORY_SOURCES[unit]
+
+    def ratio(field: str) -> dict:
+        return {"$round": [{"$divide": [f"${field}", "$samples"]}, 3]}
+
+    return [
+        {"$match": {"name": name, time_field: {"$gte": start, "$lt": end}}},
+        {"$group": {"_id": {"$dateTrunc": {"date": f"${time_field}", "unit": unit, "binSize": bin_size}},
+                    **bucket_counts(time_field)}},
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": None,
+                    "ts": {"$push": {"$toLong": {"$divide": [{"$toLong": "$_id"}, 1000]}}},
+                    "samples": {"$push": "$samples"},
+                    "busy": {"$push": ratio("busy")},
+                    "online": {"$push": ratio("online")}}},
+        {"$project": {"_id": 0}}
+    ]
+
+
+async def runner_history(db: DatabaseClient,
+                         name: str,
+                         start: datetime.datetime,
+                         end: datetime.datetime,
+                         unit: str,
+                         bin_size: int = 1) -> dict:
+    """ Busy / online ratio of a runner per bucket, as parallel arrays. """
+
+    table, _ = HISTORY_SOURCES[unit]
+    result = await db.aggregate(DB_NAME_RUNNERS.name, table,
+                                history_pipeline(name, start, end, unit, bin_size))
+
+    columns = result[0] if result else {"ts": [], "samples": [], "busy": [], "online": []}
+
+    return {"name": name,
+            "resolution": unit,
+            "bin_size": bin_size,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            **columns}
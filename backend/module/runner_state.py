@@ -0,0 +1,131 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/runner_state.py
+#
+# Runner status shared between the background worker and API processes.
+#
+# - runner-stats-current holds the latest status of every runner as
+#   {name, repo, runner}. The worker replaces the runners of each repo it
+#   polls; webhook deliveries (handled by any API process) upsert single
+#   runners.
+# - runner-state holds one {_id: "current"} document: a version bumped on
+#   every snapshot change, the worker's poller status and webhook activity.
+# - Each API process follows the version every RUNNER_SNAPSHOT_REFRESH
+#   seconds and reloads its in-memory runner_status_cache (and pushes the
+#   diff to its stream clients) only when it changed.
+
+import asyncio
+import logging
+
+from backend.app.app_def import (
+    DB_NAME_RUNNERS,
+    DB_COLLECTION_RUNNERS_STATS_CURRENT,
+    DB_COLLECTION_RUNNERS_STATE,
+    RUNNER_POLLER_STATUS,
+    RUNNER_SNAPSHOT_REFRESH,
+    RUNNER_STATUS_CACHE,
+    RUNNER_STREAM_BROKER
+)
+from backend.db.db import DatabaseClient
+
+STATE_ID = "current"
+
+
+async def load_runner_snapshot(db: DatabaseClient) -> dict:
+    """ Latest status of every runner, keyed by name. """
+
+    docs = await db.find(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATS_CURRENT.name, {},
+                         projection={"_id": 0, "runner": 1})
+
+    return {doc["runner"]["name"]: doc["runner"] for doc in docs}
+
+
+async def load_runner(db: DatabaseClient, name: str) -> dict | None:
+    """ Latest status of one runner. """
+
+    doc = await db.find_one(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATS_CURRENT.name,
+                            {"name": name}, projection={"_id": 0, "runner": 1})
+
+    return doc["runner"] if doc else None
+
+
+async def load_runner_state(db: DatabaseClient) -> dict:
+    """ Snapshot version, poller status and webhook activity. """
+
+    return await db.find_one(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATE.name,
+                             {"_id": STATE_ID}) or {}
+
+
+async def save_runner_snapshot(db: DatabaseClient, runners_by_repo: dict[str, list]) -> None:
+    """ Replace the current runners of the given repos and bump the snapshot version. """
+
+    names = [r["name"] for runners in runners_by_repo.values() for r in runners]
+
+    # Runners gone from a polled repo (including ones only seen in webhooks)
+    await db.delete(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATS_CURRENT.name,
+                    {"repo": {"$in": list(runners_by_repo)}, "name": {"$nin": names}})
+
+    await db.bulk_update(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATS_CURRENT.name,
+                         [({"name": r["name"]}, {"name": r["name"], "repo": repo, "runner": r})
+                          for repo, runners in runners_by_repo.items() for r in runners],
+                         upsert=True)
+
+    await db.increment(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATE.name,
+                       {"version": 1}, {"_id": STATE_ID}, upsert=True)
+
+
+async def save_webhook_event(db: DatabaseClient, runner: dict | None, repo: str, ts: float) -> None:
+    """ Record a webhook event and upsert the runner it updated, if any. """
+
+    counters = {"webhook.events": 1}
+
+    if runner is not None:
+        await db.bulk_update(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATS_CURRENT.name,
+                             [({"name": runner["name"]}, {"name": runner["name"], "repo": repo, "runner": runner})],
+                             upsert=True)
+        counters["version"] = 1
+
+    await db.increment(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATE.name,
+                       counters, {"_id": STATE_ID}, {"webhook.last_event_ts": ts}, upsert=True)
+
+
+async def save_poller_status(db: DatabaseClient, status: dict) -> None:
+    """ Publish the worker's poller status for the API processes. """
+
+    await db.increment(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_STATE.name,
+                       {"poller_passes": 1}, {"_id": STATE_ID}, {"poller": status}, upsert=True)
+
+
+async def follow_runner_snapshot(app: object,
+                                 db: DatabaseClient,
+                                 interval: float = RUNNER_SNAPSHOT_REFRESH):
+    """ Keep this process's runner cache in step with the shared snapshot - runs in background """
+
+    version = None
+
+    while True:
+        try:
+            state = await load_runner_state(db)
+            setattr(app.state, RUNNER_POLLER_STATUS, {**state.get("poller", {}),
+                                                      "webhook": state.get("webhook", {})})
+
+            if state.get("version") != version:
+                snapshot = await load_runner_snapshot(db)
+                previous = getattr(app.state, RUNNER_STATUS_CACHE, None) or {}
+                setattr(app.state, RUNNER_STATUS_CACHE, snapshot)
+                version = state.get("version")
+
+                # Push what changed to this process's stream clients
+                broker = getattr(app.state, RUNNER_STREAM_BROKER, None)
+                if broker is not None:
+                    broker.publish(previous, snapshot)
+
+        except Exception as e:
+            logging.warning(f"Error refreshing runner snapshot: {e}")
+
+        await asyncio.sleep(interval)
@@ -0,0 +1,96 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/runner_stream.py
+#
+# Fan-out of runner status changes to Server-Sent Events clients.
+#
+# Every writer of the runner status cache (poller pass, webhook event)
+# publishes the diff between the old and new cache: runners added, removed
+# or changed (busy, status or job fields). Each connected client owns a
+# bounded queue. A client that falls RUNNER_STREAM_QUEUE_SIZE diffs behind
+# has its backlog dropped and is sent a fresh snapshot instead, so a slow
+# consumer costs at most one queue of memory.
+
+import asyncio
+import contextlib
+import logging
+
+from backend.app.app_def import RUNNER_STREAM_QUEUE_SIZE
+from backend.app.responses import encode_json
+
+# Fields whose change is pushed to clients (queried_ts alone changes every poll)
+RUNNER_STREAM_FIELDS = ("status", "busy", "designation", "job", "job_url", "job_trigger_user")
+
+# Queued in place of the backlog of a client that fell behind
+RESYNC = None
+
+
+def runner_status_diff(previous: dict, current: dict) -> dict | None:
+    """ Runners added, removed or changed between two caches keyed by name, or None if equal. """
+
+    added = [r for name, r in current.items() if name not in previous]
+    removed = [name for name in previous if name not in current]
+    changed = [r for name, r in current.items()
+               if name in previous and any(r.get(f) != previous[name].get(f) for f in RUNNER_STREAM_FIELDS)]
+
+    if not (added or removed or changed):
+        return None
+
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def sse_event(event: str, data) -> str:
+    """ Format one Server-Sent Events message. """
+
+    return f"event: {event}\ndata: {encode_json(data).decode()}\n\n"
+
+
+class RunnerStatusBroker:
+    """ Publishes runner status diffs to every subscribed stream. """
+
+    def __init__(self, queue_size: int = RUNNER_STREAM_QUEUE_SIZE):
+        self._queue_size = queue_size
+        self._subscribers = set()
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @contextlib.contextmanager
+    def subscribe(self):
+        """ Register a bounded queue receiving diffs until the block exits. """
+
+        queue = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+
+        try:
+            yield queue
+
+        finally:
+            self._subscribers.discard(queue)
+
+    def publish(self, previous: dict, current: dict) -> dict | None:
+        """ Push the diff between two runner caches to every subscriber. """
+
+        diff = runner_status_diff(previous, current)
+        if diff is None:
+            return None
+
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(diff)
+
+            except asyncio.QueueFull:
+                # Slow consumer: drop its backlog, it gets a snapshot instead
+                logging.debug("Runner stream subscriber fell behind, resyncing")
+                while not queue.empty():
+                    queue.get_nowait()
+
+                queue.put_nowait(RESYNC)
+
+        return diff
@@ -0,0 +1,173 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/runner_usage.py
+#
+# Incrementally maintained runner usage rollups.
+#
+# Whenever a new sample of a runner arrives (poll or webhook event), the
+# time since its previous sample is credited to the previous state:
+# busy minutes per runner, designation, job path and triggering user, and
+# online / offline minutes per runner. Each credit is a $inc upsert on a
+# {key, day} document, so usage reports read one document per key and day
+# instead of scanning raw samples. Gaps longer than RUNNER_USAGE_MAX_GAP
+# (e.g. while the backend was down) are not credited.
+#
+# timestamp-stats keeps the fleet's busy / online / total counts per poll.
+
+import asyncio
+import datetime
+
+from backend.app.app_def import (
+    RUNNER_USAGE_MAX_GAP,
+    DB_NAME_RUNNERS,
+    DB_COLLECTION_RUNNERS_TIMESTAMP_STATS,
+    DB_COLLECTION_RUNNERS_BUSY_STATS,
+    DB_COLLECTION_RUNNERS_BUSY_STATS_BY_JOB,
+    DB_COLLECTION_RUNNERS_ONLINE_STATS,
+    DB_COLLECTION_USER_LEADERBOARD_STATS
+)
+from backend.db.db import DatabaseClient
+
+# Dimension -> (collection, fixed query fields, runner field holding the key)
+BUSY_DIMENSIONS = {
+    "runner": (DB_COLLECTION_RUNNERS_BUSY_STATS.name, {"by": "runner"}, "name"),
+    "designation": (DB_COLLECTION_RUNNERS_BUSY_STATS.name, {"by": "designation"}, "designation"),
+    "job": (DB_COLLECTION_RUNNERS_BUSY_STATS_BY_JOB.name, {}, "job"),
+    "user": (DB_COLLECTION_USER_LEADERBOARD_STATS.name, {}, "job_trigger_user")
+}
+
+
+def day_spans(start: float, end: float) -> list[tuple[datetime.datetime, float]]:
+    """ Split [start, end) epoch seconds into (UTC day, minutes) pieces. """
+
+    spans = []
+    ts = datetime.datetime.fromtimestamp(start, datetime.timezone.utc)
+    end = datetime.datetime.fromtimestamp(end, datetime.timezone.utc)
+
+    while ts < end:
+        day = ts.replace(hour=0, minute=0, second=0, microsecond=0)
+        until = min(day + datetime.timedelta(days=1), end)
+        spans.append((day, (until - ts).total_seconds() / 60))
+        ts = until
+
+    return spans
+
+
+def usage_increments(previous: dict | None, current: dict) -> dict[str, list]:
+    """ $inc upserts crediting the time between two samples of a runner to the previous state. """
+
+    if previous is None:
+        return {}
+
+    elapsed = current["queried_ts"] - previous["queried_ts"]
+    if elapsed <= 0 or elapsed > RUNNER_USAGE_MAX_GAP:
+        return {}
+
+    increments = {}
+    for day, minutes in day_spans(previous["queried_ts"], current["queried_ts"]):
+        field = "online_minutes" if previous["status"] == "online" else "offline_minutes"
+        increments.setdefault(DB_COLLECTION_RUNNERS_ONLINE_STATS.name, []).append(
+            ({"key": previous["name"], "day": day}, {field: minutes}))
+
+        if not previous["busy"]:
+            continue
+
+        for table, query, key_field in BUSY_DIMENSIONS.values():
+            key = previous.get(key_field)
+            if key in (None, "-"):
+                continue
+
+            increments.setdefault(table, []).append(
+                ({**query, "key": key, "day": day}, {"busy_minutes": minutes}))
+
+    return increments
+
+
+async def save_runner_usage(db: DatabaseClient, samples: list[tuple[dict | None, dict]]) -> None:
+    """ Credit (previous, current) sample pairs to the usage rollups, one bulk write per collection. """
+
+    # Sum credits hitting the same document before writing
+    merged = {}
+    for previous, current in samples:
+        for table, increments in usage_increments(previous, current).items():
+            for query, counters in increments:
+                doc_key = (table, tuple(sorted(query.items())))
+                entry = merged.setdefault(doc_key, (query, {}))
+                for field, value in counters.items():
+                    entry[1][field] = entry[1].get(field, 0) + value
+
+    by_table = {}
+    for (table, _), (query, counters) in merged.items():
+        by_table.setdefault(table, []).append(
+            (query, {field: round(value, 3) for field, value in counters.items()}))
+
+    await asyncio.gather(*[
+        db.bulk_increment(DB_NAME_RUNNERS.name, table, increments)
+        for table, increments in by_table.items()
+    ])
+
+
+async def save_fleet_snapshot(db: DatabaseClient, runners: list, ts: float) -> None:
+    """ Record the fleet's busy / online / total runner counts at ts. """
+
+    await db.create(DB_NAME_RUNNERS.name,
+                    DB_COLLECTION_RUNNERS_TIMESTAMP_STATS.name,
+                    {"ts": datetime.datetime.fromtimestamp(ts, datetime.timezone.utc),
+                     "busy": sum(1 for r in runners if r["busy"]),
+                     "online": sum(1 for r in runners if r["status"] == "online"),
+                     "total": len(runners)})
+
+
+async def usage_leaderboard(db: DatabaseClient,
+                            dimension: str,
+                            start: datetime.datetime,
+                            end: datetime.datetime,
+                            limit: int) -> list:
+    """ Keys of a dimension ranked by usage minutes over the days in [start, end). """
+
+    if dimension == "online":
+        table, query = DB_COLLECTION_RUNNERS_ONLINE_STATS.name, {}
+        fields = ("online_minutes", "offline_minutes")
+
+    else:
+        table, query, _ = BUSY_DIMENSIONS[dimension]
+        fields = ("busy_minutes",)
+
+    pipeline = [
+        {"$match": {**query, "day": {"$gte": start, "$lt": end}}},
+        {"$group": {"_id": "$key", **{field: {"$sum": f"${field}"} for field in fields}}},
+        {"$sort": {fields[0]: -1, "_id": 1}},
+        {"$limit": limit},
+        {"$project": {"_id": 0, "key": "$_id", **{field: {"$round": [f"${field}", 1]} for field in fields}}}
+    ]
+
+    return await db.aggregate(DB_NAME_RUNNERS.name, table, pipeline)
+
+
+async def fleet_timeline(db: DatabaseClient,
+                         start: datetime.datetime,
+                         end: datetime.datetime,
+                         unit: str,
+                         bin_size: int = 1) -> dict:
+    """ Average busy / online / total runner counts per bucket, as parallel arrays. """
+
+    fields = ("busy", "online", "total")
+    pipeline = [
+        {"$match": {"ts": {"$gte": start, "$lt": end}}},
+        {"$group": {"_id": {"$dateTrunc": {"date": "$ts", "unit": unit, "binSize": bin_size}},
+                    **{field: {"$avg": f"${field}"} for field in fields}}},
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": None,
+                    "ts": {"$push": {"$toLong": {"$divide": [{"$toLong": "$_id"}, 1000]}}},
+                    **{field: {"$push": {"$round": [f"${field}", 1]}} for field in fields}}},
+        {"$project": {"_id": 0}}
+    ]
+
+    result = await db.aggregate(DB_NAME_RUNNERS.name, DB_COLLECTION_RUNNERS_TIMESTAMP_STATS.name, pipeline)
+
+    return result[0] if result else {"ts": [], **{field: [] for field in fields}}
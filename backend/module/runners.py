@@ -6,152 +6,304 @@
 # ================================================================
 
 import asyncio
-import copy
 import logging
 import time
-
-import requests
+from dataclasses import (
+    dataclass,
+    field
+)
 
 from backend.app.app_def import (
-    GITHUB_API_URL,
-    GITHUB_OWNER,
-    GITHUB_TOKEN,
     GITHUB_REPOSITORY,
-    DB_NAME_RUNNERS,
-    DB_COLLECTION_RUNNERS_STATS_HISTORIC,
-    API_QUERY_INTERVAL
+    API_QUERY_INTERVAL,
+    RUNNER_RECONCILE_INTERVAL,
+    RUNNER_WEBHOOK_TIMEOUT
 )
 from backend.db.mongodb import MongoClient
-from backend.models.runner import Runner
+from backend.module.github import (
+    GitHubClient,
+    GitHubError,
+    RequestStats
+)
+from backend.module.runner_history import (
+    RunnerHistoryRollup,
+    save_runner_history
+)
+from backend.module.runner_state import (
+    load_runner_snapshot,
+    load_runner_state,
+    save_poller_status,
+    save_runner_snapshot
+)
+from backend.module.runner_usage import (
+    save_fleet_snapshot,
+    save_runner_usage
+)
 
 
-def query_github_runners(repo: str):
-    """ get github runners info """
+def runner_designation(labels: list) -> str:
+    """ get runner designation from its type:<designation> label """
 
-    # Get all self-hosted runners for the repository
-    resp = requests.get(url=f"{GITHUB_API_URL}/repos/{GITHUB_OWNER}/{repo}/actions/runners",
-                        headers={'Authorization': f'bearer {GITHUB_TOKEN}'},
-                        params={"per_page": 100})
+    for item in labels:
+        if "type:" in item["name"]:
+            return item["name"].split(":")[-1]
 
-    # Check for request success
-    if resp.status_code != 200:
-        logging.debug(resp.content)
-        return []
+    return "-"
 
-    return resp.json()["runners"]
 
+def process_runner_status(runners: list, jobs: list, ts: float) -> list:
+    """ annotate runners with designation and the job they are running """
 
-def query_github_jobs(repo: str):
-    """ get workflow in_progress jobs """
+    # Index jobs by the runner they are assigned to
+    jobs_by_runner = {}
+    for job in jobs:
+        jobs_by_runner.setdefault(job.get("runner_id"), job)
+
+    for runner in runners:
+        # Add info fields
+        runner["queried_ts"] = int(ts)
+
+        # Set additional job fields
+        runner["job"] = "-"
+        runner["job_url"] = "-"
+        runner["job_trigger_user"] = "-"
+
+        # Get runner designation from labels
+        runner["designation"] = runner_designation(runner.get("labels", []))
+
+        if runner["busy"]:
+            # Runner is currently running a job
+            job = jobs_by_runner.get(runner["id"])
+            if job is not None:
+                runner["job"] = job["path"]
+                runner["job_url"] = job["html_url"]
+                runner["job_trigger_user"] = job["triggering_actor"]["login"]
+
+    return runners
+
+
+@dataclass
+class RepoPollState:
+    interval: float
+    next_poll_ts: float = 0.0
+    last_poll_ts: float | None = None
+    last_duration: float | None = None
+    last_stats: RequestStats = field(default_factory=RequestStats)
+    failed_polls: int = 0
+    runners: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {"interval": round(self.interval, 2),
+                "next_poll_ts": int(self.next_poll_ts),
+                "last_poll_ts": None if self.last_poll_ts is None else int(self.last_poll_ts),
+                "last_duration": self.last_duration,
+                "last_requests": self.last_stats.to_dict(),
+                "failed_polls": self.failed_polls,
+                "runners": len(self.runners)}
+
+
+class RunnerPoller:
+    """ Polls each repo on its own schedule, paced by the GitHub rate limit.
+
+    A repo is polled every interval seconds while the remaining budget allows
+    it. When its last poll cost more than its share of the requests left in
+    the rate-limit window, its interval is stretched (up to the reset time) so
+    the budget lasts until the window resets. Requests answered with a 304
+    are free, so unchanged repos keep the base interval.
+    """
+
+    def __init__(self,
+                 client: GitHubClient,
+                 repositories: list | None = None,
+                 interval: float = API_QUERY_INTERVAL):
+        """ Initialize per-repo poll state. """
+
+        repositories = GITHUB_REPOSITORY if repositories is None else repositories
+
+        self.client = client
+        self.interval = interval
+        self.repos = {repo: RepoPollState(interval=interval) for repo in repositories}
+        self.last_poll_ts = None
+        self.last_poll_duration = None
+
+    def set_interval(self, interval: float):
+        """ Change the base interval, rescheduling every repo from its last poll. """
+
+        if interval == self.interval:
+            return
+
+        self.interval = interval
+        for state in self.repos.values():
+            state.interval = interval
+            if state.last_poll_ts is not None:
+                state.next_poll_ts = state.last_poll_ts + interval
+
+    def repo_interval(self, cost: int, now: float) -> float:
+        """ Interval until the next poll of a repo whose last poll cost cost requests. """
+
+        rate_limit = self.client.rate_limit
+        if rate_limit.remaining is None or rate_limit.reset is None:
+            return self.interval
+
+        reset_in = max(rate_limit.reset - now, 1)
+        if rate_limit.remaining == 0:
+            return max(self.interval, reset_in)
+
+        # Spread each repo's share of the remaining budget over the window
+        share = rate_limit.remaining / max(len(self.repos), 1)
+        interval = reset_in * max(cost, 1) / share
+
+        return max(self.interval, min(interval, reset_in))
+
+    async def _poll_repo(self, repo: str) -> bool:
+        """ Poll runners and in-progress jobs of one repo and reschedule it.
+
+        Returns whether the poll succeeded. A failed poll keeps the repo's last
+        runners, so an outage or exhausted rate limit never empties the fleet.
+        """
+
+        state = self.repos[repo]
+        stats = RequestStats()
+        ts = time.time()
 
-    # Define parameters to filter for in_progress workflow runs
-    params = {"per_page": 100, "status": "in_progress"}
+        results = await asyncio.gather(self.client.get_runners(repo, stats),
+                                       self.client.get_in_progress_jobs(repo, stats),
+                                       return_exceptions=True)
 
-    # Get all in_progress workflow runs
-    resp = requests.get(url=f"{GITHUB_API_URL}/repos/{GITHUB_OWNER}/{repo}/actions/runs",
-                        headers={'Authorization': f'bearer {GITHUB_TOKEN}'},
-                        params=params)
+        now = time.time()
+        state.last_stats = stats
+        state.interval = self.repo_interval(stats.cost, now)
+        state.next_poll_ts = ts + state.interval
 
-    # Check for request success
-    if resp.status_code != 200:
-        logging.debug(resp.content)
-        return []
+        errors = [result for result in results if isinstance(result, Exception)]
+        for error in errors:
+            if not isinstance(error, GitHubError):
+                raise error
 
-    jobs = resp.json()["workflow_runs"]
-    running_jobs = []
-    for job in jobs:
-        resp = requests.get(url=job["jobs_url"],
-                            headers={'Authorization': f'bearer {GITHUB_TOKEN}'},
-                            params=params)
+        if errors:
+            state.failed_polls += 1
+            logging.warning(f"Polling runners of {repo} failed, keeping the last status: {errors[0]}")
+            return False
 
-        if resp.status_code != 200:
-            logging.debug(resp.content)
+        runners, jobs = results
+        state.runners = process_runner_status(runners, jobs, ts)
+        state.last_poll_ts = ts
+        state.last_duration = round(now - ts, 3)
 
-        # Append job info to each job item
-        data = resp.json()["jobs"]
-        for item in data:
-            item.update(job)
+        return True
 
-        running_jobs += data
+    async def poll(self, now: float | None = None) -> list:
+        """ Poll every repo that is due, returning the names of those polled successfully. """
 
-    return running_jobs
+        now = time.time() if now is None else now
+        due = [repo for repo, state in self.repos.items() if state.next_poll_ts <= now]
+        if not due:
+            return []
 
+        logging.debug(f"Getting runner status for {len(due)} repos...")
 
-def fetch_runner_status():
-    """ fetch runner status from GitHub """
+        ts = time.time()
+        polled = await asyncio.gather(*[self._poll_repo(repo) for repo in due])
 
-    try:
-        # Get runner status from GitHub APIs
-        logging.debug(f"Getting runner status...")
+        self.last_poll_ts = ts
+        self.last_poll_duration = round(time.time() - ts, 3)
 
-        runners = []
-        jobs = []
-        ts = time.time()
-        for repo in GITHUB_REPOSITORY:
-            runners += query_github_runners(repo)
-            jobs += query_github_jobs(repo)
-
-        logging.debug(f"Runner status query completed in "
-                      f"{round(time.time() - ts, 2)} seconds. "
-                      f"Total: {len(runners)} runners, {len(jobs)} jobs")
-
-        # Process runner data
-        for runner in runners:
-            # Add info fields
-            runner["queried_ts"] = int(ts)
-
-            # Set additional job fields
-            runner["job"] = "-"
-            runner["job_url"] = "-"
-            runner["job_trigger_user"] = "-"
-
-            # Get runner designation from labels
-            runner["designation"] = "-"
-            runner_labels = runner.get("labels", [])
-            for item in runner_labels:
-                if "type:" in item["name"]:
-                    runner["designation"] = item["name"].split(":")[-1]
-                    break
-
-            if runner["busy"]:
-                # Runner is currently running a job
-                # Find the job assigned to this runner
-                for job in jobs:
-                    if job['runner_id'] == runner['id']:
-                        runner["job"] = job["path"]
-                        runner["job_url"] = job["html_url"]
-                        runner["job_trigger_user"] = job["triggering_actor"]["login"]
-                        break
-
-        return runners
+        logging.debug(f"Runner status query completed in {self.last_poll_duration} seconds, "
+                      f"rate limit remaining {self.client.rate_limit.remaining}")
 
-    except Exception as err:
-        logging.warning(f"Exception occurred {err}", exc_info=True)
-        return []
+        return [repo for repo, ok in zip(due, polled) if ok]
 
+    def runner_status(self, repos: list | None = None) -> list:
+        """ Latest runner status of the given repos (default all). """
 
-async def save_runner_status(app: object,
-                             mdb: MongoClient,
-                             interval: int = API_QUERY_INTERVAL):
-    """ save runner status to mongodb - runs periodically in background """
+        repos = self.repos if repos is None else repos
+
+        return [r for repo in repos for r in self.repos[repo].runners]
+
+    def next_poll_in(self) -> float:
+        """ Seconds until the next repo is due. """
+
+        if not self.repos:
+            return self.interval
+
+        next_poll_ts = min(state.next_poll_ts for state in self.repos.values())
+
+        return max(next_poll_ts - time.time(), 0)
+
+    def status(self) -> dict:
+        """ Poller status: last poll duration, remaining rate-limit budget and per-repo schedule. """
 
-    while True:
-        try:
-            # Fetch runner status from GitHub
-            status = fetch_runner_status()
+        return {"interval": self.interval,
+                "last_poll_ts": None if self.last_poll_ts is None else int(self.last_poll_ts),
+                "last_poll_duration": self.last_poll_duration,
+                "rate_limit": self.client.rate_limit.to_dict(),
+                "requests": self.client.stats.to_dict(),
+                "repos": {repo: state.to_dict() for repo, state in self.repos.items()}}
 
-            # Save status to app state cache as dict keyed by runner name
-            app.state.runner_status_cache = {r["name"]: copy.deepcopy(r) for r in status}
 
-            # Save runner status to historic and current collections
-            for item in status:
-                data = Runner(**item).model_dump()
-                await mdb.create(DB_NAME_RUNNERS.name,
-                                 DB_COLLECTION_RUNNERS_STATS_HISTORIC.name,
-                                 data)
+async def fetch_runner_status(client: GitHubClient,
+                              repositories: list = None) -> list:
+    """ fetch runner status of every repo from GitHub once """
 
-        except Exception as e:
-            logging.error(f"Error saving runner status: {e}", exc_info=True)
+    try:
+        poller = RunnerPoller(client, repositories)
+        await poller.poll()
+
+        return poller.runner_status()
+
+    except Exception as err:
+        logging.warning(f"Exception occurred {err}", exc_info=True)
+        return []
 
-        # Use asyncio.sleep instead of time.sleep to not block event loop
-        await asyncio.sleep(interval)
+
+async def save_runner_status(mdb: MongoClient,
+                             interval: int = API_QUERY_INTERVAL):
+    """ save runner status to mongodb - runs periodically in the background worker """
+
+    # One pooled client for the lifetime of the poller keeps connections alive
+    async with GitHubClient() as client:
+        poller = RunnerPoller(client, interval=interval)
+        rollup = RunnerHistoryRollup()
+
+        while True:
+            reconcile = False
+
+            try:
+                # Only reconcile slowly while webhooks (received by the API processes)
+                # keep the shared snapshot current
+                webhook = (await load_runner_state(mdb)).get("webhook", {})
+                reconcile = time.time() - (webhook.get("last_event_ts") or 0) < RUNNER_WEBHOOK_TIMEOUT
+                poller.set_interval(RUNNER_RECONCILE_INTERVAL if reconcile else interval)
+
+                # Fetch runner status of the repos that are due from GitHub
+                polled = await poller.poll()
+
+                if polled:
+                    # Replace the shared runners of polled repos (including ones added by
+                    # webhooks), keeping the other repos' entries as they are
+                    previous = await load_runner_snapshot(mdb)
+                    fresh = poller.runner_status(polled)
+                    await save_runner_snapshot(mdb, {repo: poller.repos[repo].runners for repo in polled})
+                    current = await load_runner_snapshot(mdb)
+
+                    # Save freshly polled runner status to historic collection and usage rollups
+                    await asyncio.gather(
+                        save_runner_history(mdb, fresh),
+                        save_runner_usage(mdb, [(previous.get(r["name"]), r) for r in fresh]),
+                        save_fleet_snapshot(mdb, list(current.values()), poller.last_poll_ts)
+                    )
+
+                await rollup.run(mdb)
+
+            except Exception as e:
+                logging.error(f"Error saving runner status: {e}", exc_info=True)
+
+            try:
+                await save_poller_status(mdb, {**poller.status(), "reconcile": reconcile})
+
+            except Exception as e:
+                logging.warning(f"Error saving poller status: {e}")
+
+            # Wake at least every base interval to notice webhooks starting or stopping.
+            # Use asyncio.sleep instead of time.sleep to not block event loop
+            await asyncio.sleep(min(max(poller.next_poll_in(), 1), interval))
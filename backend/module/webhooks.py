@@ -0,0 +1,91 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# module/webhooks.py
+#
+# GitHub webhook ingestion for runner status.
+#
+# workflow_job deliveries carry the runner a job was assigned to, so the
+# runner status cache can be updated the moment a job starts or finishes
+# instead of waiting for the next poll. Every delivery is authenticated
+# with the X-Hub-Signature-256 HMAC of the raw body and the shared
+# GITHUB_WEBHOOK_SECRET.
+#
+# While events keep arriving the poller only reconciles slowly (runners
+# coming online or going away are not announced by workflow_job events).
+
+import hashlib
+import hmac
+import time
+
+from backend.module.runners import runner_designation
+
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+EVENT_HEADER = "X-GitHub-Event"
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """ X-Hub-Signature-256 header value of a payload. """
+
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: str | None) -> bool:
+    """ Check a delivery's signature in constant time. """
+
+    if not secret or not signature:
+        return False
+
+    return hmac.compare_digest(sign_payload(secret, body), signature)
+
+
+def apply_workflow_job(cache: dict, payload: dict, ts: float | None = None) -> dict | None:
+    """ Apply a workflow_job event to the runner status cache.
+
+    Returns the updated runner, or None if the event does not change any
+    runner (queued/waiting jobs, or jobs without an assigned runner).
+    """
+
+    action = payload.get("action")
+    job = payload.get("workflow_job") or {}
+    name = job.get("runner_name")
+
+    if action not in ("in_progress", "completed") or not name:
+        return None
+
+    ts = time.time() if ts is None else ts
+    labels = [{"name": label} for label in job.get("labels", [])]
+
+    # Runners not seen by a poll yet are added from the event
+    runner = dict(cache.get(name) or {
+        "id": job.get("runner_id"),
+        "name": name,
+        "os": "-",
+        "status": "online",
+        "labels": labels,
+        "designation": runner_designation(labels)
+    })
+
+    runner["queried_ts"] = int(ts)
+    runner["status"] = "online"
+
+    if action == "in_progress":
+        # Events do not carry the workflow file path, the next poll fills it in
+        runner["busy"] = True
+        runner["job"] = job.get("workflow_name") or "-"
+        runner["job_url"] = job.get("html_url") or "-"
+        runner["job_trigger_user"] = (payload.get("sender") or {}).get("login", "-")
+
+    else:
+        runner["busy"] = False
+        runner["job"] = "-"
+        runner["job_url"] = "-"
+        runner["job_trigger_user"] = "-"
+
+    cache[name] = runner
+
+    return runner
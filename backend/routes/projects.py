@@ -15,7 +15,6 @@ from fastapi import (
     status,
     Response
 )
-from starlette.responses import JSONResponse
 
 from backend.app.app_def import (
     API_VERSION,
@@ -26,11 +25,14 @@ from backend.app.app_def import (
     DB_NAME_TM
 )
 from backend.app.cache import (
-    cache_get,
-    cache_set,
-    cache_invalidate,
-    cache_invalidate_prefix
+    cache_get_or_compute,
+    cache_tag,
+    cached_response,
+    cache_invalidate_tags,
+    project_tags,
+    test_case_tags
 )
+from backend.app.responses import JSONResponse
 from backend.app.utility import (
     get_current_utc_time
 )
@@ -56,30 +58,15 @@ DB_COLLECTION_TM_TCY = DB_COLLECTION_TM_TCY.name
 async def get_all_projects(request: Request):
     """Endpoint to get projects"""
 
-    cached = cache_get("projects:all")
-    if cached is not None:
-        return JSONResponse(status_code=status.HTTP_200_OK, content=cached)
-
     db = request.app.state.mdb
 
-    # Retrieve all projects from database
-    projects = await db.find(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {})
+    async def fetch():
+        # Retrieve all projects in key order; counts are maintained on the project documents
+        return await db.find(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {}, sort=[("project_key", 1)])
 
-    # Concurrently fetch test case and cycle counts for all projects
-    async def fetch_counts(project):
-        tc_count, tcy_count = await asyncio.gather(
-            db.count(DB_NAME_TM, DB_COLLECTION_TM_TC, {"project_key": project["project_key"]}),
-            db.count(DB_NAME_TM, DB_COLLECTION_TM_TCY, {"project_key": project["project_key"]})
-        )
-        project["test_case_count"] = tc_count
-        project["test_cycle_count"] = tcy_count
-        return project
+    projects = await cache_get_or_compute("projects:all", fetch, (cache_tag(DB_COLLECTION_TM_PRJ),))
 
-    projects = list(await asyncio.gather(*[fetch_counts(p) for p in projects]))
-
-    cache_set("projects:all", projects)
-    return JSONResponse(status_code=status.HTTP_200_OK,
-                        content=projects)
+    return cached_response(request, projects)
 
 
 @router.post(f"/api/{API_VERSION}/tm/projects",
@@ -119,6 +106,7 @@ async def create_project_by_key(request: Request,
     request_data["updated_at"] = current_time
     request_data["test_case_count"] = 0
     request_data["test_cycle_count"] = 0
+    request_data["test_execution_count"] = 0
 
     # Assign _id
     db_insert = Project(**request_data).model_dump()
@@ -128,7 +116,7 @@ async def create_project_by_key(request: Request,
     await db.create(DB_NAME_TM, DB_COLLECTION_TM_PRJ, db_insert)
 
     # Invalidate project list cache so next GET sees the new project
-    cache_invalidate("projects:all")
+    await cache_invalidate_tags(*project_tags(project_key))
 
     return JSONResponse(status_code=status.HTTP_201_CREATED,
                         content=request_data)
@@ -142,19 +130,14 @@ async def get_project_by_key(request: Request,
                              project_key: str):
     """Endpoint to get project"""
 
-    cache_key = f"projects:{project_key}"
-    cached = cache_get(cache_key)
-    if cached is not None:
-        return JSONResponse(status_code=status.HTTP_200_OK, content=cached)
-
     db = request.app.state.mdb
 
-    # Concurrently fetch project, test case count, and cycle count
-    project, tc_count, tcy_count = await asyncio.gather(
-        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key}),
-        db.count(DB_NAME_TM, DB_COLLECTION_TM_TC, {"project_key": project_key}),
-        db.count(DB_NAME_TM, DB_COLLECTION_TM_TCY, {"project_key": project_key})
-    )
+    async def fetch():
+        # Retrieve project; counts are maintained on the project document
+        return await db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key})
+
+    project = await cache_get_or_compute(f"projects:{project_key}", fetch,
+                                         (cache_tag(DB_COLLECTION_TM_PRJ, project_key),))
 
     if project is None:
         return JSONResponse(
@@ -162,13 +145,7 @@ async def get_project_by_key(request: Request,
             content={"error": f"{project_key} not found"}
         )
 
-    # Assign counts to project
-    project["test_case_count"] = tc_count
-    project["test_cycle_count"] = tcy_count
-
-    cache_set(cache_key, project)
-    return JSONResponse(status_code=status.HTTP_200_OK,
-                        content=project)
+    return cached_response(request, project)
 
 
 @router.put(f"/api/{API_VERSION}/tm/projects/{{project_key}}",
@@ -204,16 +181,7 @@ async def update_project_by_key(request: Request,
             content={"error": f"Duplicate labels are not allowed"}
         )
 
-    # Concurrently fetch test case and cycle counts
-    tc_count, tcy_count = await asyncio.gather(
-        db.count(DB_NAME_TM, DB_COLLECTION_TM_TC, {"project_key": project_key}),
-        db.count(DB_NAME_TM, DB_COLLECTION_TM_TCY, {"project_key": project_key})
-    )
-
-    request_data["test_case_count"] = tc_count
-    request_data["test_cycle_count"] = tcy_count
-
-    # Update project in DB then fetch updated doc concurrently
+    # Update project in DB then fetch updated doc
     await db.update(DB_NAME_TM, DB_COLLECTION_TM_PRJ, request_data, {
         "project_key": project_key
     })
@@ -223,7 +191,7 @@ async def update_project_by_key(request: Request,
     })
 
     # Invalidate stale cached entries for this project
-    cache_invalidate("projects:all", f"projects:{project_key}")
+    await cache_invalidate_tags(*project_tags(project_key))
 
     return JSONResponse(status_code=status.HTTP_200_OK,
                         content=updated_project)
@@ -287,7 +255,6 @@ async def delete_project_by_key(request: Request,
     })
 
     # Invalidate all project-related cache entries
-    cache_invalidate("projects:all", f"projects:{project_key}")
-    cache_invalidate_prefix(f"test_cases:{project_key}")
+    await cache_invalidate_tags(*project_tags(project_key), *test_case_tags(project_key))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -22,7 +22,6 @@ from fastapi.responses import (
     RedirectResponse,
     StreamingResponse
 )
-from starlette.responses import JSONResponse
 
 from backend.app.app_def import (
     API_VERSION,
@@ -32,7 +31,13 @@ from backend.app.app_def import (
     DB_NAME_RUNNERS,
     DB_RESET_TOKEN
 )
-from backend.app.cache import cache_invalidate_prefix
+from backend.app.cache import (
+    cache_clear,
+    cache_stats
+)
+from backend.app.responses import JSONResponse
+from backend.module.index_audit import audit_query_shapes
+from backend.module.maintenance import repair_all
 
 router = APIRouter()
 
@@ -162,6 +167,59 @@ async def reset_database(request: Request,
     await db.configure(clean_db=db_target_list)
 
     # Clear all in-memory caches so stale data is never served after a reset
-    cache_invalidate_prefix()
+    await cache_clear()
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(f"/api/{API_VERSION}/db-repair",
+             tags=["root"],
+             status_code=status.HTTP_200_OK)
+async def repair_database(request: Request,
+                          db_reset_token: str,
+                          dry_run: bool = False):
+    """ Root endpoint to verify and repair denormalized counters. """
+
+    if db_reset_token != DB_RESET_TOKEN:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST,
+                            content={"error": f"Invalid token for db repair"})
+
+    db = request.app.state.mdb
+
+    report = await repair_all(db, dry_run)
+
+    # Repaired documents may be cached with their drifted values
+    if not dry_run:
+        await cache_clear()
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content=report)
+
+
+@router.get(f"/api/{API_VERSION}/db-index-audit",
+            tags=["root"],
+            status_code=status.HTTP_200_OK)
+async def get_database_index_audit(request: Request,
+                                   db_reset_token: str):
+    """ Root endpoint to explain every registered query shape and flag collection scans. """
+
+    if db_reset_token != DB_RESET_TOKEN:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST,
+                            content={"error": f"Invalid token for db index audit"})
+
+    db = request.app.state.mdb
+
+    report = await audit_query_shapes(db)
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content=report)
+
+
+@router.get(f"/api/{API_VERSION}/cache-stats",
+            tags=["root"],
+            status_code=status.HTTP_200_OK)
+async def get_cache_stats(request: Request):
+    """ Root endpoint to report response cache hit / miss counters of the serving worker. """
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content=cache_stats())
@@ -7,20 +7,60 @@
 
 # routes/runner.py
 
+import asyncio
+import copy
+import datetime
+import json
 import logging
+import time
+from typing import Literal
 
 from fastapi import (
     APIRouter,
+    Query,
     Request,
     status
 )
-from starlette.responses import JSONResponse
+from starlette.responses import StreamingResponse
 
 from backend.app.app_def import (
     API_VERSION,
-    RUNNER_STATUS_CACHE
+    GITHUB_REPOSITORY,
+    GITHUB_WEBHOOK_SECRET,
+    PAGE_LIMIT_MAX,
+    RUNNER_HISTORY_MAX_POINTS,
+    RUNNER_STATUS_CACHE,
+    RUNNER_STREAM_BROKER,
+    RUNNER_STREAM_KEEPALIVE,
+    RUNNER_POLLER_STATUS
 )
+from backend.app.responses import JSONResponse
 from backend.models.runner import Runner
+from backend.module.runner_history import (
+    HISTORY_UNITS,
+    auto_resolution,
+    runner_history,
+    save_runner_history
+)
+from backend.module.runner_state import (
+    load_runner,
+    save_webhook_event
+)
+from backend.module.runner_stream import (
+    RESYNC,
+    sse_event
+)
+from backend.module.runner_usage import (
+    fleet_timeline,
+    save_runner_usage,
+    usage_leaderboard
+)
+from backend.module.webhooks import (
+    EVENT_HEADER,
+    SIGNATURE_HEADER,
+    apply_workflow_job,
+    verify_signature
+)
 
 router = APIRouter()
 
@@ -41,6 +81,52 @@ async def get_runners_status(request: Request):
                         content=list(cache.values()))
 
 
+@router.get(f"/api/{API_VERSION}/runners/stream",
+            tags=["runners"],
+            status_code=status.HTTP_200_OK)
+async def get_runners_stream(request: Request):
+    """ Stream runner status as Server-Sent Events: a snapshot, then diffs as the cache changes. """
+
+    broker = getattr(request.app.state, RUNNER_STREAM_BROKER)
+
+    async def events():
+        with broker.subscribe() as queue:
+            # Subscribed before the snapshot is taken, so no change falls in between
+            snapshot = getattr(request.app.state, RUNNER_STATUS_CACHE, None) or {}
+            yield "retry: 5000\n\n" + sse_event("snapshot", list(snapshot.values()))
+
+            while not await request.is_disconnected():
+                try:
+                    diff = await asyncio.wait_for(queue.get(), timeout=RUNNER_STREAM_KEEPALIVE)
+
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if diff is RESYNC:
+                    snapshot = getattr(request.app.state, RUNNER_STATUS_CACHE, None) or {}
+                    yield sse_event("snapshot", list(snapshot.values()))
+
+                else:
+                    yield sse_event("diff", diff)
+
+    return StreamingResponse(events(),
+                             media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache",
+                                      "X-Accel-Buffering": "no"})
+
+
+@router.get(f"/api/{API_VERSION}/runners/poller",
+            tags=["runners"],
+            status_code=status.HTTP_200_OK)
+async def get_runners_poller_status(request: Request):
+    """ Get the GitHub poller status: last poll duration, rate-limit budget and per-repo schedule. """
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content=getattr(request.app.state, RUNNER_POLLER_STATUS, {}))
+
+
 @router.get(f"/api/{API_VERSION}/runners/status/{{name}}",
             tags=["runners"],
             response_model=Runner,
@@ -63,8 +149,160 @@ async def get_runners_status_by_name(request: Request,
 
 @router.get(f"/api/{API_VERSION}/runners/history/{{name}}",
             tags=["runners"],
-            response_model=Runner,
             status_code=status.HTTP_200_OK)
 async def get_runners_status_history(request: Request,
-                                     name: str):
-    """ Get the status history of runners """
+                                     name: str,
+                                     start: datetime.datetime | None = None,
+                                     end: datetime.datetime | None = None,
+                                     resolution: Literal["auto", "minute", "hour", "day"] = "auto",
+                                     bin_size: int = Query(default=1, ge=1, le=1000)):
+    """ Get the busy / online history of a runner, bucketed server-side into parallel arrays. """
+
+    # Naive timestamps are UTC; default to the last 24 hours
+    end = end or datetime.datetime.now(datetime.timezone.utc)
+    end = end if end.tzinfo else end.replace(tzinfo=datetime.timezone.utc)
+    start = start or end - datetime.timedelta(days=1)
+    start = start if start.tzinfo else start.replace(tzinfo=datetime.timezone.utc)
+
+    if start >= end:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST,
+                            content={"error": "start must be before end"})
+
+    unit = auto_resolution(start, end) if resolution == "auto" else resolution
+    if (end - start) / (HISTORY_UNITS[unit] * bin_size) > RUNNER_HISTORY_MAX_POINTS:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST,
+                            content={"error": f"More than {RUNNER_HISTORY_MAX_POINTS} buckets, "
+                                              f"use a coarser resolution or bin_size"})
+
+    history = await runner_history(request.app.state.mdb, name, start, end, unit, bin_size)
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content=history)
+
+
+@router.get(f"/api/{API_VERSION}/runners/usage/{{dimension}}",
+            tags=["runners"],
+            status_code=status.HTTP_200_OK)
+async def get_runners_usage(request: Request,
+                            dimension: Literal["runner", "designation", "job", "user", "online"],
+                            start: datetime.date | None = None,
+                            end: datetime.date | None = None,
+                            limit: int = Query(default=50, ge=1, le=PAGE_LIMIT_MAX)):
+    """ Get busy minutes per runner / designation / job / user (or online minutes per runner), ranked. """
+
+    # Whole UTC days, end inclusive; default to the last 30 days
+    end = end or datetime.datetime.now(datetime.timezone.utc).date()
+    start = start or end - datetime.timedelta(days=29)
+
+    if start > end:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST,
+                            content={"error": "start must not be after end"})
+
+    items = await usage_leaderboard(request.app.state.mdb, dimension,
+                                    datetime.datetime.combine(start, datetime.time(), datetime.timezone.utc),
+                                    datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time(),
+                                                              datetime.timezone.utc),
+                                    limit)
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content={"dimension": dimension,
+                                 "start": start.isoformat(),
+                                 "end": end.isoformat(),
+                                 "items": items})
+
+
+@router.get(f"/api/{API_VERSION}/runners/fleet",
+            tags=["runners"],
+            status_code=status.HTTP_200_OK)
+async def get_runners_fleet(request: Request,
+                            start: datetime.datetime | None = None,
+                            end: datetime.datetime | None = None,
+                            resolution: Literal["auto", "minute", "hour", "day"] = "auto"):
+    """ Get average busy / online / total runner counts over time as parallel arrays. """
+
+    end = end or datetime.datetime.now(datetime.timezone.utc)
+    end = end if end.tzinfo else end.replace(tzinfo=datetime.timezone.utc)
+    start = start or end - datetime.timedelta(days=1)
+    start = start if start.tzinfo else start.replace(tzinfo=datetime.timezone.utc)
+
+    if start >= end:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST,
+                            content={"error": "start must be before end"})
+
+    unit = auto_resolution(start, end) if resolution == "auto" else resolution
+    if (end - start) / HISTORY_UNITS[unit] > RUNNER_HISTORY_MAX_POINTS:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST,
+                            content={"error": f"More than {RUNNER_HISTORY_MAX_POINTS} buckets, "
+                                              f"use a coarser resolution"})
+
+    timeline = await fleet_timeline(request.app.state.mdb, start, end, unit)
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content={"resolution": unit,
+                                 "start": start.isoformat(),
+                                 "end": end.isoformat(),
+                                 **timeline})
+
+
+@router.post(f"/api/{API_VERSION}/runners/webhook",
+             tags=["runners"],
+             status_code=status.HTTP_200_OK)
+async def post_runners_webhook(request: Request):
+    """ Ingest a GitHub workflow_job webhook delivery into the runner status cache. """
+
+    if not GITHUB_WEBHOOK_SECRET:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            content={"error": "Webhook secret not configured"})
+
+    body = await request.body()
+    if not verify_signature(GITHUB_WEBHOOK_SECRET, body, request.headers.get(SIGNATURE_HEADER)):
+        return JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED,
+                            content={"error": "Invalid signature"})
+
+    try:
+        payload = json.loads(body)
+
+    except ValueError:
+        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST,
+                            content={"error": "Invalid payload"})
+
+    event = request.headers.get(EVENT_HEADER)
+    if event == "ping":
+        return JSONResponse(status_code=status.HTTP_200_OK,
+                            content={"event": event})
+
+    repo = (payload.get("repository") or {}).get("name")
+    if event != "workflow_job" or (GITHUB_REPOSITORY and repo not in GITHUB_REPOSITORY):
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED,
+                            content={"ignored": event})
+
+    ts = time.time()
+    mdb = request.app.state.mdb
+
+    # Apply the event to the shared status of its runner
+    previous = await load_runner(mdb, (payload.get("workflow_job") or {}).get("runner_name"))
+    runner = apply_workflow_job({previous["name"]: previous} if previous else {}, payload, ts)
+
+    # Webhooks are flowing; the worker's poller drops to reconciliation
+    await save_webhook_event(mdb, runner, repo, ts)
+
+    if runner is None:
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED,
+                            content={"ignored": f"{event} {payload.get('action')}"})
+
+    # Update this process right away, other processes follow the shared snapshot
+    cache = dict(getattr(request.app.state, RUNNER_STATUS_CACHE, None) or {})
+    cache[runner["name"]] = runner
+    setattr(request.app.state, RUNNER_STATUS_CACHE, cache)
+
+    # Push the change to stream clients
+    broker = getattr(request.app.state, RUNNER_STREAM_BROKER, None)
+    if broker is not None:
+        broker.publish({previous["name"]: previous} if previous else {}, {runner["name"]: runner})
+
+    # Append the change to the runner history and usage rollups
+    await asyncio.gather(save_runner_history(mdb, [runner]),
+                         save_runner_usage(mdb, [(previous, runner)]))
+
+    return JSONResponse(status_code=status.HTTP_200_OK,
+                        content=copy.deepcopy(runner))
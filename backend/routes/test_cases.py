@@ -13,12 +13,12 @@ from typing import Optional
 
 from fastapi import (
     APIRouter,
+    Depends,
+    Query,
     Request,
     status,
     Response
 )
-from natsort import natsorted
-from starlette.responses import JSONResponse
 
 from backend.app.app_def import (
     API_VERSION,
@@ -26,16 +26,47 @@ from backend.app.app_def import (
     DB_COLLECTION_TM_TC,
     DB_COLLECTION_TM_TE,
     DB_NAME_TM,
+    ListView,
+    PAGE_LIMIT_MAX,
     TC_KEY_PREFIX
 )
 from backend.app.cache import (
-    cache_get,
-    cache_set,
-    cache_invalidate
+    cache_get_or_compute,
+    cached_response,
+    cache_tag,
+    cache_invalidate_tags,
+    project_tags,
+    test_case_tags
+)
+from backend.app.filters import (
+    is_filtered,
+    list_filter_query,
+    list_sort,
+    query_params
+)
+from backend.app.pagination import (
+    find_page,
+    invalid_cursor_response,
+    page_query,
+    page_response
+)
+from backend.app.projections import (
+    invalid_projection_response,
+    list_projection,
+    projection_cache_suffix
+)
+from backend.app.responses import JSONResponse
+from backend.app.streaming import (
+    ndjson_response,
+    wants_ndjson
+)
+from backend.app.utility import (
+    get_current_utc_time,
+    key_sequence
 )
-from backend.app.utility import get_current_utc_time
 from backend.models.test_cases import (
     TestCase,
+    TestCaseListFilter,
     TestCaseCreate,
     TestCaseUpdate
 )
@@ -52,24 +83,47 @@ DB_COLLECTION_TM_TE = DB_COLLECTION_TM_TE.name
             tags=[DB_COLLECTION_TM_TC],
             response_model=list[TestCase],
             status_code=status.HTTP_200_OK)
-async def get_all_test_cases(request: Request):
-    """Get all test cases"""
-
-    cached = cache_get("test_cases:all")
-    if cached is not None:
-        return JSONResponse(status_code=status.HTTP_200_OK, content=cached)
+async def get_all_test_cases(request: Request,
+                             filters: TestCaseListFilter = Depends(query_params(TestCaseListFilter)),
+                             limit: int | None = Query(default=None, ge=1, le=PAGE_LIMIT_MAX),
+                             after: str | None = None,
+                             fields: str | None = None,
+                             view: ListView = ListView.FULL):
+    """Get all test cases, optionally filtered, sorted, one page at a time and only some of their fields"""
 
     db = request.app.state.mdb
 
-    # Retrieve all test cases from database
-    test_cases = await db.find(DB_NAME_TM, DB_COLLECTION_TM_TC, {})
+    # Filters and sort are pushed down to MongoDB, ordered by project then key sequence by default
+    query = list_filter_query(DB_COLLECTION_TM_TC, filters)
+    sort = list_sort(filters.sort, ("project_key", "seq"))
 
-    # Sort test cases by test_case_key using natsort
-    test_cases = natsorted(test_cases, key=lambda x: x.get("test_case_key"))
+    try:
+        projection = list_projection(DB_COLLECTION_TM_TC, fields, view,
+                                     ("test_case_key", *[field for field, _ in sort]))
+    except ValueError as err:
+        return invalid_projection_response(err)
 
-    cache_set("test_cases:all", test_cases)
-    return JSONResponse(status_code=status.HTTP_200_OK,
-                        content=test_cases)
+    async def fetch_page(limit: int | None, after: str | None) -> tuple:
+        # Retrieve test cases in sort order, straight from the index
+        return await find_page(db, DB_NAME_TM, DB_COLLECTION_TM_TC, query, sort, limit, after, projection)
+
+    async def fetch_all() -> list:
+        return (await fetch_page(None, None))[0]
+
+    if limit is None and after is None and not is_filtered(filters):
+        # Only full listings are cached (one entry per projection), encoded; concurrent misses share one read
+        test_cases = await cache_get_or_compute(f"test_cases:all{projection_cache_suffix(projection)}", fetch_all,
+                                                (cache_tag(DB_COLLECTION_TM_TC),))
+
+        return cached_response(request, test_cases)
+
+    try:
+        test_cases, next_cursor = await fetch_page(limit, after)
+
+    except ValueError:
+        return invalid_cursor_response(after)
+
+    return page_response(request, test_cases, next_cursor)
 
 
 @router.get(f"/api/{API_VERSION}/tm/projects/{{project_key}}/test-cases",
@@ -77,35 +131,82 @@ async def get_all_test_cases(request: Request):
             response_model=list[TestCase],
             status_code=status.HTTP_200_OK)
 async def get_all_test_cases_by_project(request: Request,
-                                        project_key: str):
-    """Get all test cases in the specified project"""
-
-    cache_key = f"test_cases:{project_key}"
-    cached = cache_get(cache_key)
-    if cached is not None:
-        return JSONResponse(status_code=status.HTTP_200_OK, content=cached)
+                                        project_key: str,
+                                        filters: TestCaseListFilter = Depends(query_params(TestCaseListFilter)),
+                                        limit: int | None = Query(default=None, ge=1, le=PAGE_LIMIT_MAX),
+                                        after: str | None = None,
+                                        stream: bool = False,
+                                        fields: str | None = None,
+                                        view: ListView = ListView.FULL):
+    """Get all test cases in the specified project, optionally filtered, sorted, one page at a time or
+    streamed as NDJSON, and only some of their fields"""
 
     db = request.app.state.mdb
 
-    # Concurrently check project exists and fetch test cases
-    project, test_cases = await asyncio.gather(
-        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key}),
-        db.find(DB_NAME_TM, DB_COLLECTION_TM_TC, {"project_key": project_key})
-    )
+    # Filters and sort are pushed down to MongoDB, in key sequence order by default
+    query = {"project_key": project_key, **list_filter_query(DB_COLLECTION_TM_TC, filters)}
+    sort = list_sort(filters.sort, ("seq",))
 
-    if project is None:
+    try:
+        projection = list_projection(DB_COLLECTION_TM_TC, fields, view,
+                                     ("test_case_key", *[field for field, _ in sort]))
+    except ValueError as err:
+        return invalid_projection_response(err)
+
+    if wants_ndjson(request, stream):
+        try:
+            stream_query = page_query(query, sort, after)
+        except ValueError:
+            return invalid_cursor_response(after)
+
+        project = await db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key})
+        if project is None:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"error": f"{project_key} not found"}
+            )
+
+        # Encode test cases as the cursor yields them, bypassing the cache
+        return ndjson_response(db.find_stream(DB_NAME_TM, DB_COLLECTION_TM_TC, stream_query, projection,
+                                              sort=sort, limit=limit or 0))
+
+    async def fetch_page(limit: int | None, after: str | None) -> tuple:
+        # Concurrently check project exists and fetch test cases in sort order
+        project, (test_cases, next_cursor) = await asyncio.gather(
+            db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key}),
+            find_page(db, DB_NAME_TM, DB_COLLECTION_TM_TC, query, sort, limit, after, projection)
+        )
+
+        return (None, None) if project is None else (test_cases, next_cursor)
+
+    async def fetch_all() -> list | None:
+        return (await fetch_page(None, None))[0]
+
+    cached = limit is None and after is None and not is_filtered(filters)
+
+    try:
+        if cached:
+            # Only full listings are cached (one entry per projection), encoded; concurrent misses share one read
+            test_cases = await cache_get_or_compute(f"test_cases:{project_key}{projection_cache_suffix(projection)}",
+                                                    fetch_all, (cache_tag(DB_COLLECTION_TM_TC, project_key),))
+            next_cursor = None
+
+        else:
+            test_cases, next_cursor = await fetch_page(limit, after)
+
+    except ValueError:
+        return invalid_cursor_response(after)
+
+    if test_cases is None:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"error": f"{project_key} not found"}
         )
 
-    # Sort test cases by test_case_key using natsort
-    test_cases = natsorted(test_cases, key=lambda x: x.get("test_case_key"))
+    if cached:
+        return cached_response(request, test_cases)
 
-    cache_set(cache_key, test_cases)
-
-    return JSONResponse(status_code=status.HTTP_200_OK,
-                        content=test_cases)
+    return page_response(request, test_cases, next_cursor)
 
 
 @router.post(f"/api/{API_VERSION}/tm/projects/{{project_key}}/test-case",
@@ -167,8 +268,7 @@ async def create_test_case_in_project(request: Request,
         # Advance the counter so future auto-generated keys never collide with
         # manually-provided ones (e.g. user inserts T1, T2, T4 manually, then
         # two auto-inserts must start at T5 not T3/T4).
-        manual_num = int(test_case_key.split(TC_KEY_PREFIX)[-1])
-        await db.sync_sequence(DB_NAME_TM, f"{project_key}_tc", manual_num)
+        await db.sync_sequence(DB_NAME_TM, f"{project_key}_tc", key_sequence(test_case_key))
 
     # Initialize counts and timestamps
     current_time = get_current_utc_time()
@@ -176,6 +276,7 @@ async def create_test_case_in_project(request: Request,
     request_data["created_at"] = current_time
     request_data["updated_at"] = current_time
     request_data["labels"] = [l.strip() for l in request_data.get("labels", [])]
+    request_data["seq"] = key_sequence(test_case_key)
 
     # Assign _id
     db_insert = TestCase(**request_data).model_dump()
@@ -184,17 +285,14 @@ async def create_test_case_in_project(request: Request,
     # Create the test case in the database
     await db.create(DB_NAME_TM, DB_COLLECTION_TM_TC, db_insert)
 
-    # Update project test case count using db.count + update labels
-    tc_count = await db.count(DB_NAME_TM, DB_COLLECTION_TM_TC, {"project_key": project_key})
-    project["labels"] = list(set(project.get("labels", []) + request_data["labels"]))
-    project["test_case_count"] = tc_count
-    await db.update(DB_NAME_TM, DB_COLLECTION_TM_PRJ, project, {
-        "project_key": project_key
-    })
+    # Atomically bump project test case count and merge labels, so concurrent creates lose neither
+    await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                       {"test_case_count": 1},
+                       {"project_key": project_key},
+                       add_to_set={"labels": request_data["labels"]})
 
     # Invalidate test case list and project caches (test_case_count changed)
-    cache_invalidate("test_cases:all", f"test_cases:{project_key}",
-                     "projects:all", f"projects:{project_key}")
+    await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
 
     return JSONResponse(status_code=status.HTTP_201_CREATED,
                         content=request_data)
@@ -229,21 +327,17 @@ async def delete_all_test_case_from_project(request: Request,
         )
 
     # Delete all test cases under project
-    await db.delete(DB_NAME_TM, DB_COLLECTION_TM_TC, {
+    _, deleted_count = await db.delete(DB_NAME_TM, DB_COLLECTION_TM_TC, {
         "project_key": project_key
     })
 
-    # Update project test counts to 0 using already-fetched project doc
-    project["test_case_count"] = 0
-    project["test_cycle_count"] = 0
-
-    await db.update(DB_NAME_TM, DB_COLLECTION_TM_PRJ, project, {
-        "project_key": project_key
-    })
+    # Decrement by what was actually deleted so concurrent creates are kept
+    await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                       {"test_case_count": -deleted_count},
+                       {"project_key": project_key})
 
     # Invalidate all affected cache entries
-    cache_invalidate("test_cases:all", f"test_cases:{project_key}",
-                     "projects:all", f"projects:{project_key}")
+    await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -328,17 +422,13 @@ async def update_test_case_by_key(request: Request,
         "project_key": project_key
     })
 
-    # Update project labels if changed
-    new_label_set = list(set(project.get("labels", []) + request_data.get("labels", [])))
-    if project["labels"] != new_label_set:
-        project["labels"] = new_label_set
-        await db.update(DB_NAME_TM, DB_COLLECTION_TM_PRJ, project, {
-            "project_key": project_key
-        })
+    # Atomically merge new labels into the project, leaving its counters to their own writers
+    if set(request_data.get("labels") or []) - set(project.get("labels", [])):
+        await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {}, {"project_key": project_key},
+                           add_to_set={"labels": request_data["labels"]})
 
     # Invalidate stale test case and project caches
-    cache_invalidate("test_cases:all", f"test_cases:{project_key}",
-                     "projects:all", f"projects:{project_key}")
+    await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
 
     return JSONResponse(status_code=status.HTTP_200_OK,
                         content=updated_test_case)
@@ -382,22 +472,19 @@ async def delete_test_case_by_key(request: Request,
                               f"associated test executions and cannot be deleted"}
         )
 
-    # Delete the test case and get updated count concurrently
-    await db.delete_one(DB_NAME_TM, DB_COLLECTION_TM_TC, {
+    # Delete the test case
+    _, deleted_count = await db.delete_one(DB_NAME_TM, DB_COLLECTION_TM_TC, {
         "test_case_key": test_case_key,
         "project_key": project_key
     })
 
-    # Update project test case count using db.count
-    project["test_case_count"] = await db.count(DB_NAME_TM, DB_COLLECTION_TM_TC, {
-        "project_key": project_key
-    })
-    await db.update(DB_NAME_TM, DB_COLLECTION_TM_PRJ, project, {
-        "project_key": project_key
-    })
+    # Atomically decrement project test case count
+    if deleted_count:
+        await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                           {"test_case_count": -1},
+                           {"project_key": project_key})
 
     # Invalidate stale test case and project caches
-    cache_invalidate("test_cases:all", f"test_cases:{project_key}",
-                     "projects:all", f"projects:{project_key}")
+    await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
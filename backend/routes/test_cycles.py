@@ -12,12 +12,11 @@ import json
 import re
 from fastapi import (
     APIRouter,
+    Query,
     Request,
     status,
     Response
 )
-from natsort import natsorted
-from starlette.responses import JSONResponse
 from typing import Optional
 
 from backend.app.app_def import (
@@ -27,18 +26,34 @@ from backend.app.app_def import (
     DB_COLLECTION_TM_TC,
     DB_COLLECTION_TM_TCY,
     DB_NAME_TM,
+    PAGE_LIMIT_MAX,
     TCY_KEY_PREFIX
 )
-from backend.app.cache import cache_invalidate
+from backend.app.cache import (
+    cache_invalidate_tags,
+    project_tags
+)
+from backend.app.pagination import (
+    find_page,
+    invalid_cursor_response,
+    page_response
+)
+from backend.app.responses import JSONResponse
 from backend.app.utility import (
     get_current_utc_time,
-    calculate_cycle_status
+    calculate_cycle_status,
+    cycle_membership_pipeline,
+    key_sequence
 )
 from backend.models.test_cycles import (
     TestCycle,
     TestCycleCreate,
     TestCycleUpdate
 )
+from backend.module.cycle_membership import (
+    sync_cycle_links,
+    test_case_executions
+)
 
 router = APIRouter()
 
@@ -54,16 +69,22 @@ DB_COLLECTION_TM_TCY = DB_COLLECTION_TM_TCY.name
             response_model=list[TestCycle],
             status_code=status.HTTP_200_OK)
 async def get_all_cycles_for_project(request: Request,
-                                     project_key: str):
-    """Get all test cycles for project"""
+                                     project_key: str,
+                                     limit: int | None = Query(default=None, ge=1, le=PAGE_LIMIT_MAX),
+                                     after: str | None = None):
+    """Get all test cycles for project, newest first, optionally one page at a time"""
 
     db = request.app.state.mdb
 
-    # Concurrently check project exists and fetch cycles
-    project, test_cycles = await asyncio.gather(
-        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key}),
-        db.find(DB_NAME_TM, DB_COLLECTION_TM_TCY, {"project_key": project_key})
-    )
+    # Concurrently check project exists and fetch cycles in reverse key sequence order
+    try:
+        project, (test_cycles, next_cursor) = await asyncio.gather(
+            db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key}),
+            find_page(db, DB_NAME_TM, DB_COLLECTION_TM_TCY, {"project_key": project_key},
+                      [("seq", -1)], limit, after)
+        )
+    except ValueError:
+        return invalid_cursor_response(after)
 
     if project is None:
         return JSONResponse(
@@ -71,12 +92,7 @@ async def get_all_cycles_for_project(request: Request,
             content={"error": f"{project_key} not found"}
         )
 
-    test_cycles = natsorted(test_cycles,
-                            key=lambda x: x.get("test_cycle_key"),
-                            reverse=True)
-
-    return JSONResponse(status_code=status.HTTP_200_OK,
-                        content=test_cycles)
+    return page_response(request, test_cycles, next_cursor)
 
 
 @router.post(f"/api/{API_VERSION}/tm/projects/{{project_key}}/cycles",
@@ -139,18 +155,22 @@ async def create_cycle_for_project(request: Request,
         # Advance the counter so future auto-generated keys never collide with
         # manually-provided ones (e.g. user inserts C1, C2, C4 manually, then
         # two auto-inserts must start at C5 not C3/C4).
-        manual_num = int(test_cycle_key.split(TCY_KEY_PREFIX)[-1])
-        await db.sync_sequence(DB_NAME_TM, f"{project_key}_tcy", manual_num)
+        await db.sync_sequence(DB_NAME_TM, f"{project_key}_tcy", key_sequence(test_cycle_key))
 
     # Initialize counts and timestamps
     current_time = get_current_utc_time()
     request_data["project_key"] = project_key
     request_data["created_at"] = current_time
     request_data["updated_at"] = current_time
+    request_data["seq"] = key_sequence(test_cycle_key)
 
     if request_data.get("folder", None) is None:
         request_data["folder"] = "/"
 
+    # Seed result counters, status and test case members from any initial executions
+    request_data = calculate_cycle_status(request_data)
+    request_data["test_case_executions"] = await test_case_executions(db, request_data["executions"])
+
     # Assign _id
     db_insert = TestCycle(**request_data).model_dump()
     db_insert["_id"] = test_cycle_key
@@ -158,16 +178,13 @@ async def create_cycle_for_project(request: Request,
     # Create the test cycle in the database
     await db.create(DB_NAME_TM, DB_COLLECTION_TM_TCY, db_insert)
 
-    # Update project test cycle count using db.count (no full document fetch)
-    project["test_cycle_count"] = await db.count(DB_NAME_TM, DB_COLLECTION_TM_TCY, {
-        "project_key": project_key
-    })
-    await db.update(DB_NAME_TM, DB_COLLECTION_TM_PRJ, project, {
-        "project_key": project_key
-    })
+    # Atomically bump project test cycle count
+    await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                       {"test_cycle_count": 1},
+                       {"project_key": project_key})
 
     # Invalidate project caches (test_cycle_count changed)
-    cache_invalidate("projects:all", f"projects:{project_key}")
+    await cache_invalidate_tags(*project_tags(project_key))
 
     return JSONResponse(status_code=status.HTTP_201_CREATED,
                         content=request_data)
@@ -193,7 +210,7 @@ async def delete_all_cycles_by_project(request: Request,
         )
 
     # Concurrently delete all cycles and clear test_cycle_key on all linked executions
-    await asyncio.gather(
+    (_, deleted_count), _ = await asyncio.gather(
         db.delete(DB_NAME_TM, DB_COLLECTION_TM_TCY, {
             "project_key": project_key
         }),
@@ -202,14 +219,13 @@ async def delete_all_cycles_by_project(request: Request,
                   {"project_key": project_key})
     )
 
-    # Update project cycle count to 0
-    project["test_cycle_count"] = 0
-    await db.update(DB_NAME_TM, DB_COLLECTION_TM_PRJ, project, {
-        "project_key": project_key
-    })
+    # Decrement by what was actually deleted so concurrent creates are kept
+    await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                       {"test_cycle_count": -deleted_count},
+                       {"project_key": project_key})
 
     # Invalidate project caches
-    cache_invalidate("projects:all", f"projects:{project_key}")
+    await cache_invalidate_tags(*project_tags(project_key))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -257,6 +273,11 @@ async def update_cycle_by_key(request: Request,
     request_data = {k: v for k, v in request_data.items() if v is not None}
     request_data["updated_at"] = get_current_utc_time()
 
+    # A replaced executions map needs its counters, status and test case members recounted
+    if "executions" in request_data:
+        request_data = calculate_cycle_status(request_data)
+        request_data["test_case_executions"] = await test_case_executions(db, request_data["executions"])
+
     # Update the cycle in the database
     result, matched_count = await db.update(DB_NAME_TM, DB_COLLECTION_TM_TCY, request_data, {
         "test_cycle_key": test_cycle_key
@@ -297,7 +318,7 @@ async def delete_cycle_by_key(request: Request,
         )
 
     # Concurrently: delete the cycle and clear test_cycle_key on all linked executions
-    await asyncio.gather(
+    (_, deleted_count), _ = await asyncio.gather(
         db.delete_one(DB_NAME_TM, DB_COLLECTION_TM_TCY,
                       {"test_cycle_key": test_cycle_key}),
         db.update(DB_NAME_TM, DB_COLLECTION_TM_TE,
@@ -305,11 +326,16 @@ async def delete_cycle_by_key(request: Request,
                   {"test_cycle_key": test_cycle_key})
     )
 
-    # Invalidate project caches (test_cycle_count changed)
+    # Atomically decrement project test cycle count and invalidate its caches
     # Retrieve the project_key from the cycle doc we already fetched
     cycle_project_key = result.get("project_key")
     if cycle_project_key:
-        cache_invalidate("projects:all", f"projects:{cycle_project_key}")
+        if deleted_count:
+            await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                               {"test_cycle_count": -1},
+                               {"project_key": cycle_project_key})
+
+        await cache_invalidate_tags(*project_tags(cycle_project_key))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -372,101 +398,75 @@ async def add_execution_to_cycle(request: Request,
 
     db = request.app.state.mdb
 
-    test_execution = await db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TE, {
-        "execution_key": execution_key
-    })
+    # Concurrently fetch execution and cycle (without its executions map)
+    test_execution, cycle_data = await asyncio.gather(
+        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TE, {"execution_key": execution_key}),
+        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TCY, {"test_cycle_key": test_cycle_key},
+                    {"executions": 0})
+    )
+
     if test_execution is None:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"error": f"{execution_key} not found"}
         )
 
-    # concurrency access retry
-    max_retries = 25
-
-    for attempt in range(max_retries):
-        cycle_data = await db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TCY, {
-            "test_cycle_key": test_cycle_key
-        })
-        if cycle_data is None:
-            return JSONResponse(
-                status_code=status.HTTP_404_NOT_FOUND,
-                content={"error": f"{test_cycle_key} not found"}
-            )
-
-        # check execution project matches cycle project
-        if test_execution["project_key"] != cycle_data["project_key"]:
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={"error": f"Execution {execution_key} "
-                                  f"belongs to different project "
-                                  f"{test_execution['project_key']}"}
-            )
-
-        # Check execution does not already belong to a different cycle
-        existing_cycle_key = test_execution.get("test_cycle_key", None)
-        if existing_cycle_key is not None and existing_cycle_key != test_cycle_key:
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={"error": f"Execution {execution_key} "
-                                  f"already in cycle "
-                                  f"{existing_cycle_key}"}
-            )
-
-        # Snapshot of executions as read, used as the CAS filter below
-        original_executions = dict(cycle_data["executions"])
-
-        # Check for an existing execution in this cycle that covers the same test case.
-        # If found, replace it with the newly provided execution.
-        old_execution_key = None
-        tc_key = test_execution["test_case_key"]
-        if cycle_data["executions"]:
-            current_exec_keys = list(cycle_data["executions"].keys())
-
-            # Batch-fetch only executions already in the cycle that share the test_case_key
-            duplicate_execs = await db.find(DB_NAME_TM, DB_COLLECTION_TM_TE, {
-                "execution_key": {"$in": current_exec_keys},
-                "test_case_key": tc_key
-            })
-
-            if duplicate_execs:
-                old_execution_key = duplicate_execs[0]["execution_key"]
-                cycle_data["executions"].pop(old_execution_key, None)
-
-        # Add the new execution to the cycle
-        cycle_data["executions"][execution_key] = test_execution["result"]
-        cycle_data = calculate_cycle_status(cycle_data)
-
-        # Attempt the update only if `executions` hasn't changed since we read it
-        _, matched_count = await db.update(DB_NAME_TM, DB_COLLECTION_TM_TCY, cycle_data, {
-            "test_cycle_key": test_cycle_key,
-            "executions": original_executions
-        })
+    if cycle_data is None:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error": f"{test_cycle_key} not found"}
+        )
 
-        if matched_count:
-            break
+    # check execution project matches cycle project
+    if test_execution["project_key"] != cycle_data["project_key"]:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"error": f"Execution {execution_key} "
+                              f"belongs to different project "
+                              f"{test_execution['project_key']}"}
+        )
 
-    else:
+    # Check execution does not already belong to a different cycle
+    existing_cycle_key = test_execution.get("test_cycle_key", None)
+    if existing_cycle_key is not None and existing_cycle_key != test_cycle_key:
         return JSONResponse(
-            status_code=status.HTTP_409_CONFLICT,
-            content={"error": f"Could not add execution {execution_key} to cycle "
-                              f"{test_cycle_key} due to concurrent updates, "
-                              f"please retry"}
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"error": f"Execution {execution_key} "
+                              f"already in cycle "
+                              f"{existing_cycle_key}"}
         )
 
-    # Build concurrent update tasks
-    test_execution["test_cycle_key"] = test_cycle_key
-    update_tasks = [
-        db.update(DB_NAME_TM, DB_COLLECTION_TM_TE, test_execution, {"execution_key": execution_key}),
-    ]
-    # If we displaced an old execution, clear its cycle link at the same time
-    if old_execution_key:
-        update_tasks.append(
-            db.update(DB_NAME_TM, DB_COLLECTION_TM_TE,
-                      {"test_cycle_key": None},
-                      {"execution_key": old_execution_key})
+    test_case_key = test_execution["test_case_key"]
+
+    # Executions linked to this cycle for the same test case, for cycles
+    # predating the test_case_executions map
+    duplicate_execs = await db.find(DB_NAME_TM, DB_COLLECTION_TM_TE, {
+        "test_cycle_key": test_cycle_key,
+        "test_case_key": test_case_key,
+        "execution_key": {"$ne": execution_key}
+    }, {"execution_key": 1})
+    old_execution_keys = [e["execution_key"] for e in duplicate_execs]
+
+    # Targeted $set/$unset on executions.<key> plus server-side status
+    # recomputation - the pipeline also displaces the test case's current
+    # member, so concurrent adds of one test case leave a single member
+    cycle_data = await db.update_one_and_fetch(
+        DB_NAME_TM, DB_COLLECTION_TM_TCY,
+        cycle_membership_pipeline(get_current_utc_time(),
+                                  set_executions={execution_key: test_execution["result"]},
+                                  unset_executions=old_execution_keys,
+                                  test_cases={execution_key: test_case_key}),
+        {"test_cycle_key": test_cycle_key}
+    )
+    if cycle_data is None:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error": f"{test_cycle_key} not found"}
         )
-    await asyncio.gather(*update_tasks)
+
+    # Link the test case's member (ours unless a concurrent add displaced it)
+    # and clear the link of every other execution of the test case
+    await sync_cycle_links(db, test_cycle_key, [test_case_key])
 
     return JSONResponse(status_code=status.HTTP_200_OK,
                         content=cycle_data)
@@ -491,52 +491,36 @@ async def remove_executions_from_cycle(request: Request,
             content={"error": f"{execution_key} not found"}
         )
 
-    max_retries = 20
-    for attempt in range(max_retries):
-        cycle_data = await db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TCY, {
+    # Unset only this execution's entry; the filter makes the update a no-op
+    # when the execution is not a member of the cycle
+    cycle_data = await db.update_one_and_fetch(
+        DB_NAME_TM, DB_COLLECTION_TM_TCY,
+        cycle_membership_pipeline(get_current_utc_time(),
+                                  unset_executions=[execution_key]),
+        {"test_cycle_key": test_cycle_key,
+         f"executions.{execution_key}": {"$exists": True}}
+    )
+
+    if cycle_data is None:
+        cycle_exists = await db.count(DB_NAME_TM, DB_COLLECTION_TM_TCY, {
             "test_cycle_key": test_cycle_key
         })
-        if cycle_data is None:
+        if not cycle_exists:
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
                 content={"error": f"{test_cycle_key} not found"}
             )
 
-        # Check execution in cycle
-        if test_execution["test_case_key"] not in cycle_data["executions"]:
-            return JSONResponse(
-                status_code=status.HTTP_404_NOT_FOUND,
-                content={"error": f"Execution {execution_key} "
-                                  f"not in cycle {test_cycle_key}"}
-            )
-
-        # Snapshot of executions as read, used as the CAS filter below
-        original_executions = dict(cycle_data["executions"])
-
-        # Remove execution from cycle
-        cycle_data["executions"].pop(test_execution["test_case_key"])
-        cycle_data = calculate_cycle_status(cycle_data)
-
-        # Attempt the update only if `executions` hasn't changed since we read it
-        _, matched_count = await db.update(DB_NAME_TM, DB_COLLECTION_TM_TCY, cycle_data, {
-            "test_cycle_key": test_cycle_key,
-            "executions": original_executions
-        })
-
-        if matched_count:
-            break
-
-    else:
         return JSONResponse(
-            status_code=status.HTTP_409_CONFLICT,
-            content={"error": f"Could not remove execution {execution_key} from cycle "
-                              f"{test_cycle_key} due to concurrent updates, "
-                              f"please retry"}
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error": f"Execution {execution_key} "
+                              f"not in cycle {test_cycle_key}"}
         )
 
     # Clear execution's cycle key
-    test_execution["test_cycle_key"] = None
-    await db.update(DB_NAME_TM, DB_COLLECTION_TM_TE, test_execution, {"execution_key": execution_key})
+    await db.update(DB_NAME_TM, DB_COLLECTION_TM_TE,
+                    {"test_cycle_key": None},
+                    {"execution_key": execution_key})
 
     return JSONResponse(status_code=status.HTTP_200_OK,
                         content=cycle_data)
@@ -9,16 +9,17 @@
 
 import asyncio
 import re
+from collections import defaultdict
 from typing import Optional
 
 from fastapi import (
     APIRouter,
+    Depends,
+    Query,
     Request,
     status,
     Response
 )
-from natsort import natsorted
-from starlette.responses import JSONResponse
 
 from backend.app.app_def import (
     API_VERSION,
@@ -27,18 +28,49 @@ from backend.app.app_def import (
     DB_COLLECTION_TM_TC,
     DB_COLLECTION_TM_TCY,
     DB_NAME_TM,
+    ListView,
+    PAGE_LIMIT_MAX,
     TE_KEY_PREFIX
 )
-from backend.app.cache import cache_invalidate
+from backend.app.cache import (
+    cache_invalidate_tags,
+    project_tags,
+    test_case_tags
+)
+from backend.app.filters import (
+    list_filter_query,
+    list_sort,
+    query_params
+)
+from backend.app.pagination import (
+    find_page,
+    invalid_cursor_response,
+    page_query,
+    page_response
+)
+from backend.app.projections import (
+    invalid_projection_response,
+    list_projection
+)
+from backend.app.responses import JSONResponse
+from backend.app.streaming import (
+    ndjson_response,
+    wants_ndjson
+)
 from backend.app.utility import (
     get_current_utc_time,
-    calculate_cycle_status
+    calculate_cycle_status,
+    cycle_membership_pipeline,
+    key_sequence
 )
 from backend.models.test_executions import (
     TestExecution,
+    TestExecutionListFilter,
+    TestExecutionBulkCreate,
     TestExecutionCreate,
     TestExecutionUpdate
 )
+from backend.module.cycle_membership import sync_cycle_links
 
 router = APIRouter()
 
@@ -54,16 +86,53 @@ DB_COLLECTION_TM_TCY = DB_COLLECTION_TM_TCY.name
             response_model=list[TestExecution],
             status_code=status.HTTP_200_OK)
 async def get_all_executions_by_project(request: Request,
-                                        project_key: str):
-    """Get all test executions for a specific test case within a project"""
+                                        project_key: str,
+                                        filters: TestExecutionListFilter = Depends(query_params(TestExecutionListFilter)),
+                                        limit: int | None = Query(default=None, ge=1, le=PAGE_LIMIT_MAX),
+                                        after: str | None = None,
+                                        stream: bool = False,
+                                        fields: str | None = None,
+                                        view: ListView = ListView.FULL):
+    """Get all test executions within a project, optionally filtered, sorted, one page at a time or
+    streamed as NDJSON, and only some of their fields"""
 
     db = request.app.state.mdb
 
-    # Concurrently check project exists and fetch executions
-    project, test_executions = await asyncio.gather(
-        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key}),
-        db.find(DB_NAME_TM, DB_COLLECTION_TM_TE, {"project_key": project_key})
-    )
+    # Filters and sort are pushed down to MongoDB, in key sequence order by default
+    query = {"project_key": project_key, **list_filter_query(DB_COLLECTION_TM_TE, filters)}
+    sort = list_sort(filters.sort, ("seq",))
+
+    try:
+        projection = list_projection(DB_COLLECTION_TM_TE, fields, view,
+                                     ("execution_key", *[field for field, _ in sort]))
+    except ValueError as err:
+        return invalid_projection_response(err)
+
+    if wants_ndjson(request, stream):
+        try:
+            stream_query = page_query(query, sort, after)
+        except ValueError:
+            return invalid_cursor_response(after)
+
+        project = await db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key})
+        if project is None:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"error": f"{project_key} not found"}
+            )
+
+        # Encode executions as the cursor yields them instead of loading the whole project
+        return ndjson_response(db.find_stream(DB_NAME_TM, DB_COLLECTION_TM_TE, stream_query, projection,
+                                              sort=sort, limit=limit or 0))
+
+    # Concurrently check project exists and fetch executions in sort order
+    try:
+        project, (test_executions, next_cursor) = await asyncio.gather(
+            db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key}),
+            find_page(db, DB_NAME_TM, DB_COLLECTION_TM_TE, query, sort, limit, after, projection)
+        )
+    except ValueError:
+        return invalid_cursor_response(after)
 
     if project is None:
         return JSONResponse(
@@ -71,8 +140,7 @@ async def get_all_executions_by_project(request: Request,
             content={"error": f"{project_key} not found"}
         )
 
-    return JSONResponse(status_code=status.HTTP_200_OK,
-                        content=test_executions)
+    return page_response(request, test_executions, next_cursor)
 
 
 @router.delete(f"/api/{API_VERSION}/tm/projects/{{project_key}}/executions",
@@ -97,7 +165,7 @@ async def delete_all_test_execution_by_project(request: Request,
     current_time = get_current_utc_time()
 
     # Concurrently: reset all test cases, reset all cycles, delete all executions
-    await asyncio.gather(
+    _, _, (_, deleted_count) = await asyncio.gather(
         # Bulk reset last_execution_key and last_result on all test cases in project
         db.update(DB_NAME_TM, DB_COLLECTION_TM_TC,
                   {"last_execution_key": None,
@@ -105,9 +173,9 @@ async def delete_all_test_execution_by_project(request: Request,
                    "updated_at": current_time},
                   {"project_key": project_key}),
 
-        # Bulk reset executions map on all cycles in project
+        # Bulk reset executions map, counters and status on all cycles in project
         db.update(DB_NAME_TM, DB_COLLECTION_TM_TCY,
-                  {"executions": {}, "updated_at": current_time},
+                  {**calculate_cycle_status({"executions": {}}), "updated_at": current_time},
                   {"project_key": project_key}),
 
         # Delete all executions for the project
@@ -115,20 +183,236 @@ async def delete_all_test_execution_by_project(request: Request,
                   {"project_key": project_key})
     )
 
-    # Invalidate test case caches (all last_result / last_execution_key reset)
-    cache_invalidate("test_cases:all", f"test_cases:{project_key}")
+    # Decrement by what was actually deleted so concurrent creates are kept
+    await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                       {"test_execution_count": -deleted_count},
+                       {"project_key": project_key})
+
+    # Invalidate test case and project caches (last_result / counts changed)
+    await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
+@router.post(f"/api/{API_VERSION}/tm/projects/{{project_key}}/executions/bulk",
+             tags=[DB_COLLECTION_TM_TE],
+             status_code=status.HTTP_201_CREATED)
+async def create_executions_bulk(request: Request,
+                                 project_key: str,
+                                 bulk: TestExecutionBulkCreate):
+    """Create many test executions in the specified project in one request.
+
+    Keys are reserved in a single counter round trip, executions are written
+    with one insert_many, linked test cases are updated with one bulk_write
+    and, when test_cycle_key is given, cycle membership is merged in one
+    update. Returns a per-item result in request order.
+    """
+
+    db = request.app.state.mdb
+
+    items = [e.model_dump() for e in bulk.executions]
+    test_cycle_key = bulk.test_cycle_key
+
+    # Concurrently check project, referenced test cases and manual keys
+    tc_keys = list({i["test_case_key"] for i in items if i["test_case_key"]})
+    manual_keys = [i["execution_key"] for i in items if i["execution_key"]]
+    project, test_cases, existing_executions = await asyncio.gather(
+        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_PRJ, {"project_key": project_key}),
+        db.find(DB_NAME_TM, DB_COLLECTION_TM_TC,
+                {"project_key": project_key, "test_case_key": {"$in": tc_keys}},
+                {"test_case_key": 1}),
+        db.find(DB_NAME_TM, DB_COLLECTION_TM_TE,
+                {"execution_key": {"$in": manual_keys}},
+                {"execution_key": 1})
+    )
+
+    if project is None:
+        return JSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"error": f"{project_key} not found"}
+        )
+
+    if test_cycle_key is not None:
+        cycle_data = await db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TCY, {
+            "test_cycle_key": test_cycle_key
+        })
+        if cycle_data is None:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"error": f"{test_cycle_key} not found"}
+            )
+
+        if cycle_data["project_key"] != project_key:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"error": f"Cycle {test_cycle_key} belongs to different "
+                                  f"project {cycle_data['project_key']}"}
+            )
+
+    # Validate each item, collecting per-item errors instead of failing the batch
+    known_tc_keys = {t["test_case_key"] for t in test_cases}
+    taken_keys = {e["execution_key"] for e in existing_executions}
+    pattern = rf"^{project_key}-{TE_KEY_PREFIX}\d+$"
+
+    results = [None] * len(items)
+    accepted = []
+    for index, item in enumerate(items):
+        tc_key = item["test_case_key"]
+        execution_key = item["execution_key"]
+
+        if tc_key is None:
+            error = (status.HTTP_400_BAD_REQUEST, "test_case_key is required")
+
+        elif tc_key not in known_tc_keys:
+            error = (status.HTTP_404_NOT_FOUND, f"{tc_key} not found")
+
+        elif item["test_cycle_key"] not in (None, test_cycle_key):
+            error = (status.HTTP_400_BAD_REQUEST,
+                     f"Per-item test_cycle_key is not supported, "
+                     f"set test_cycle_key on the request instead")
+
+        elif execution_key is not None and not re.match(pattern, execution_key):
+            error = (status.HTTP_400_BAD_REQUEST,
+                     f"test execution key '{execution_key}' is not valid. "
+                     f"Must be in format {project_key}-{TE_KEY_PREFIX}#")
+
+        elif execution_key is not None and execution_key in taken_keys:
+            error = (status.HTTP_400_BAD_REQUEST, f"{execution_key} already exists")
+
+        else:
+            error = None
+            if execution_key is not None:
+                taken_keys.add(execution_key)
+
+            accepted.append((index, item))
+
+        if error:
+            results[index] = {"index": index,
+                              "status_code": error[0],
+                              "error": error[1]}
+
+    if accepted:
+        # Advance the counter past the highest manual key, then reserve one
+        # contiguous block for every item that needs an auto-generated key
+        manual_nums = [key_sequence(i["execution_key"])
+                       for _, i in accepted if i["execution_key"]]
+        if manual_nums:
+            await db.sync_sequence(DB_NAME_TM, f"{project_key}_te", max(manual_nums))
+
+        auto_count = sum(1 for _, i in accepted if i["execution_key"] is None)
+        if auto_count:
+            seq = await db.reserve_sequence(DB_NAME_TM, f"{project_key}_te", auto_count)
+            for _, item in accepted:
+                if item["execution_key"] is None:
+                    item["execution_key"] = f"{project_key}-{TE_KEY_PREFIX}{seq}"
+                    seq += 1
+
+    # The last execution per test case (in request order) wins: it becomes the
+    # test case's last_execution_key and, if targeting a cycle, its member
+    planned = {}
+    for _, item in accepted:
+        planned[item["test_case_key"]] = item["execution_key"]
+    members = set(planned.values())
+
+    # Build execution documents
+    current_time = get_current_utc_time()
+    db_inserts = []
+    for index, item in accepted:
+        item["project_key"] = project_key
+        item["started_at"] = current_time
+        item["seq"] = key_sequence(item["execution_key"])
+        item["test_cycle_key"] = test_cycle_key if item["execution_key"] in members else None
+
+        db_insert = TestExecution(**item).model_dump()
+        db_insert["_id"] = item["execution_key"]
+        db_inserts.append(db_insert)
+
+        results[index] = {"index": index,
+                          "status_code": status.HTTP_201_CREATED,
+                          "execution_key": item["execution_key"],
+                          "test_case_key": item["test_case_key"]}
+
+    # Create all executions in one round trip; keys taken since the check above
+    # (a concurrent create) fail their item and are left out of the follow-ups
+    duplicates = set(await db.create_many_unique(DB_NAME_TM, DB_COLLECTION_TM_TE, db_inserts))
+
+    inserted = []
+    for position, (index, item) in enumerate(accepted):
+        if position in duplicates:
+            results[index] = {"index": index,
+                              "status_code": status.HTTP_400_BAD_REQUEST,
+                              "error": f"{item['execution_key']} already exists"}
+        else:
+            inserted.append(item)
+
+    # Same rule over what was inserted: where a planned member was a duplicate,
+    # the test case's previous execution takes its place (linked by sync_cycle_links)
+    latest_by_tc = {}
+    for item in inserted:
+        latest_by_tc[item["test_case_key"]] = item
+
+    # Executions linked to the cycle for the same test cases get displaced,
+    # for cycles predating the test_case_executions map
+    displaced_keys = []
+    if test_cycle_key is not None and latest_by_tc:
+        displaced = await db.find(DB_NAME_TM, DB_COLLECTION_TM_TE, {
+            "test_cycle_key": test_cycle_key,
+            "test_case_key": {"$in": list(latest_by_tc.keys())}
+        }, {"execution_key": 1})
+        displaced_keys = [d["execution_key"] for d in displaced]
+
+    # Update last_execution_key / last_result on every linked test case at once
+    tc_updates = [
+        ({"project_key": project_key, "test_case_key": tc_key},
+         {"updated_at": current_time,
+          "last_execution_key": item["execution_key"],
+          "last_result": item["result"]})
+        for tc_key, item in latest_by_tc.items()
+    ]
+    write_tasks = [db.bulk_update(DB_NAME_TM, DB_COLLECTION_TM_TC, tc_updates),
+                   db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                                {"test_execution_count": len(inserted)},
+                                {"project_key": project_key})]
+
+    if test_cycle_key is not None and latest_by_tc:
+        # Merge membership and recompute status in one pipeline update
+        pipeline = cycle_membership_pipeline(
+            current_time,
+            set_executions={i["execution_key"]: i["result"] for i in latest_by_tc.values()},
+            unset_executions=displaced_keys,
+            test_cases={i["execution_key"]: tc_key for tc_key, i in latest_by_tc.items()}
+        )
+
+        write_tasks.append(db.update_pipeline(DB_NAME_TM, DB_COLLECTION_TM_TCY, pipeline, {
+            "test_cycle_key": test_cycle_key
+        }))
+
+    await asyncio.gather(*write_tasks)
+
+    if test_cycle_key is not None and latest_by_tc:
+        # Clear the links of displaced executions (and of ours, if a concurrent
+        # add displaced them) once the membership update has landed
+        await sync_cycle_links(db, test_cycle_key, list(latest_by_tc))
+
+    # Invalidate test case and project caches (last_result / counts changed)
+    await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
+
+    return JSONResponse(status_code=status.HTTP_201_CREATED,
+                        content={"created": len(inserted),
+                                 "failed": len(items) - len(inserted),
+                                 "results": results})
+
+
 @router.get(f"/api/{API_VERSION}/tm/projects/{{project_key}}/test-cases/{{test_case_key}}/executions",
             tags=[DB_COLLECTION_TM_TE],
             response_model=list[TestExecution],
             status_code=status.HTTP_200_OK)
 async def get_all_executions_by_test_case_key(request: Request,
                                               project_key: str,
-                                              test_case_key: str):
-    """Get all test executions for a specific test case within a project"""
+                                              test_case_key: str,
+                                              limit: int | None = Query(default=None, ge=1, le=PAGE_LIMIT_MAX),
+                                              after: str | None = None):
+    """Get all test executions for a specific test case within a project, newest first"""
 
     db = request.app.state.mdb
 
@@ -151,16 +435,16 @@ async def get_all_executions_by_test_case_key(request: Request,
             content={"error": f"{test_case_key} not found"}
         )
 
-    # Retrieve test executions matching project_key and test_case_key
-    test_executions = await db.find(DB_NAME_TM, DB_COLLECTION_TM_TE, {
-        "project_key": project_key,
-        "test_case_key": test_case_key
-    })
+    # Retrieve test executions for the test case in reverse key sequence order
+    try:
+        test_executions, next_cursor = await find_page(db, DB_NAME_TM, DB_COLLECTION_TM_TE, {
+            "project_key": project_key,
+            "test_case_key": test_case_key
+        }, [("seq", -1)], limit, after)
+    except ValueError:
+        return invalid_cursor_response(after)
 
-    test_executions = list(reversed(natsorted(test_executions, key=lambda x: x.get("execution_key"))))
-
-    return JSONResponse(status_code=status.HTTP_200_OK,
-                        content=test_executions)
+    return page_response(request, test_executions, next_cursor)
 
 
 @router.post(f"/api/{API_VERSION}/tm/projects/{{project_key}}/test-cases/{{test_case_key}}/executions",
@@ -231,14 +515,14 @@ async def create_execution_by_test_case_key(request: Request,
         # Advance the counter so future auto-generated keys never collide with
         # manually-provided ones (e.g. user inserts E1, E2, E4 manually, then
         # two auto-inserts must start at E5 not E3/E4).
-        manual_num = int(execution_key.split(TE_KEY_PREFIX)[-1])
-        await db.sync_sequence(DB_NAME_TM, f"{project_key}_te", manual_num)
+        await db.sync_sequence(DB_NAME_TM, f"{project_key}_te", key_sequence(execution_key))
 
     # Initialize missing keys
     current_time = get_current_utc_time()
     request_data["project_key"] = project_key
     request_data["test_case_key"] = test_case_key
     request_data["started_at"] = current_time
+    request_data["seq"] = key_sequence(execution_key)
 
     # Assign _id
     db_insert = TestExecution(**request_data).model_dump()
@@ -251,13 +535,18 @@ async def create_execution_by_test_case_key(request: Request,
     tc_data["updated_at"] = current_time
     tc_data["last_execution_key"] = execution_key
     tc_data["last_result"] = request_data["result"]
-    await db.update(DB_NAME_TM, DB_COLLECTION_TM_TC, tc_data, {
-        "project_key": project_key,
-        "test_case_key": test_case_key
-    })
+    await asyncio.gather(
+        db.update(DB_NAME_TM, DB_COLLECTION_TM_TC, tc_data, {
+            "project_key": project_key,
+            "test_case_key": test_case_key
+        }),
+        db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                     {"test_execution_count": 1},
+                     {"project_key": project_key})
+    )
 
-    # Invalidate test case caches (last_result / last_execution_key changed)
-    cache_invalidate("test_cases:all", f"test_cases:{project_key}")
+    # Invalidate test case and project caches (last_result / counts changed)
+    await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
 
     return JSONResponse(status_code=status.HTTP_201_CREATED,
                         content=request_data)
@@ -294,18 +583,25 @@ async def delete_all_execution_by_test_case_key(request: Request,
             content={"error": f"{test_case_key} not found"}
         )
 
-    # Check project exists
-    test_cycles = await db.find(DB_NAME_TM, DB_COLLECTION_TM_TCY, {
-        "project_key": project_key
-    })
-    for cycle in test_cycles:
-        if test_case_key in cycle.get("executions", {}):
-            # remove execution key from cycle
-            cycle["executions"].pop(test_case_key)
-            cycle["updated_at"] = get_current_utc_time()
-            await db.update(DB_NAME_TM, DB_COLLECTION_TM_TCY, cycle, {
-                "test_cycle_key": cycle["test_cycle_key"]
-            })
+    # Find the test case's executions that are linked to cycles
+    linked_executions = await db.find(DB_NAME_TM, DB_COLLECTION_TM_TE, {
+        "project_key": project_key,
+        "test_case_key": test_case_key,
+        "test_cycle_key": {"$ne": None}
+    }, {"execution_key": 1, "test_cycle_key": 1})
+
+    executions_by_cycle = defaultdict(list)
+    for item in linked_executions:
+        executions_by_cycle[item["test_cycle_key"]].append(item["execution_key"])
+
+    # Concurrently remove them from each cycle (counters and status follow)
+    current_time = get_current_utc_time()
+    await asyncio.gather(*[
+        db.update_pipeline(DB_NAME_TM, DB_COLLECTION_TM_TCY,
+                           cycle_membership_pipeline(current_time, unset_executions=keys),
+                           {"test_cycle_key": cycle_key})
+        for cycle_key, keys in executions_by_cycle.items()
+    ])
 
     # Update test case info
     tc_data["updated_at"] = get_current_utc_time()
@@ -330,8 +626,12 @@ async def delete_all_execution_by_test_case_key(request: Request,
                               f"for test case {test_case_key}"}
         )
 
-    # Invalidate test case caches (last_result / last_execution_key reset)
-    cache_invalidate("test_cases:all", f"test_cases:{project_key}")
+    await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                       {"test_execution_count": -deleted_count},
+                       {"project_key": project_key})
+
+    # Invalidate test case and project caches (last_result / counts changed)
+    await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -399,40 +699,50 @@ async def update_execution_by_key(request: Request,
     test_case_key = existing_execution["test_case_key"]
     cycle_key = existing_execution["test_cycle_key"]
 
-    # Concurrently fetch linked test case and cycle
-    tc_data, cycle_data = await asyncio.gather(
-        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TC, {"test_case_key": test_case_key}),
-        db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TCY, {"test_cycle_key": cycle_key})
-    )
+    # Fetch linked test case
+    tc_data = await db.find_one(DB_NAME_TM, DB_COLLECTION_TM_TC, {"test_case_key": test_case_key})
 
     if tc_data is None:
         return JSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"error": f"{test_case_key} not found"}
         )
-    if cycle_data is None:
-        return JSONResponse(
-            status_code=status.HTTP_404_NOT_FOUND,
-            content={"error": f"{cycle_key} not found"}
-        )
 
-    # Prepare test case and cycle updates
+    # Prepare test case update
     current_time = get_current_utc_time()
     tc_data["last_result"] = request_data["result"]
-    cycle_data["executions"][execution_key] = request_data["result"].upper()
-    cycle_data = calculate_cycle_status(cycle_data)
-    cycle_data["updated_at"] = current_time
+    update_tasks = [
+        db.update(DB_NAME_TM, DB_COLLECTION_TM_TC, tc_data, {"test_case_key": test_case_key})
+    ]
+
+    if cycle_key is not None:
+        # Only this execution's entry changes; status is recomputed server-side
+        update_tasks.append(db.update_pipeline(
+            DB_NAME_TM, DB_COLLECTION_TM_TCY,
+            cycle_membership_pipeline(current_time,
+                                      set_executions={execution_key: request_data["result"]}),
+            {"test_cycle_key": cycle_key,
+             f"executions.{execution_key}": {"$exists": True}}
+        ))
 
     # Apply both updates concurrently
-    await asyncio.gather(
-        db.update(DB_NAME_TM, DB_COLLECTION_TM_TC, tc_data, {"test_case_key": test_case_key}),
-        db.update(DB_NAME_TM, DB_COLLECTION_TM_TCY, cycle_data, {"test_cycle_key": cycle_key})
-    )
+    update_results = await asyncio.gather(*update_tasks)
+
+    if cycle_key is not None and update_results[-1][1] == 0:
+        # No match is also an execution displaced from the cycle since it was read
+        cycle_exists = await db.count(DB_NAME_TM, DB_COLLECTION_TM_TCY, {
+            "test_cycle_key": cycle_key
+        })
+        if not cycle_exists:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={"error": f"{cycle_key} not found"}
+            )
 
     # Invalidate test case caches (last_result changed)
     project_key = existing_execution.get("project_key")
     if project_key:
-        cache_invalidate("test_cases:all", f"test_cases:{project_key}")
+        await cache_invalidate_tags(*test_case_tags(project_key))
 
     # Return the updated execution (merge request_data into existing doc)
     existing_execution.update(request_data)
@@ -472,14 +782,27 @@ async def delete_execution_by_key(request: Request,
             "test_case_key": test_execution["test_case_key"]
         })
 
+    # Remove the execution from its cycle (counters and status follow)
+    cycle_key = test_execution.get("test_cycle_key")
+    if cycle_key is not None:
+        await db.update_pipeline(DB_NAME_TM, DB_COLLECTION_TM_TCY,
+                                 cycle_membership_pipeline(get_current_utc_time(),
+                                                           unset_executions=[execution_key]),
+                                 {"test_cycle_key": cycle_key})
+
     # Delete the execution from the database
-    await db.delete_one(DB_NAME_TM, DB_COLLECTION_TM_TE, {
+    _, deleted_count = await db.delete_one(DB_NAME_TM, DB_COLLECTION_TM_TE, {
         "execution_key": execution_key
     })
 
-    # Invalidate test case caches (last_execution_key / last_result may have changed)
+    # Atomically decrement project execution count and invalidate caches
     project_key = test_execution.get("project_key")
     if project_key:
-        cache_invalidate("test_cases:all", f"test_cases:{project_key}")
+        if deleted_count:
+            await db.increment(DB_NAME_TM, DB_COLLECTION_TM_PRJ,
+                               {"test_execution_count": -1},
+                               {"project_key": project_key})
+
+        await cache_invalidate_tags(*test_case_tags(project_key), *project_tags(project_key))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -6,10 +6,14 @@
 # ================================================================
 
 import logging
+import pathlib
 import sys
 
 import pytest
 
+# Make the backend package importable for tests that exercise modules in-process
+sys.path.insert(0, str(pathlib.Path(__file__).parents[2]))
+
 
 def pytest_addoption(parser):
     """ Add test framework options to the pytest command parser."""
@@ -26,6 +30,12 @@ def pytest_addoption(parser):
         default=5000,
         help='Port of the backend server'
     )
+    parser.addoption(
+        '--webhook-secret',
+        dest='webhook_secret',
+        default="jerry",
+        help='GITHUB_WEBHOOK_SECRET the backend server was started with'
+    )
 
 
 def pytest_configure(config):
@@ -33,7 +43,7 @@ def pytest_configure(config):
         Configure logging and store options in the pytest namespace.
     """
 
-    option_names = ['host', 'port', 'log_level']
+    option_names = ['host', 'port', 'webhook_secret', 'log_level']
     pytest.options = {opt: config.getoption(opt, None) for opt in option_names}
 
     log_level_str = "INFO"
@@ -5,11 +5,21 @@
 # License: MIT
 # ================================================================
 
+from tests.test_benchmark import TestOrbitTMBenchmark
+from tests.test_cache import TestOrbitCache
 from tests.test_cases import TestOrbitTMCases
 from tests.test_cycles import TestOrbitTMCycles
 from tests.test_executions import TestOrbitTMExecutions
 from tests.test_generate import TestOrbitTMGenerate
+from tests.test_indexes import TestOrbitTMIndexes
+from tests.test_lease import TestOrbitLease
 from tests.test_projects import TestOrbitTMProjects
+from tests.test_runner_history import TestOrbitRunnerHistory
+from tests.test_runner_stream import TestOrbitRunnerStream
+from tests.test_runner_usage import TestOrbitRunnerUsage
+from tests.test_runners import TestOrbitRunners
+from tests.test_streaming import TestOrbitStreaming
+from tests.test_webhooks import TestOrbitRunnerWebhooks
 
 if __name__ == '__main__':
     project_tests = TestOrbitTMProjects()
@@ -17,3 +27,13 @@ if __name__ == '__main__':
     execution_tests = TestOrbitTMExecutions()
     cycle_tests = TestOrbitTMCycles()
     generate_tests = TestOrbitTMGenerate()
+    benchmark_tests = TestOrbitTMBenchmark()
+    index_tests = TestOrbitTMIndexes()
+    runner_tests = TestOrbitRunners()
+    webhook_tests = TestOrbitRunnerWebhooks()
+    history_tests = TestOrbitRunnerHistory()
+    usage_tests = TestOrbitRunnerUsage()
+    stream_tests = TestOrbitRunnerStream()
+    lease_tests = TestOrbitLease()
+    cache_tests = TestOrbitCache()
+    streaming_tests = TestOrbitStreaming()
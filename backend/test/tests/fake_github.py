@@ -0,0 +1,183 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# Minimal local stand-in for the GitHub Actions REST API used by the runner
+# poller: self-hosted runners, in-progress workflow runs and their jobs, all
+# paginated with Link rel="next" headers like the real API. Responses carry
+# an ETag and X-RateLimit-* headers; a matching If-None-Match is answered
+# with a 304 that, as on GitHub, does not consume the rate limit.
+
+import hashlib
+import json
+import threading
+import time
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+from urllib.parse import (
+    parse_qs,
+    urlencode,
+    urlparse
+)
+
+
+class FakeGitHubState:
+
+    def __init__(self, delay: float = 0.0):
+        """ Initialize fake API data and request accounting. """
+
+        self.delay = delay
+        self.runners = {}
+        self.runs = {}
+        self.jobs = {}
+        self.requests = []
+        self.not_modified = 0
+        self.rate_limit = 5000
+        self.rate_limit_remaining = 5000
+        self.rate_limit_reset = int(time.time()) + 3600
+        # Requests whose path contains a key are answered with its status code
+        self.failures = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def add_repo(self, repo: str, runner_count: int, busy_count: int = 0):
+        """ Add a repo with runners, the first busy_count of them running one job each. """
+
+        base_id = len(self.runners) * 10000
+        self.runners[repo] = [{
+            "id": base_id + i,
+            "name": f"{repo}-runner-{i}",
+            "os": "linux",
+            "status": "online",
+            "busy": i < busy_count,
+            "labels": [{"name": "self-hosted"}, {"name": "type:build"}]
+        } for i in range(runner_count)]
+
+        self.runs[repo] = []
+        for i in range(busy_count):
+            run_id = base_id + i
+            self.runs[repo].append({
+                "id": run_id,
+                "path": f".github/workflows/build-{i}.yml",
+                "html_url": f"https://github.com/orbit/{repo}/actions/runs/{run_id}",
+                "triggering_actor": {"login": f"user-{i}"},
+                "jobs_url": None
+            })
+            self.jobs[run_id] = [{"id": run_id * 10, "runner_id": base_id + i, "status": "in_progress"}]
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_page(self, key: str, items: list, query: dict):
+        """ Send one page of items with a Link rel="next" header when more remain. """
+
+        per_page = int(query.get("per_page", ["30"])[0])
+        page = int(query.get("page", ["1"])[0])
+        start = (page - 1) * per_page
+
+        headers = {}
+        if start + per_page < len(items):
+            next_query = {**{k: v[0] for k, v in query.items()}, "page": page + 1}
+            url = f"{self.server.url}{urlparse(self.path).path}?{urlencode(next_query)}"
+            headers["Link"] = f'<{url}>; rel="next"'
+
+        self._send(200, {"total_count": len(items), key: items[start:start + per_page]}, headers)
+
+    def _send(self, code: int, body: dict, headers: dict | None = None):
+        state = self.server.state
+        payload = json.dumps(body).encode()
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+
+        with state.lock:
+            if code == 200 and self.headers.get("If-None-Match") == etag:
+                code, payload = 304, b""
+                state.not_modified += 1
+
+            else:
+                state.rate_limit_remaining = max(state.rate_limit_remaining - 1, 0)
+
+            headers = {**(headers or {}),
+                       "ETag": etag,
+                       "X-RateLimit-Limit": str(state.rate_limit),
+                       "X-RateLimit-Remaining": str(state.rate_limit_remaining),
+                       "X-RateLimit-Reset": str(state.rate_limit_reset)}
+
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        state = self.server.state
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = url.path.strip("/").split("/")
+
+        with state.lock:
+            state.requests.append(self.path)
+            state.in_flight += 1
+            state.max_in_flight = max(state.max_in_flight, state.in_flight)
+
+        try:
+            time.sleep(state.delay)
+
+            # /repos/{owner}/{repo}/actions/...
+            repo = parts[2] if len(parts) > 2 else None
+            failure = next((code for fragment, code in state.failures.items() if fragment in self.path), None)
+            if failure is not None:
+                self._send(failure, {"message": "Failure"})
+
+            elif parts[3:] == ["actions", "runners"] and repo in state.runners:
+                self._send_page("runners", state.runners[repo], query)
+
+            elif parts[3:] == ["actions", "runs"] and repo in state.runs:
+                runs = [{**run, "jobs_url": f"{self.server.url}/repos/{parts[1]}/{repo}"
+                                            f"/actions/runs/{run['id']}/jobs"}
+                        for run in state.runs[repo]]
+                self._send_page("workflow_runs", runs, query)
+
+            elif parts[3:5] == ["actions", "runs"] and parts[6:] == ["jobs"]:
+                self._send_page("jobs", state.jobs.get(int(parts[5]), []), query)
+
+            else:
+                self._send(404, {"message": "Not Found"})
+
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+
+class FakeGitHubServer:
+
+    def __init__(self, state: FakeGitHubState):
+        """ Serve state on an ephemeral localhost port. """
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHubHandler)
+        self._httpd.state = state
+        self._httpd.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return self._httpd.url
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._httpd.shutdown()
+        self._httpd.server_close()
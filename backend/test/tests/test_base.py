@@ -5,11 +5,18 @@
 # License: MIT
 # ================================================================
 
+import json
 import logging
 
 import pytest
 import requests
 
+from backend.module.webhooks import (
+    EVENT_HEADER,
+    SIGNATURE_HEADER,
+    sign_payload
+)
+
 
 class OrbitTMBaseTest:
     """Base class for Orbit backend tests."""
@@ -45,3 +52,25 @@ class OrbitTMBaseTest:
         params = {"db_name": "ALL", "db_reset_token": "jerry"}
         response = cls.session.post(f"{cls.url}/db-reset", params=params)
         assert response.status_code == 204
+
+    @classmethod
+    def assert_db_consistent(cls):
+        """Assert no denormalized counter has drifted from a full recount"""
+
+        params = {"db_reset_token": "jerry", "dry_run": True}
+        response = cls.session.post(f"{cls.url}/db-repair", params=params)
+        assert response.status_code == 200
+        for job, report in response.json().items():
+            assert report["drifted"] == 0, f"{job} counters drifted: {report}"
+
+    @classmethod
+    def send_webhook(cls, event: str, payload: dict, secret: str | None = None):
+        """Deliver a GitHub event the way GitHub does: raw JSON body signed with the shared secret"""
+
+        body = json.dumps(payload).encode()
+        secret = pytest.options["webhook_secret"] if secret is None else secret
+        headers = {"Content-Type": "application/json",
+                   EVENT_HEADER: event,
+                   SIGNATURE_HEADER: sign_payload(secret, body)}
+
+        return cls.session.post(f"{cls.url}/runners/webhook", data=body, headers=headers)
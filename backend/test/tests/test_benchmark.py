@@ -0,0 +1,473 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from pymongo import MongoClient as PyMongoClient
+from starlette.responses import JSONResponse as StarletteJSONResponse
+
+from backend.app.app_def import (
+    BACKEND_DIR,
+    DB_NAME_TM,
+    MONGODB_URL,
+    ORBIT_ROOT_DIR,
+    PAGE_LIMIT_MAX
+)
+from backend.app.responses import JSONResponse
+from .test_base import OrbitTMBaseTest
+
+BENCH_TEST_CASES_COUNT = 200
+BENCH_CONCURRENT_WRITERS = 100
+BENCH_PROJECT_COUNTS = [10, 100, 1000]
+BENCH_LIST_REPEATS = 20
+BENCH_WORKER_COUNTS = [1, min(os.cpu_count() or 1, 4)]
+BENCH_CLIENTS = 32
+BENCH_DURATION = 5
+BENCH_CACHE_PROJECTS = 20
+BENCH_CACHE_OPERATIONS = 3000
+BENCH_ENCODE_DOCUMENTS = 10000
+BENCH_ENCODE_REPEATS = 5
+BENCH_FILTER_TEST_CASES = 40000
+BENCH_FILTER_SELECTIVITY = 100
+
+
+def start_server(workers: int) -> tuple[subprocess.Popen, str]:
+    """ Start a local backend with the given number of workers on a free port, without background tasks """
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    proc = subprocess.Popen([sys.executable, str(BACKEND_DIR / "index.py"), "-s",
+                             "--host", "127.0.0.1", "-p", str(port), "-w", str(workers)],
+                            env={**os.environ, "PYTHONPATH": str(ORBIT_ROOT_DIR)},
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            if requests.get(f"{url}/", timeout=1).status_code == 204:
+                return proc, f"{url}/api/v1"
+
+        except requests.ConnectionError:
+            pass
+
+        time.sleep(0.2)
+
+    proc.kill()
+    raise RuntimeError(f"Backend with {workers} workers did not start")
+
+
+def count_db_queries(action) -> tuple[int, int]:
+    """ Run action with the MongoDB profiler on the test database and count the queries (find, aggregate, count, ...)
+    and getMore batches it issued on the TM collections """
+
+    with PyMongoClient(MONGODB_URL) as client:
+        db = client[DB_NAME_TM.name]
+        namespaces = [f"{DB_NAME_TM.name}.{collection.name}" for collection in DB_NAME_TM.collections]
+
+        db.command("profile", 0)
+        db.drop_collection("system.profile")
+        db.command("profile", 2)
+        try:
+            action()
+
+        finally:
+            db.command("profile", 0)
+
+        ops = [entry["op"] for entry in db["system.profile"].find({"ns": {"$in": namespaces}}, {"op": 1})]
+
+    return len([op for op in ops if op != "getmore"]), ops.count("getmore")
+
+
+def stop_server(proc: subprocess.Popen) -> None:
+    """ Stop a local backend, letting it drain in-flight requests """
+
+    proc.terminate()
+    try:
+        proc.wait(timeout=30)
+
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+@pytest.mark.order(6)
+class TestOrbitTMBenchmark(OrbitTMBaseTest):
+
+    def test_bench_bulk_execution_ingestion(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ1"
+        cases = BENCH_TEST_CASES_COUNT
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+
+        for i in range(1, cases + 1):
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+            assert response.status_code == 201
+
+        # One-at-a-time path: create execution, then add it to the cycle
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/cycles")
+        cycle_key = response.json()["test_cycle_key"]
+
+        ts = time.perf_counter()
+        for i in range(1, cases + 1):
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}"
+                                    f"/test-cases/{project_key}-T{i}/executions",
+                                    json={"result": "PASS"})
+            assert response.status_code == 201
+
+            response = session.post(f"{self.__class__.url}/tm/cycles/{cycle_key}/executions",
+                                    params={"execution_key": response.json()["execution_key"]})
+            assert response.status_code == 200
+        single_elapsed = time.perf_counter() - ts
+
+        # Bulk path: same work in one request
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/cycles")
+        cycle_key = response.json()["test_cycle_key"]
+
+        ts = time.perf_counter()
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "test_cycle_key": cycle_key,
+            "executions": [{"test_case_key": f"{project_key}-T{i}", "result": "PASS"}
+                           for i in range(1, cases + 1)]
+        })
+        bulk_elapsed = time.perf_counter() - ts
+        assert response.status_code == 201
+        assert response.json()["created"] == cases
+
+        response = session.get(f"{self.__class__.url}/tm/cycles/{cycle_key}")
+        assert len(response.json()["executions"]) == cases
+
+        logging.info(f"{cases} executions: one-at-a-time {single_elapsed:.2f}s "
+                     f"({2 * cases} requests), bulk {bulk_elapsed:.2f}s (1 request), "
+                     f"speedup x{single_elapsed / bulk_elapsed:.1f}")
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_bench_concurrent_cycle_writers(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ1"
+        writers = BENCH_CONCURRENT_WRITERS
+        test_cases = writers // 2
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+
+        for i in range(1, test_cases + 1):
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+            assert response.status_code == 201
+
+        # Two executions per test case, not yet linked to any cycle
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "executions": [{"test_case_key": f"{project_key}-T{i}", "result": result}
+                           for result in ("PASS", "FAIL")
+                           for i in range(1, test_cases + 1)]
+        })
+        assert response.status_code == 201
+        execution_keys = [r["execution_key"] for r in response.json()["results"]]
+
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/cycles")
+        cycle_key = response.json()["test_cycle_key"]
+
+        def add_to_cycle(execution_key):
+            return requests.post(f"{self.__class__.url}/tm/cycles/{cycle_key}/executions",
+                                 params={"execution_key": execution_key}).status_code
+
+        # All writers hit the same cycle at once, two of them per test case
+        ts = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=writers) as pool:
+            status_codes = list(pool.map(add_to_cycle, execution_keys))
+        elapsed = time.perf_counter() - ts
+
+        conflicts = status_codes.count(409)
+        logging.info(f"{writers} concurrent writers: {elapsed:.2f}s, "
+                     f"{writers / elapsed:.1f} adds/s, "
+                     f"conflict rate {conflicts / writers:.1%}")
+
+        assert conflicts == 0
+        assert all(code == 200 for code in status_codes)
+
+        # One member per test case, whichever writer of the two landed last
+        response = session.get(f"{self.__class__.url}/tm/cycles/{cycle_key}")
+        cycle = response.json()
+        assert len(cycle["executions"]) == test_cases
+        assert sorted(cycle["test_case_executions"].values()) == sorted(cycle["executions"])
+        assert cycle["execution_count"] == test_cases
+        assert cycle["result_counts"]["PASS"] + cycle["result_counts"]["FAIL"] == test_cases
+        assert cycle["status"] == "COMPLETE"
+
+        # Only the members stay linked to the cycle
+        for execution_key in execution_keys:
+            response = session.get(f"{self.__class__.url}/tm/executions/{execution_key}")
+            linked = response.json()["test_cycle_key"] == cycle_key
+            assert linked == (execution_key in cycle["executions"])
+
+        self.__class__.assert_db_consistent()
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_bench_project_listing_scaling(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        created = 0
+
+        for project_count in BENCH_PROJECT_COUNTS:
+            # Grow the project set up to the next tier, each with linked data to count
+            for i in range(created, project_count):
+                project_key = f"PRJ{i}"
+                response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+                assert response.status_code == 201
+                response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+                assert response.status_code == 201
+            created = project_count
+
+            # Invalidate the list cache on every round so each GET hits the database
+            timings = []
+            for _ in range(BENCH_LIST_REPEATS):
+                response = session.put(f"{self.__class__.url}/tm/projects/PRJ0", json={"labels": []})
+                assert response.status_code == 200
+
+                ts = time.perf_counter()
+                response = session.get(f"{self.__class__.url}/tm/projects")
+                timings.append(time.perf_counter() - ts)
+                assert response.status_code == 200
+                assert len(response.json()) == project_count
+                assert all(p["test_case_count"] == 1 for p in response.json())
+
+            # Queries issued by one uncached GET, whatever the number of projects
+            response = session.put(f"{self.__class__.url}/tm/projects/PRJ0", json={"labels": []})
+            assert response.status_code == 200
+            queries, batches = count_db_queries(lambda: session.get(f"{self.__class__.url}/tm/projects"))
+            assert queries == 1
+
+            timings.sort()
+            logging.info(f"{project_count} projects: GET /projects "
+                         f"p50 {timings[len(timings) // 2] * 1000:.1f}ms, "
+                         f"max {timings[-1] * 1000:.1f}ms, {queries} DB query (+{batches} getMore batches)")
+
+        # Repair job counts all projects in a constant number of aggregations
+        response = session.post(f"{self.__class__.url}/db-repair",
+                                params={"db_reset_token": "jerry", "dry_run": True})
+        assert response.status_code == 200
+        assert response.json()["projects"]["checked"] == created
+        assert response.json()["projects"]["drifted"] == 0
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_bench_worker_scaling(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ1"
+        cases = BENCH_TEST_CASES_COUNT
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+
+        for i in range(1, cases + 1):
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+            assert response.status_code == 201
+
+        rps = {}
+        for workers in BENCH_WORKER_COUNTS:
+            proc, url = start_server(workers)
+
+            try:
+                def client(_):
+                    # One keep-alive connection per client, spread over the workers by the kernel
+                    with requests.Session() as client_session:
+                        count = 0
+                        deadline = time.perf_counter() + BENCH_DURATION
+                        while time.perf_counter() < deadline:
+                            response = client_session.get(f"{url}/tm/projects/{project_key}/test-cases")
+                            assert response.status_code == 200
+                            count += 1
+
+                        return count
+
+                with ThreadPoolExecutor(max_workers=BENCH_CLIENTS) as pool:
+                    rps[workers] = sum(pool.map(client, range(BENCH_CLIENTS))) / BENCH_DURATION
+
+                # Every worker has the listing cached now; a write through any of them
+                # must be visible through all of them right away
+                response = requests.post(f"{url}/tm/projects/{project_key}/test-case", json={})
+                assert response.status_code == 201
+                cases += 1
+
+                for _ in range(BENCH_CLIENTS):
+                    response = requests.get(f"{url}/tm/projects/{project_key}/test-cases")
+                    assert len(response.json()) == cases
+
+            finally:
+                stop_server(proc)
+
+            logging.info(f"{workers} workers: GET /tm/projects/{{key}}/test-cases "
+                         f"{rps[workers]:.0f} req/s ({BENCH_CLIENTS} clients, "
+                         f"x{rps[workers] / rps[BENCH_WORKER_COUNTS[0]]:.1f})")
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_bench_cache_hit_rate(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        url = self.__class__.url
+        projects = [f"PRJ{i}" for i in range(BENCH_CACHE_PROJECTS)]
+
+        for project_key in projects:
+            response = session.post(f"{url}/tm/projects", json={"project_key": project_key})
+            assert response.status_code == 201
+            for _ in range(10):
+                response = session.post(f"{url}/tm/projects/{project_key}/test-case", json={})
+                assert response.status_code == 201
+
+        # Deleting one project leaves the other projects' cached views alone
+        session.get(f"{url}/tm/projects/PRJ1/test-cases")
+        response = session.delete(f"{url}/tm/projects/PRJ0")
+        assert response.status_code == 204
+        hits = session.get(f"{url}/cache-stats").json()["hits"]
+        session.get(f"{url}/tm/projects/PRJ1/test-cases")
+        assert session.get(f"{url}/cache-stats").json()["hits"] == hits + 1
+        response = session.post(f"{url}/tm/projects", json={"project_key": "PRJ0"})
+        assert response.status_code == 201
+
+        # Mixed workload: 85% reads, 14% writes dirtying one project, 1% project delete and re-create
+        rng = random.Random(7)
+        before = session.get(f"{url}/cache-stats").json()
+        for _ in range(BENCH_CACHE_OPERATIONS):
+            op, project_key = rng.random(), rng.choice(projects)
+            if op < 0.45:
+                session.get(f"{url}/tm/projects/{project_key}/test-cases")
+            elif op < 0.75:
+                session.get(f"{url}/tm/projects/{project_key}")
+            elif op < 0.85:
+                session.get(f"{url}/tm/projects")
+            elif op < 0.95:
+                session.post(f"{url}/tm/projects/{project_key}/cycles")
+            elif op < 0.99:
+                session.post(f"{url}/tm/projects/{project_key}/test-case", json={})
+            else:
+                session.delete(f"{url}/tm/projects/{project_key}")
+                session.post(f"{url}/tm/projects", json={"project_key": project_key})
+        after = session.get(f"{url}/cache-stats").json()
+
+        hits, misses = after["hits"] - before["hits"], after["misses"] - before["misses"]
+        logging.info(f"{BENCH_CACHE_OPERATIONS} mixed operations over {BENCH_CACHE_PROJECTS} projects: "
+                     f"cache hit rate {hits / (hits + misses):.1%} ({hits} hits, {misses} misses), "
+                     f"{after['invalidated'] - before['invalidated']} entries invalidated")
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_bench_json_encoding(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        # Test case documents as MongoClient returns them, with string _ids
+        documents = [{"_id": f"PRJ1-T{i}", "test_case_key": f"PRJ1-T{i}", "seq": i, "project_key": "PRJ1",
+                      "title": f"Vérifier le scénario {i}", "description": "Steps and expected result " * 8,
+                      "folder": "regression/api", "created_at": "2026-01-01T00:00:00Z",
+                      "updated_at": "2026-01-02T00:00:00Z", "status": "READY", "priority": "HIGH",
+                      "test_script": "step\n" * 10, "last_result": "PASS", "last_execution_key": f"PRJ1-E{i}",
+                      "failing_steps": None, "test_frequency": ["PASS", "FAIL", "PASS"],
+                      "labels": ["smoke", "api"], "links": []}
+                     for i in range(1, BENCH_ENCODE_DOCUMENTS + 1)]
+
+        timings = {}
+        for name, response_class in [("stdlib json", StarletteJSONResponse), ("orjson", JSONResponse)]:
+            best = None
+            for _ in range(BENCH_ENCODE_REPEATS):
+                ts = time.perf_counter()
+                body = response_class(documents).body
+                elapsed = time.perf_counter() - ts
+                best = elapsed if best is None else min(best, elapsed)
+
+            timings[name] = (best, body)
+            logging.info(f"{name}: {best / BENCH_ENCODE_DOCUMENTS * 1e6:.2f}us/doc "
+                         f"({len(body) / 1e6:.1f}MB for {BENCH_ENCODE_DOCUMENTS} test cases)")
+
+        # Same bytes on the wire, faster
+        assert timings["orjson"][1] == timings["stdlib json"][1]
+        assert timings["orjson"][0] < timings["stdlib json"][0]
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_bench_filtered_listing(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ1"
+        cases = BENCH_FILTER_TEST_CASES
+        url = f"{self.__class__.url}/tm/projects/{project_key}/test-cases"
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+
+        # One test case in BENCH_FILTER_SELECTIVITY is deprecated
+        def create_test_case(i):
+            return requests.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={
+                "status": "DEPRECATED" if i % BENCH_FILTER_SELECTIVITY == 0 else "READY"
+            }).status_code
+
+        with ThreadPoolExecutor(max_workers=BENCH_CLIENTS) as pool:
+            assert all(code == 201 for code in pool.map(create_test_case, range(1, cases + 1)))
+        matching = cases // BENCH_FILTER_SELECTIVITY
+
+        # Client-side: download the whole project and filter it; uncached, as a paged client would read it
+        timings = {"client-side": [], "server-side": []}
+        for _ in range(BENCH_LIST_REPEATS):
+            ts = time.perf_counter()
+            response = session.get(url, params={"limit": PAGE_LIMIT_MAX})
+            deprecated = [tc for tc in response.json() if tc["status"] == "DEPRECATED"]
+            while "X-Next-Cursor" in response.headers:
+                response = session.get(url, params={"limit": PAGE_LIMIT_MAX,
+                                                    "after": response.headers["X-Next-Cursor"]})
+                deprecated += [tc for tc in response.json() if tc["status"] == "DEPRECATED"]
+            timings["client-side"].append(time.perf_counter() - ts)
+            assert len(deprecated) == matching
+
+            # Server-side: the filter reads only the matching entries of the (project_key, status, seq) index
+            ts = time.perf_counter()
+            response = session.get(url, params={"status": "DEPRECATED"})
+            timings["server-side"].append(time.perf_counter() - ts)
+            assert response.status_code == 200
+            assert [tc["test_case_key"] for tc in response.json()] == [tc["test_case_key"] for tc in deprecated]
+
+        for name, samples in timings.items():
+            samples.sort()
+            logging.info(f"{cases} test cases, {matching} matching: {name} filter "
+                         f"p50 {samples[len(samples) // 2] * 1000:.1f}ms, max {samples[-1] * 1000:.1f}ms")
+
+        assert timings["server-side"][len(timings["server-side"]) // 2] < \
+            timings["client-side"][len(timings["client-side"]) // 2]
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
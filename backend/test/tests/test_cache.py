@@ -0,0 +1,291 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import asyncio
+import json
+import logging
+
+import pytest
+from starlette.requests import Request
+
+from backend.app import cache as orbit_cache
+from backend.app.cache import (
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    cache_get_or_compute,
+    cache_invalidate_tags,
+    cache_tag,
+    cached_response,
+    create_cache_backend,
+    encode_body,
+    project_tags,
+    share_cache_generations,
+    test_case_tags as tc_tags
+)
+from backend.app.responses import JSONResponse
+
+
+async def fill(cache, key: str, value, tags: tuple) -> None:
+    """ Fill the way cache_get_or_compute does: a miss, then the computed value """
+
+    lookup = await cache.get(key)
+    assert lookup.value is None
+    assert await cache.set(key, encode_body(value), tags, lookup.epoch)
+
+
+async def cached(cache, key: str):
+    lookup = await cache.get(key)
+    return None if lookup.value is None else json.loads(lookup.value.body)
+
+
+def body(cached_body):
+    return None if cached_body is None else json.loads(cached_body.body)
+
+
+def get_request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+@pytest.mark.order(14)
+class TestOrbitCache:
+
+    def test_memory_backend_tags(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            cache = MemoryCacheBackend()
+
+            await fill(cache, "projects:all", [{"project_key": "PRJ1"}], (cache_tag("projects"),))
+            await fill(cache, "projects:PRJ1", {"project_key": "PRJ1"}, (cache_tag("projects", "PRJ1"),))
+            await fill(cache, "projects:PRJ10", {"project_key": "PRJ10"}, (cache_tag("projects", "PRJ10"),))
+            await fill(cache, "test_cases:PRJ1", [], (cache_tag("test-cases", "PRJ1"),))
+            await fill(cache, "test_cases:PRJ10", [], (cache_tag("test-cases", "PRJ10"),))
+            assert await cached(cache, "projects:all") == [{"project_key": "PRJ1"}]
+
+            # A test case write in PRJ1 drops PRJ1's listing and the project views only
+            await cache.invalidate_tags(*tc_tags("PRJ1"), *project_tags("PRJ1"))
+            assert await cached(cache, "test_cases:PRJ1") is None
+            assert await cached(cache, "projects:PRJ1") is None
+            assert await cached(cache, "projects:all") is None
+            assert await cached(cache, "test_cases:PRJ10") == []
+            assert await cached(cache, "projects:PRJ10") == {"project_key": "PRJ10"}
+            assert cache.stats()["invalidated"] == 3
+
+            # A value read from the database before a racing invalidation is not cached
+            lookup = await cache.get("projects:PRJ1")
+            await cache.invalidate_tags(*project_tags("PRJ1"))
+            assert not await cache.set("projects:PRJ1", encode_body({"stale": True}),
+                                       (cache_tag("projects", "PRJ1"),), lookup.epoch)
+            await fill(cache, "projects:PRJ1", {"stale": False}, (cache_tag("projects", "PRJ1"),))
+            assert await cached(cache, "projects:PRJ1") == {"stale": False}
+            assert cache.stats()["skipped_fills"] == 1
+
+            await cache.clear()
+            assert await cached(cache, "test_cases:PRJ10") is None
+            assert cache.stats()["size"] == 0
+            assert cache.stats()["tags"] == 0
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_memory_backend_shared_generations(self, request, tmp_path, monkeypatch):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            monkeypatch.delenv("ORBIT_CACHE_GENERATIONS", raising=False)
+            share_cache_generations(tmp_path / "cache-generations")
+
+            # Two workers, each with its own entries, mapping the same counters
+            worker_a, worker_b = create_cache_backend("memory"), create_cache_backend("memory")
+            for worker in (worker_a, worker_b):
+                await fill(worker, "test_cases:PRJ1", ["PRJ1-T1"], (cache_tag("test-cases", "PRJ1"),))
+                await fill(worker, "test_cases:PRJ2", ["PRJ2-T1"], (cache_tag("test-cases", "PRJ2"),))
+                assert await cached(worker, "test_cases:PRJ1") == ["PRJ1-T1"]
+
+            # A write handled by worker A is not followed by a stale read on worker B
+            await worker_a.invalidate_tags(*tc_tags("PRJ1"))
+            assert await cached(worker_b, "test_cases:PRJ1") is None
+            assert await cached(worker_b, "test_cases:PRJ2") == ["PRJ2-T1"]
+
+            await worker_a.clear()
+            assert await cached(worker_b, "test_cases:PRJ2") is None
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_redis_backend_invalidation_race(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        pytest.importorskip("redis")
+
+        async def scenario():
+            cache = RedisCacheBackend(namespace="orbit:test-cache:")
+            try:
+                await cache.clear()
+            except Exception as err:
+                pytest.skip(f"No Redis server at CACHE_REDIS_URL: {err}")
+
+            tags = (cache_tag("projects", "PRJ1"),)
+            invalidate = cache._invalidate
+
+            # A fill landing between the lookup and the invalidation is dropped by it
+            lookup = await cache.get("projects:PRJ1")
+
+            async def fill_then_invalidate(**kwargs):
+                assert await cache.set("projects:PRJ1", encode_body({"stale": True}), tags, lookup.epoch)
+                return await invalidate(**kwargs)
+
+            cache._invalidate = fill_then_invalidate
+            await cache.invalidate_tags(*tags)
+            cache._invalidate = invalidate
+            assert await cached(cache, "projects:PRJ1") is None
+
+            # A fill of a value read before the invalidation, landing after it, is refused
+            assert not await cache.set("projects:PRJ1", encode_body({"stale": True}), tags, lookup.epoch)
+            assert await cached(cache, "projects:PRJ1") is None
+
+            # Fills racing invalidations never leave a value older than the last write
+            for _ in range(50):
+                lookup = await cache.get("projects:PRJ1")
+                await asyncio.gather(cache.set("projects:PRJ1", encode_body({"stale": True}), tags, lookup.epoch),
+                                     cache.invalidate_tags(*tags))
+                assert await cached(cache, "projects:PRJ1") is None
+
+            await fill(cache, "projects:PRJ1", {"stale": False}, tags)
+            assert await cached(cache, "projects:PRJ1") == {"stale": False}
+
+            await cache.clear()
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_single_flight(self, request, monkeypatch):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            monkeypatch.setattr(orbit_cache, "_backend", MemoryCacheBackend())
+            tags = (cache_tag("projects"),)
+            calls = []
+
+            async def compute():
+                calls.append(len(calls) + 1)
+                read = calls[-1]
+                await asyncio.sleep(0.05)
+                return [f"read {read}"]
+
+            # A burst of misses runs one computation
+            results = await asyncio.gather(*[cache_get_or_compute("projects:all", compute, tags)
+                                             for _ in range(50)])
+            assert [body(result) for result in results] == [["read 1"]] * 50
+            assert len(calls) == 1
+            assert orbit_cache.cache_stats()["coalesced"] == 49
+            assert body(await cache_get_or_compute("projects:all", compute, tags)) == ["read 1"]
+
+            # Requests after a write do not join a computation that started before it
+            await cache_invalidate_tags(*project_tags("PRJ1"))
+            before = asyncio.create_task(cache_get_or_compute("projects:all", compute, tags))
+            await asyncio.sleep(0.01)
+            await cache_invalidate_tags(*project_tags("PRJ1"))
+            after = await cache_get_or_compute("projects:all", compute, tags)
+
+            assert body(await before) == ["read 2"]
+            assert body(after) == ["read 3"]
+            assert body(await cache_get_or_compute("projects:all", compute, tags)) == ["read 3"]
+
+            # Not found is returned, not cached
+            async def missing():
+                calls.append(len(calls))
+
+            assert await cache_get_or_compute("projects:PRJ9", missing, tags) is None
+            assert await cache_get_or_compute("projects:PRJ9", missing, tags) is None
+            assert len(calls) == 5
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_stale_while_revalidate(self, request, monkeypatch):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            monkeypatch.setattr(orbit_cache, "_backend", MemoryCacheBackend(ttl=0.2, stale_ttl=60))
+            tags = (cache_tag("projects"),)
+            calls = []
+
+            async def compute():
+                calls.append(len(calls) + 1)
+                read = calls[-1]
+                await asyncio.sleep(0.05)
+                return read
+
+            assert body(await cache_get_or_compute("projects:all", compute, tags)) == 1
+            await asyncio.sleep(0.25)
+
+            # Expired: the old value is served at once while one refresh runs
+            results = await asyncio.gather(*[cache_get_or_compute("projects:all", compute, tags)
+                                             for _ in range(10)])
+            assert [body(result) for result in results] == [1] * 10
+            await asyncio.sleep(0.1)
+            assert len(calls) == 2
+            assert body(await cache_get_or_compute("projects:all", compute, tags)) == 2
+
+            # Invalidated entries are never served stale
+            await cache_invalidate_tags(*project_tags("PRJ1"))
+            assert body(await cache_get_or_compute("projects:all", compute, tags)) == 3
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_etag_revalidation(self, request, monkeypatch):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            monkeypatch.setattr(orbit_cache, "_backend", MemoryCacheBackend())
+            tags = (cache_tag("test-cases", "PRJ1"),)
+            listing = [{"test_case_key": "PRJ1-T1", "title": "Vérifier"}]
+
+            async def compute():
+                return listing
+
+            # The body is encoded once, byte for byte what JSONResponse would send
+            cached = await cache_get_or_compute("test_cases:PRJ1", compute, tags)
+            assert cached.body == JSONResponse(listing).body
+            assert (await cache_get_or_compute("test_cases:PRJ1", compute, tags)).etag == cached.etag
+
+            response = cached_response(get_request(), cached)
+            assert response.status_code == 200
+            assert response.body == cached.body
+            assert response.headers["etag"] == cached.etag
+
+            for if_none_match in (cached.etag, f"W/{cached.etag}", f'"other", {cached.etag}', "*"):
+                response = cached_response(get_request(if_none_match), cached)
+                assert response.status_code == 304
+                assert response.body == b""
+                assert response.headers["etag"] == cached.etag
+
+            # A write changes the body, so the client's copy is no longer current
+            listing.append({"test_case_key": "PRJ1-T2", "title": None})
+            await cache_invalidate_tags(*tc_tags("PRJ1"))
+            changed = await cache_get_or_compute("test_cases:PRJ1", compute, tags)
+            assert changed.etag != cached.etag
+            assert cached_response(get_request(cached.etag), changed).status_code == 200
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_unknown_backend(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        with pytest.raises(ValueError):
+            create_cache_backend("memcached")
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
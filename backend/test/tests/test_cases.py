@@ -6,8 +6,11 @@
 # ================================================================
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+import requests
 
 from .test_base import OrbitTMBaseTest
 
@@ -160,6 +163,162 @@ class TestOrbitTMCases(OrbitTMBaseTest):
         self.__class__.reset_db()
         logging.info(f"--- Test: {request.node.name} Complete ---")
 
+    def test_get_all_test_cases_by_project_paginated(self, request):
+        """GET /projects/{key}/test-cases?limit=N walks every key once, in order, via cursors."""
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ-PAGE"
+        self._create_project(session, project_key)
+
+        for _ in range(12):
+            self._create_test_case(session, project_key)
+
+        # Follow X-Next-Cursor until the last page
+        keys, pages, params = [], 0, {"limit": 5}
+        while True:
+            response = session.get(f"{self.__class__.url}/tm/projects/{project_key}/test-cases", params=params)
+            assert response.status_code == 200
+            assert len(response.json()) <= 5
+            keys += [tc["test_case_key"] for tc in response.json()]
+            pages += 1
+
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if next_cursor is None:
+                assert "Link" not in response.headers
+                break
+
+            assert 'rel="next"' in response.headers["Link"]
+            params = {"limit": 5, "after": next_cursor}
+
+        assert pages == 3
+        assert keys == [f"{project_key}-T{i}" for i in range(1, 13)]
+
+        # Every test case carries the numeric part of its key as seq
+        response = session.get(f"{self.__class__.url}/tm/projects/{project_key}/test-cases")
+        assert [tc["seq"] for tc in response.json()] == list(range(1, 13))
+
+        # Malformed cursor and out-of-range limit are rejected
+        response = session.get(f"{self.__class__.url}/tm/projects/{project_key}/test-cases",
+                               params={"limit": 5, "after": "not-a-cursor"})
+        assert response.status_code == 400
+
+        response = session.get(f"{self.__class__.url}/tm/projects/{project_key}/test-cases",
+                               params={"limit": 0})
+        assert response.status_code == 422
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_get_all_test_cases_by_project_projected(self, request):
+        """GET /projects/{key}/test-cases?view=summary / ?fields= returns only the asked fields."""
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ-VIEW"
+        url = f"{self.__class__.url}/tm/projects/{project_key}/test-cases"
+        self._create_project(session, project_key)
+
+        for i in range(3):
+            self._create_test_case(session, project_key, {"title": f"Case {i}", "description": "d" * 500,
+                                                          "test_script": "s" * 500, "labels": ["smoke"]})
+
+        full = session.get(url).json()
+        assert "description" in full[0]
+
+        # Summary view drops the free-text fields and is cached apart from the full listing
+        response = session.get(url, params={"view": "summary"})
+        assert response.status_code == 200
+        summary = response.json()
+        assert set(summary[0]) == {"_id", "test_case_key", "project_key", "seq", "title", "status",
+                                   "last_result", "labels"}
+        assert [tc["title"] for tc in summary] == [tc["title"] for tc in full]
+        assert session.get(url).json() == full
+
+        # Arbitrary fields, always with key, project and seq
+        response = session.get(url, params={"fields": "title,labels"})
+        assert response.status_code == 200
+        assert set(response.json()[0]) == {"_id", "test_case_key", "project_key", "seq", "title", "labels"}
+
+        # Projected pages still carry cursors
+        response = session.get(url, params={"view": "summary", "limit": 2})
+        assert len(response.json()) == 2
+        response = session.get(url, params={"view": "summary", "limit": 2,
+                                            "after": response.headers["X-Next-Cursor"]})
+        assert [tc["test_case_key"] for tc in response.json()] == [f"{project_key}-T3"]
+
+        # A write invalidates every projection of the listing
+        response = session.put(f"{url}/{project_key}-T1", json={"title": "Renamed"})
+        assert response.status_code == 200
+        assert session.get(url, params={"view": "summary"}).json()[0]["title"] == "Renamed"
+        assert session.get(url, params={"fields": "title"}).json()[0]["title"] == "Renamed"
+
+        response = session.get(url, params={"fields": "title,secret"})
+        assert response.status_code == 400
+        response = session.get(url, params={"fields": "title", "view": "summary"})
+        assert response.status_code == 400
+        response = session.get(url, params={"view": "compact"})
+        assert response.status_code == 422
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_get_all_test_cases_by_project_filtered(self, request):
+        """GET /projects/{key}/test-cases?status=&label=&sort= filters and sorts in the database."""
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ-FILTER"
+        url = f"{self.__class__.url}/tm/projects/{project_key}/test-cases"
+        self._create_project(session, project_key)
+
+        for i in range(6):
+            self._create_test_case(session, project_key, {"status": ["READY", "DRAFT", "DEPRECATED"][i % 3],
+                                                          "labels": ["smoke"] if i < 2 else []})
+
+        def keys(response):
+            assert response.status_code == 200
+            return [tc["test_case_key"] for tc in response.json()]
+
+        # Repeated values match any of them; different filters all apply
+        assert keys(session.get(url, params={"status": "READY"})) == [f"{project_key}-T1", f"{project_key}-T4"]
+        assert keys(session.get(url, params={"status": ["READY", "DRAFT"]})) == \
+            [f"{project_key}-T{i}" for i in (1, 2, 4, 5)]
+        assert keys(session.get(url, params={"status": "DRAFT", "label": "smoke"})) == [f"{project_key}-T2"]
+        assert keys(session.get(url, params={"status": "UNKNOWN"})) == []
+
+        # Descending sort, page by page
+        response = session.get(url, params={"sort": "-seq", "limit": 4})
+        assert keys(response) == [f"{project_key}-T{i}" for i in (6, 5, 4, 3)]
+        response = session.get(url, params={"sort": "-seq", "limit": 4, "after": response.headers["X-Next-Cursor"]})
+        assert keys(response) == [f"{project_key}-T2", f"{project_key}-T1"]
+
+        # Filtered listings are read fresh after a write (updated_at has one-second resolution)
+        time.sleep(1)
+        response = session.put(f"{url}/{project_key}-T3", json={"status": "READY"})
+        assert response.status_code == 200
+        assert keys(session.get(url, params={"status": "READY"})) == [f"{project_key}-T{i}" for i in (1, 3, 4)]
+
+        # Most recently updated first, with projections
+        response = session.get(url, params={"sort": "-updated_at", "view": "summary", "limit": 1})
+        assert keys(response) == [f"{project_key}-T3"]
+        assert "updated_at" in response.json()[0]
+
+        # Across projects
+        response = session.get(f"{self.__class__.url}/tm/test-cases", params={"status": "DEPRECATED"})
+        assert keys(response) == [f"{project_key}-T6"]
+        response = session.get(f"{self.__class__.url}/tm/test-cases", params={"sort": "-updated_at", "limit": 1})
+        assert keys(response) == [f"{project_key}-T3"]
+
+        response = session.get(url, params={"sort": "title"})
+        assert response.status_code == 422
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
     # ------------------------------------------------------------------
     # POST /tm/projects/{project_key}/test-case
     # ------------------------------------------------------------------
@@ -377,6 +536,41 @@ class TestOrbitTMCases(OrbitTMBaseTest):
         self.__class__.reset_db()
         logging.info(f"--- Test: {request.node.name} Complete ---")
 
+    def test_create_test_case_concurrent_labels(self, request):
+        """Concurrent creates with different labels must all reach the project, with its count."""
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ-LBL"
+        self._create_project(session, project_key)
+
+        writers = 20
+
+        def create(i):
+            return requests.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case",
+                                 json={"labels": [f"label-{i}"]}).status_code
+
+        with ThreadPoolExecutor(max_workers=writers) as pool:
+            assert all(code == 201 for code in pool.map(create, range(writers)))
+
+        response = session.get(f"{self.__class__.url}/tm/projects/{project_key}")
+        assert response.status_code == 200
+        assert sorted(response.json()["labels"]) == sorted(f"label-{i}" for i in range(writers))
+        assert response.json()["test_case_count"] == writers
+
+        # A label update merges too, without touching the counters
+        response = session.put(f"{self.__class__.url}/tm/projects/{project_key}/test-cases/{project_key}-T1",
+                               json={"labels": ["label-0", "extra"]})
+        assert response.status_code == 200
+        response = session.get(f"{self.__class__.url}/tm/projects/{project_key}")
+        assert "extra" in response.json()["labels"]
+        assert len(response.json()["labels"]) == writers + 1
+        assert response.json()["test_case_count"] == writers
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
     # ------------------------------------------------------------------
     # DELETE /tm/projects/{project_key}/test-cases
     # ------------------------------------------------------------------
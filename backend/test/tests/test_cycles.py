@@ -168,6 +168,53 @@ class TestOrbitTMCycles(OrbitTMBaseTest):
         logging.info(f"--- Starting test: {request.node.name} ---")
         self.__class__.reset_db()
 
+        session = self.__class__.session
+        project_key = "PRJ0"
+        test_case_key = f"{project_key}-T1"
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+        assert response.status_code == 201
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/cycles")
+        assert response.status_code == 201
+        cycle_key = response.json()["test_cycle_key"]
+
+        # Two executions of the same test case
+        for result in ["NOT_EXECUTED", "PASS"]:
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}"
+                                    f"/test-cases/{test_case_key}/executions", json={"result": result})
+            assert response.status_code == 201
+
+        response = session.post(f"{self.__class__.url}/tm/cycles/{cycle_key}/executions",
+                                params={"execution_key": f"{project_key}-E1"})
+        assert response.status_code == 200
+        assert response.json()["executions"] == {f"{project_key}-E1": "NOT_EXECUTED"}
+        assert response.json()["status"] == "NOT_STARTED"
+
+        # Adding the newer execution replaces the older one for the same test case
+        response = session.post(f"{self.__class__.url}/tm/cycles/{cycle_key}/executions",
+                                params={"execution_key": f"{project_key}-E2"})
+        assert response.status_code == 200
+        assert response.json()["executions"] == {f"{project_key}-E2": "PASS"}
+        assert response.json()["status"] == "COMPLETE"
+        assert response.json()["execution_count"] == 1
+        assert response.json()["result_counts"]["PASS"] == 1
+        assert response.json()["result_counts"]["NOT_EXECUTED"] == 0
+
+        response = session.get(f"{self.__class__.url}/tm/executions/{project_key}-E1")
+        assert response.json()["test_cycle_key"] is None
+
+        # Unknown execution / cycle
+        response = session.post(f"{self.__class__.url}/tm/cycles/{cycle_key}/executions",
+                                params={"execution_key": f"{project_key}-E99"})
+        assert response.status_code == 404
+        response = session.post(f"{self.__class__.url}/tm/cycles/{project_key}-C99/executions",
+                                params={"execution_key": f"{project_key}-E2"})
+        assert response.status_code == 404
+
+        self.__class__.assert_db_consistent()
+
         self.__class__.reset_db()
         logging.info(f"--- Test: {request.node.name} Complete ---")
 
@@ -175,5 +222,47 @@ class TestOrbitTMCycles(OrbitTMBaseTest):
         logging.info(f"--- Starting test: {request.node.name} ---")
         self.__class__.reset_db()
 
+        session = self.__class__.session
+        project_key = "PRJ0"
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+        for i in range(1, 3):
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+            assert response.status_code == 201
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/cycles")
+        cycle_key = response.json()["test_cycle_key"]
+
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "test_cycle_key": cycle_key,
+            "executions": [{"test_case_key": f"{project_key}-T1", "result": "PASS"},
+                           {"test_case_key": f"{project_key}-T2", "result": "NOT_EXECUTED"}]
+        })
+        assert response.status_code == 201
+
+        response = session.delete(f"{self.__class__.url}/tm/cycles/{cycle_key}/executions/{project_key}-E2")
+        assert response.status_code == 200
+        assert response.json()["executions"] == {f"{project_key}-E1": "PASS"}
+        assert response.json()["status"] == "COMPLETE"
+
+        response = session.get(f"{self.__class__.url}/tm/executions/{project_key}-E2")
+        assert response.json()["test_cycle_key"] is None
+
+        # Removing again reports the execution is not in the cycle
+        response = session.delete(f"{self.__class__.url}/tm/cycles/{cycle_key}/executions/{project_key}-E2")
+        assert response.status_code == 404
+        assert response.json()["error"] == f"Execution {project_key}-E2 not in cycle {cycle_key}"
+
+        # Deleting a member execution keeps the cycle counters in step
+        response = session.delete(f"{self.__class__.url}/tm/executions/{project_key}-E1")
+        assert response.status_code == 204
+
+        response = session.get(f"{self.__class__.url}/tm/cycles/{cycle_key}")
+        assert response.json()["executions"] == {}
+        assert response.json()["execution_count"] == 0
+        assert response.json()["status"] == "NOT_STARTED"
+
+        self.__class__.assert_db_consistent()
+
         self.__class__.reset_db()
         logging.info(f"--- Test: {request.node.name} Complete ---")
@@ -5,9 +5,13 @@
 # License: MIT
 # ================================================================
 
+import datetime
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+import requests
 
 from .test_base import OrbitTMBaseTest
 
@@ -98,6 +102,212 @@ class TestOrbitTMExecutions(OrbitTMBaseTest):
         self.__class__.reset_db()
         logging.info(f"--- Test: {request.node.name} Complete ---")
 
+    def test_create_executions_bulk(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ0"
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={
+            "project_key": project_key,
+            "description": "Project #0"
+        })
+        assert response.status_code == 201
+
+        n = 5
+        for i in range(1, n + 1):
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+            assert response.status_code == 201
+
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/cycles")
+        assert response.status_code == 201
+        cycle_key = response.json()["test_cycle_key"]
+
+        # Bulk create one execution per test case plus an invalid item, targeting the cycle
+        executions = [{"test_case_key": f"{project_key}-T{i}", "result": "PASS"} for i in range(1, n + 1)]
+        executions.append({"test_case_key": f"{project_key}-T99", "result": "PASS"})
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "test_cycle_key": cycle_key,
+            "executions": executions
+        })
+        assert response.status_code == 201
+        assert response.json()["created"] == n
+        assert response.json()["failed"] == 1
+
+        results = response.json()["results"]
+        assert [r["execution_key"] for r in results[:n]] == [f"{project_key}-E{i}" for i in range(1, n + 1)]
+        assert results[n]["status_code"] == 404
+
+        # Test cases point at their new executions
+        response = session.get(f"{self.__class__.url}/tm/projects/{project_key}/test-cases/{project_key}-T1")
+        assert response.status_code == 200
+        assert response.json()["last_execution_key"] == f"{project_key}-E1"
+        assert response.json()["last_result"] == "PASS"
+
+        # Cycle membership merged and status recomputed
+        response = session.get(f"{self.__class__.url}/tm/cycles/{cycle_key}")
+        assert response.status_code == 200
+        assert len(response.json()["executions"]) == n
+        assert response.json()["status"] == "COMPLETE"
+
+        # A second batch for the same test case displaces its previous cycle member
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "test_cycle_key": cycle_key,
+            "executions": [{"test_case_key": f"{project_key}-T1", "result": "NOT_EXECUTED"}]
+        })
+        assert response.status_code == 201
+        assert response.json()["results"][0]["execution_key"] == f"{project_key}-E{n + 1}"
+
+        response = session.get(f"{self.__class__.url}/tm/cycles/{cycle_key}")
+        assert len(response.json()["executions"]) == n
+        assert f"{project_key}-E1" not in response.json()["executions"]
+        assert response.json()["status"] == "IN_PROGRESS"
+
+        response = session.get(f"{self.__class__.url}/tm/executions/{project_key}-E1")
+        assert response.json()["test_cycle_key"] is None
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_create_executions_bulk_concurrent_duplicates(self, request):
+        """Concurrent batches reusing one execution key create it once; the rest report it per item."""
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ0"
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+        for _ in range(2):
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+            assert response.status_code == 201
+
+        writers = 10
+        execution_key = f"{project_key}-E100"
+
+        def create_bulk(_):
+            return requests.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+                "executions": [{"execution_key": execution_key, "test_case_key": f"{project_key}-T1"},
+                               {"test_case_key": f"{project_key}-T2"}]
+            })
+
+        with ThreadPoolExecutor(max_workers=writers) as pool:
+            responses = list(pool.map(create_bulk, range(writers)))
+
+        assert all(r.status_code == 201 for r in responses)
+        first_items = [r.json()["results"][0] for r in responses]
+        assert [item["status_code"] for item in first_items].count(201) == 1
+        assert all(item["error"] == f"{execution_key} already exists"
+                   for item in first_items if item["status_code"] == 400)
+        assert sum(r.json()["created"] for r in responses) == writers + 1
+        assert sum(r.json()["failed"] for r in responses) == writers - 1
+
+        # Only the inserted executions are counted
+        response = session.get(f"{self.__class__.url}/tm/projects/{project_key}")
+        assert response.json()["test_execution_count"] == writers + 1
+
+        self.__class__.assert_db_consistent()
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_stream_executions_by_project(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ0"
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+        assert response.status_code == 201
+
+        n = 25
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "executions": [{"test_case_key": f"{project_key}-T1", "result": "PASS"} for _ in range(n)]
+        })
+        assert response.status_code == 201
+
+        url = f"{self.__class__.url}/tm/projects/{project_key}/executions"
+        expected = session.get(url).json()
+        assert len(expected) == n
+
+        # Same documents, one per line, asked for by parameter or by Accept header
+        for kwargs in ({"params": {"stream": True}}, {"headers": {"Accept": "application/x-ndjson"}}):
+            response = session.get(url, stream=True, **kwargs)
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-ndjson"
+            assert [json.loads(line) for line in response.iter_lines() if line] == expected
+
+        # Cursor and limit apply as for pages
+        response = session.get(url, params={"limit": 10})
+        cursor = response.headers["X-Next-Cursor"]
+        response = session.get(url, params={"stream": True, "after": cursor, "limit": 5})
+        assert [json.loads(line) for line in response.iter_lines() if line] == expected[10:15]
+
+        response = session.get(url, params={"stream": True, "after": "not-a-cursor"})
+        assert response.status_code == 400
+
+        response = session.get(f"{self.__class__.url}/tm/projects/PRJ9/executions", params={"stream": True})
+        assert response.status_code == 404
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_get_executions_by_project_filtered(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ0"
+
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+        assert response.status_code == 201
+
+        n = 4
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "executions": [{"test_case_key": f"{project_key}-T1", "result": ["PASS", "FAIL"][i % 2]} for i in range(n)]
+        })
+        assert response.status_code == 201
+
+        url = f"{self.__class__.url}/tm/projects/{project_key}/executions"
+
+        def keys(response):
+            assert response.status_code == 200
+            return [te["execution_key"] for te in response.json()]
+
+        assert keys(session.get(url, params={"result": "FAIL"})) == [f"{project_key}-E2", f"{project_key}-E4"]
+        assert keys(session.get(url, params={"result": ["PASS", "FAIL"]})) == [f"{project_key}-E{i}" for i in range(1, 5)]
+
+        # Bounds are inclusive after, exclusive before, in any timezone
+        started_at = datetime.datetime.fromisoformat(session.get(url).json()[0]["started_at"].replace("Z", "+00:00"))
+        assert len(keys(session.get(url, params={"started_after": started_at.isoformat()}))) == n
+        assert keys(session.get(url, params={"started_before": started_at.isoformat()})) == []
+        response = session.get(url, params={
+            "started_after": (started_at - datetime.timedelta(days=1)).astimezone(
+                datetime.timezone(datetime.timedelta(hours=2))).isoformat(),
+            "started_before": (started_at + datetime.timedelta(seconds=1)).isoformat()
+        })
+        assert len(keys(response)) == n
+
+        # Latest first (ties newest key first), also when streamed
+        response = session.get(url, params={"result": "PASS", "sort": "-started_at"})
+        assert keys(response) == [f"{project_key}-E3", f"{project_key}-E1"]
+        response = session.get(url, params={"result": "PASS", "sort": "-started_at", "stream": True}, stream=True)
+        assert [json.loads(line)["execution_key"] for line in response.iter_lines() if line] == \
+            [f"{project_key}-E3", f"{project_key}-E1"]
+
+        response = session.get(url, params={"started_after": "yesterday"})
+        assert response.status_code == 422
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
     def test_delete_all_executions_by_test_key(self, request):
         logging.info(f"--- Starting test: {request.node.name} ---")
         self.__class__.reset_db()
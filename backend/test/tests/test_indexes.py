@@ -0,0 +1,58 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import logging
+
+import pytest
+
+from .test_base import OrbitTMBaseTest
+
+
+@pytest.mark.order(7)
+class TestOrbitTMIndexes(OrbitTMBaseTest):
+
+    def test_query_shapes_use_indexes(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+        self.__class__.reset_db()
+
+        session = self.__class__.session
+        project_key = "PRJ"
+
+        # Populate every collection so the planner has real data to choose from
+        response = session.post(f"{self.__class__.url}/tm/projects", json={"project_key": project_key})
+        assert response.status_code == 201
+
+        for i in range(1, 4):
+            response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/test-case", json={})
+            assert response.status_code == 201
+
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/cycles")
+        assert response.status_code == 201
+
+        response = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "test_cycle_key": response.json()["test_cycle_key"],
+            "executions": [{"test_case_key": f"{project_key}-T{i}"} for i in range(1, 4)]
+        })
+        assert response.status_code == 201
+
+        # The audit is a maintenance endpoint, like db-reset and db-repair
+        response = session.get(f"{self.__class__.url}/db-index-audit")
+        assert response.status_code == 422
+        response = session.get(f"{self.__class__.url}/db-index-audit", params={"db_reset_token": "wrong"})
+        assert response.status_code == 400
+
+        # Every registered query shape must be served by an index
+        response = session.get(f"{self.__class__.url}/db-index-audit", params={"db_reset_token": "jerry"})
+        assert response.status_code == 200
+        assert response.json()["shapes"] > 0
+
+        collscans = [f"{r['collection']}: {r['shape']} {r['stages']}"
+                     for r in response.json()["results"] if r["collscan"]]
+        assert collscans == []
+
+        self.__class__.reset_db()
+        logging.info(f"--- Test: {request.node.name} Complete ---")
@@ -0,0 +1,109 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import asyncio
+import logging
+import uuid
+
+import pytest
+
+from backend.app.app_def import (
+    DB_NAME_RUNNERS,
+    DB_COLLECTION_LEASES
+)
+from backend.db.mongodb import MongoClient
+from backend.module.lease import Lease
+
+
+async def mongo_client() -> MongoClient:
+    mdb = MongoClient()
+    await mdb.connect()
+    await mdb.configure()
+
+    return mdb
+
+
+@pytest.mark.order(13)
+class TestOrbitLease:
+    """ Runs against the MongoDB the backend server uses (MONGODB_* environment). """
+
+    def test_lease_contention_expiry_and_release(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            mdb = await mongo_client()
+            name = f"test-lease-{uuid.uuid4().hex}"
+
+            try:
+                first = Lease(mdb, name, ttl=1, owner="first")
+                second = Lease(mdb, name, ttl=1, owner="second")
+
+                # Only one owner holds the lease; the holder can renew it
+                assert await first.acquire()
+                assert not await second.acquire()
+                assert await first.acquire()
+
+                # An expired lease is taken over
+                await asyncio.sleep(1.2)
+                assert await second.acquire()
+                assert not await first.acquire()
+
+                # Releasing frees it right away; releasing someone else's lease does nothing
+                await first.release()
+                assert not await first.acquire()
+                await second.release()
+                assert await first.acquire()
+
+            finally:
+                await mdb.delete(DB_NAME_RUNNERS.name, DB_COLLECTION_LEASES.name, {"_id": name})
+                await mdb.close()
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_lease_runs_job_on_one_owner(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            mdb = await mongo_client()
+            name = f"test-lease-{uuid.uuid4().hex}"
+            running = []
+
+            def job_for(owner):
+                async def job():
+                    running.append(owner)
+                    await asyncio.Event().wait()
+
+                return job
+
+            leases = [Lease(mdb, name, ttl=0.6, owner=owner) for owner in ("first", "second")]
+            tasks = [asyncio.create_task(lease.run(job_for(lease.owner))) for lease in leases]
+
+            try:
+                await asyncio.sleep(1)
+                assert len(running) == 1
+
+                # The holder shuts down and releases the lease; the standby takes over
+                holder = ("first", "second").index(running[0])
+                tasks[holder].cancel()
+                await asyncio.gather(tasks[holder], return_exceptions=True)
+
+                await asyncio.sleep(1)
+                assert running == [leases[holder].owner, leases[1 - holder].owner]
+
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await mdb.delete(DB_NAME_RUNNERS.name, DB_COLLECTION_LEASES.name, {"_id": name})
+                await mdb.close()
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
@@ -248,6 +248,25 @@ class TestOrbitTMProjects(OrbitTMBaseTest):
         assert project["test_case_count"] == 3
         assert project["test_cycle_count"] == 2
 
+        # Executions and deletes keep the counters in step
+        r = session.post(f"{self.__class__.url}/tm/projects/{project_key}/executions/bulk", json={
+            "executions": [{"test_case_key": f"{project_key}-T{i}"} for i in range(1, 4)]
+        })
+        assert r.status_code == 201
+
+        r = session.delete(f"{self.__class__.url}/tm/executions/{project_key}-E3")
+        assert r.status_code == 204
+
+        r = session.delete(f"{self.__class__.url}/tm/projects/{project_key}/test-cases/{project_key}-T3")
+        assert r.status_code == 204
+
+        response = session.get(f"{self.__class__.url}/tm/projects/{project_key}")
+        assert response.json()["test_case_count"] == 2
+        assert response.json()["test_cycle_count"] == 2
+        assert response.json()["test_execution_count"] == 2
+
+        self.__class__.assert_db_consistent()
+
         self.__class__.reset_db()
         logging.info(f"--- Test: {request.node.name} Complete ---")
 
@@ -0,0 +1,108 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import datetime
+import json
+import logging
+
+import pytest
+
+from .test_base import OrbitTMBaseTest
+from .test_webhooks import EVENTS_FILE
+
+
+@pytest.mark.order(10)
+class TestOrbitRunnerHistory(OrbitTMBaseTest):
+
+    def test_runner_history_range(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        self.reset_db()
+
+        # Replayed events are the only samples: runner-1 busy then idle, runner-2 busy
+        for event in json.loads(EVENTS_FILE.read_text()):
+            self.send_webhook(event["event"], event["payload"])
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        params = {"start": (now - datetime.timedelta(hours=1)).isoformat(),
+                  "end": (now + datetime.timedelta(minutes=5)).isoformat(),
+                  "resolution": "minute"}
+
+        response = self.__class__.session.get(f"{self.url}/runners/history/orbit-webhook-runner-1",
+                                              params=params)
+        assert response.status_code == 200
+        history = response.json()
+        assert history["resolution"] == "minute"
+
+        # Columnar: parallel arrays, ascending buckets
+        assert len(history["ts"]) == len(history["samples"]) == len(history["busy"]) == len(history["online"])
+        assert history["ts"] == sorted(history["ts"])
+        assert sum(history["samples"]) == 2
+        assert all(0 <= value <= 1 for value in history["busy"] + history["online"])
+
+        response = self.__class__.session.get(f"{self.url}/runners/history/orbit-webhook-runner-2",
+                                              params=params)
+        assert response.status_code == 200
+        assert response.json()["busy"] == [1]
+
+        # Unknown runner: empty columns
+        response = self.__class__.session.get(f"{self.url}/runners/history/no-such-runner", params=params)
+        assert response.status_code == 200
+        assert response.json()["ts"] == []
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_runner_history_resolution(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        url = f"{self.url}/runners/history/orbit-webhook-runner-1"
+        now = datetime.datetime.now(datetime.timezone.utc)
+        quarter = {"start": (now - datetime.timedelta(days=90)).isoformat(), "end": now.isoformat()}
+
+        # 90 days resolve to hourly buckets from the rollup
+        response = self.__class__.session.get(url, params=quarter)
+        assert response.status_code == 200
+        assert response.json()["resolution"] == "hour"
+
+        response = self.__class__.session.get(url, params={**quarter, "resolution": "minute"})
+        assert response.status_code == 400
+
+        response = self.__class__.session.get(url, params={**quarter, "resolution": "minute",
+                                                           "bin_size": 60})
+        assert response.status_code == 200
+
+        response = self.__class__.session.get(url, params={"start": quarter["end"], "end": quarter["start"]})
+        assert response.status_code == 400
+
+        response = self.__class__.session.get(url, params={"resolution": "week"})
+        assert response.status_code == 422
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_runner_usage_endpoints(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        for dimension in ("runner", "designation", "job", "user", "online"):
+            response = self.__class__.session.get(f"{self.url}/runners/usage/{dimension}", params={"limit": 10})
+            assert response.status_code == 200
+            usage = response.json()
+            assert usage["dimension"] == dimension
+            assert len(usage["items"]) <= 10
+
+        response = self.__class__.session.get(f"{self.url}/runners/usage/repo")
+        assert response.status_code == 422
+
+        response = self.__class__.session.get(f"{self.url}/runners/usage/user",
+                                              params={"start": "2025-02-01", "end": "2025-01-01"})
+        assert response.status_code == 400
+
+        response = self.__class__.session.get(f"{self.url}/runners/fleet")
+        assert response.status_code == 200
+        fleet = response.json()
+        assert len(fleet["ts"]) == len(fleet["busy"]) == len(fleet["online"]) == len(fleet["total"])
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
@@ -0,0 +1,67 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import asyncio
+import logging
+
+import pytest
+
+from backend.module.runner_stream import (
+    RESYNC,
+    RunnerStatusBroker,
+    runner_status_diff
+)
+
+
+def runner(name: str, busy: bool = False, ts: int = 0) -> dict:
+    return {"name": name, "status": "online", "busy": busy, "queried_ts": ts,
+            "designation": "build", "job": "-", "job_url": "-", "job_trigger_user": "-"}
+
+
+@pytest.mark.order(12)
+class TestOrbitRunnerStream:
+
+    def test_runner_status_diff(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        previous = {"r1": runner("r1"), "r2": runner("r2"), "r3": runner("r3")}
+        current = {"r1": runner("r1", ts=60), "r2": runner("r2", busy=True, ts=60), "r4": runner("r4")}
+
+        diff = runner_status_diff(previous, current)
+        assert [r["name"] for r in diff["added"]] == ["r4"]
+        assert diff["removed"] == ["r3"]
+        assert [r["name"] for r in diff["changed"]] == ["r2"]
+
+        # A new poll timestamp alone is not a change
+        assert runner_status_diff(previous, {**previous, "r1": runner("r1", ts=120)}) is None
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_slow_subscriber_is_resynced(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def run():
+            broker = RunnerStatusBroker(queue_size=3)
+
+            with broker.subscribe() as fast, broker.subscribe() as slow:
+                assert broker.subscribers == 2
+
+                for i in range(10):
+                    broker.publish({}, {f"r{i}": runner(f"r{i}")})
+                    # The fast client keeps up
+                    assert (await fast.get())["added"][0]["name"] == f"r{i}"
+
+                # The slow client never read: its queue stays bounded and ends in a resync
+                assert slow.qsize() <= 3
+                items = [slow.get_nowait() for _ in range(slow.qsize())]
+                assert RESYNC in items
+
+            assert broker.subscribers == 0
+
+        asyncio.run(run())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
@@ -0,0 +1,65 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import datetime
+import logging
+
+import pytest
+
+from backend.app.app_def import (
+    RUNNER_USAGE_MAX_GAP,
+    DB_COLLECTION_RUNNERS_BUSY_STATS,
+    DB_COLLECTION_RUNNERS_BUSY_STATS_BY_JOB,
+    DB_COLLECTION_RUNNERS_ONLINE_STATS,
+    DB_COLLECTION_USER_LEADERBOARD_STATS
+)
+from backend.module.runner_usage import (
+    day_spans,
+    usage_increments
+)
+
+# 2025-01-01 23:50 UTC
+TS = int(datetime.datetime(2025, 1, 1, 23, 50, tzinfo=datetime.timezone.utc).timestamp())
+
+
+def sample(ts: int, busy: bool, status: str = "online") -> dict:
+    return {"name": "runner-1", "status": status, "busy": busy, "queried_ts": ts,
+            "designation": "build", "job": ".github/workflows/build.yml" if busy else "-",
+            "job_trigger_user": "user-1" if busy else "-"}
+
+
+@pytest.mark.order(11)
+class TestOrbitRunnerUsage:
+
+    def test_usage_increments(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        # 20 minutes across midnight split 10 / 10
+        spans = day_spans(TS, TS + 20 * 60)
+        assert [day.day for day, _ in spans] == [1, 2]
+        assert [minutes for _, minutes in spans] == [10, 10]
+
+        # Busy interval: credited to runner, designation, job, user and online time
+        increments = usage_increments(sample(TS, busy=True), sample(TS + 20 * 60, busy=False))
+        busy = increments[DB_COLLECTION_RUNNERS_BUSY_STATS.name]
+        assert {(q["by"], q["key"]) for q, _ in busy} == {("runner", "runner-1"), ("designation", "build")}
+        assert sum(c["busy_minutes"] for q, c in busy if q["by"] == "runner") == 20
+        assert increments[DB_COLLECTION_RUNNERS_BUSY_STATS_BY_JOB.name][0][0]["key"] == ".github/workflows/build.yml"
+        assert increments[DB_COLLECTION_USER_LEADERBOARD_STATS.name][0][0]["key"] == "user-1"
+        assert sum(c["online_minutes"] for _, c in increments[DB_COLLECTION_RUNNERS_ONLINE_STATS.name]) == 20
+
+        # Idle interval: only online / offline time
+        increments = usage_increments(sample(TS, busy=False, status="offline"), sample(TS + 60, busy=False))
+        assert list(increments) == [DB_COLLECTION_RUNNERS_ONLINE_STATS.name]
+        assert increments[DB_COLLECTION_RUNNERS_ONLINE_STATS.name][0][1] == {"offline_minutes": 1}
+
+        # First sample, out of order samples and gaps (e.g. downtime) are not credited
+        assert usage_increments(None, sample(TS, busy=True)) == {}
+        assert usage_increments(sample(TS, busy=True), sample(TS - 60, busy=True)) == {}
+        assert usage_increments(sample(TS, busy=True), sample(TS + RUNNER_USAGE_MAX_GAP + 1, busy=True)) == {}
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
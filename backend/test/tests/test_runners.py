@@ -0,0 +1,236 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import asyncio
+import logging
+
+import pytest
+
+from backend.module.github import (
+    GitHubClient,
+    GitHubError
+)
+from backend.module.runners import (
+    RunnerPoller,
+    fetch_runner_status
+)
+from .fake_github import (
+    FakeGitHubServer,
+    FakeGitHubState
+)
+
+MAX_CONCURRENCY = 4
+
+
+@pytest.mark.order(8)
+class TestOrbitRunners:
+
+    def test_poller_against_fake_github(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        # 250 runners span three pages of 100; every busy runner has its own run
+        state = FakeGitHubState(delay=0.02)
+        state.add_repo("repo-a", runner_count=250, busy_count=12)
+        state.add_repo("repo-b", runner_count=5)
+
+        async def poll(url):
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks += 1
+
+            # The event loop must keep running other tasks while the poller waits on I/O
+            ticker_task = asyncio.create_task(ticker())
+            async with GitHubClient(api_url=url, owner="orbit", token="token",
+                                    max_concurrency=MAX_CONCURRENCY) as client:
+                runners = await fetch_runner_status(client, ["repo-a", "repo-b"])
+
+            ticker_task.cancel()
+            return runners, ticks
+
+        with FakeGitHubServer(state) as server:
+            runners, ticks = asyncio.run(poll(server.url))
+
+        # Full pagination past per_page=100
+        assert len(runners) == 255
+        assert len({r["name"] for r in runners}) == 255
+
+        # Busy runners are matched to their job's run
+        busy = [r for r in runners if r["busy"]]
+        assert len(busy) == 12
+        assert all(r["job"].startswith(".github/workflows/build-") for r in busy)
+        assert all(r["job_trigger_user"].startswith("user-") for r in busy)
+        assert all(r["designation"] == "build" for r in runners)
+
+        # Requests ran concurrently, but never above the cap
+        assert 1 < state.max_in_flight <= MAX_CONCURRENCY
+        assert ticks > 0
+
+        logging.info(f"{len(state.requests)} requests, "
+                     f"max {state.max_in_flight} in flight, {ticks} loop ticks while polling")
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_poller_conditional_requests_and_rate_limit(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        state = FakeGitHubState()
+        state.add_repo("repo-a", runner_count=150, busy_count=3)
+        state.add_repo("repo-b", runner_count=5)
+
+        async def poll(url):
+            async with GitHubClient(api_url=url, owner="orbit", token="token",
+                                    max_concurrency=MAX_CONCURRENCY) as client:
+                poller = RunnerPoller(client, ["repo-a", "repo-b"], interval=60)
+
+                assert sorted(await poller.poll()) == ["repo-a", "repo-b"]
+                first = poller.runner_status()
+                first_requests = len(state.requests)
+
+                # Nothing is due until the interval elapses
+                assert await poller.poll() == []
+
+                # Unchanged data: every request is a free 304 served from the ETag cache
+                remaining = state.rate_limit_remaining
+                await poller.poll(now=poller.next_poll_in() + 10 ** 10)
+                second = poller.runner_status()
+                assert len(state.requests) == 2 * first_requests
+                assert state.not_modified == first_requests
+                assert state.rate_limit_remaining == remaining
+                assert [r["name"] for r in second] == [r["name"] for r in first]
+                assert sum(r["busy"] for r in second) == 3
+
+                # A changed page is downloaded again and picked up
+                state.runners["repo-a"][120]["status"] = "offline"
+                await poller.poll(now=10 ** 10)
+                assert state.rate_limit_remaining == remaining - 1
+                assert poller.repos["repo-a"].last_stats.cost == 1
+                assert {r["name"]: r["status"] for r in poller.runner_status()}[
+                           "repo-a-runner-120"] == "offline"
+
+                # A nearly exhausted budget stretches the interval towards the reset
+                state.rate_limit_remaining = 10
+                state.runners["repo-b"][0]["status"] = "offline"
+                await poller.poll(now=10 ** 10)
+                assert poller.repos["repo-b"].interval > 60
+                assert poller.repos["repo-b"].interval <= state.rate_limit_reset - poller.last_poll_ts
+
+                return poller.status()
+
+        with FakeGitHubServer(state) as server:
+            status = asyncio.run(poll(server.url))
+
+        assert status["last_poll_duration"] is not None
+        assert status["rate_limit"]["remaining"] == state.rate_limit_remaining
+        assert status["requests"]["not_modified"] == state.not_modified
+        assert set(status["repos"]) == {"repo-a", "repo-b"}
+
+        logging.info(f"{len(state.requests)} requests, {state.not_modified} not modified, "
+                     f"repo-b interval {status['repos']['repo-b']['interval']}s")
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_github_etag_cache_bounded(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        state = FakeGitHubState()
+        state.add_repo("repo-a", runner_count=150, busy_count=20)
+
+        async def poll(url):
+            async with GitHubClient(api_url=url, owner="orbit", token="token",
+                                    max_concurrency=MAX_CONCURRENCY, etag_cache_size=8) as client:
+                poller = RunnerPoller(client, ["repo-a"], interval=60)
+
+                # Runner pages, run pages and one jobs URL per run: more URLs than the cache keeps
+                await poller.poll()
+                assert len(set(state.requests)) > 8
+                assert len(client._etag_cache) == 8
+
+                # Payloads are still served correctly once evicted
+                await poller.poll(now=10 ** 10)
+                assert sum(r["busy"] for r in poller.runner_status()) == 20
+                assert len(client._etag_cache) == 8
+
+        with FakeGitHubServer(state) as server:
+            asyncio.run(poll(server.url))
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_github_failed_page_raises(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        state = FakeGitHubState()
+        state.add_repo("repo-a", runner_count=150, busy_count=3)
+
+        async def fetch(url):
+            async with GitHubClient(api_url=url, owner="orbit", token="token",
+                                    max_concurrency=MAX_CONCURRENCY) as client:
+                assert len(await client.get_runners("repo-a")) == 150
+                assert len(await client.get_in_progress_jobs("repo-a")) == 3
+
+                # A failed page after the first is an error, not the end of the list
+                state.failures = {"page=2": 502}
+                with pytest.raises(GitHubError):
+                    await client.get_runners("repo-a")
+
+                # So are the failed jobs of one run among several
+                state.failures = {"runs/1/jobs": 502}
+                with pytest.raises(GitHubError):
+                    await client.get_in_progress_jobs("repo-a")
+
+        with FakeGitHubServer(state) as server:
+            asyncio.run(fetch(server.url))
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_poller_keeps_runners_when_rate_limited(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        state = FakeGitHubState()
+        state.add_repo("repo-a", runner_count=150, busy_count=3)
+        state.add_repo("repo-b", runner_count=5)
+
+        async def poll(url):
+            async with GitHubClient(api_url=url, owner="orbit", token="token",
+                                    max_concurrency=MAX_CONCURRENCY) as client:
+                poller = RunnerPoller(client, ["repo-a", "repo-b"], interval=60)
+
+                assert sorted(await poller.poll()) == ["repo-a", "repo-b"]
+                previous = poller.runner_status()
+                last_poll_ts = poller.repos["repo-a"].last_poll_ts
+
+                # GitHub refuses every request until the window resets
+                state.failures = {"/repos/": 403}
+                state.rate_limit_remaining = 0
+                assert await poller.poll(now=10 ** 10) == []
+
+                # Nothing polled, so the saved snapshot keeps the previous runners
+                assert poller.runner_status() == previous
+                assert sum(r["busy"] for r in poller.runner_status()) == 3
+                assert poller.repos["repo-a"].last_poll_ts == last_poll_ts
+                assert poller.repos["repo-a"].failed_polls == 1
+                assert client.stats.failed > 0
+
+                # Retried once the rate limit resets, not before
+                assert poller.repos["repo-a"].next_poll_ts >= state.rate_limit_reset - 1
+                assert await poller.poll() == []
+
+                # A transport error is a failed poll too
+                state.failures = {}
+                client._client.base_url = "http://127.0.0.1:1"
+                assert await poller.poll(now=10 ** 10) == []
+                assert poller.runner_status() == previous
+                assert poller.status()["repos"]["repo-b"]["failed_polls"] == 2
+
+        with FakeGitHubServer(state) as server:
+            asyncio.run(poll(server.url))
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
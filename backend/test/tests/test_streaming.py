@@ -0,0 +1,88 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import asyncio
+import json
+import logging
+import tracemalloc
+
+import pytest
+
+from backend.app.streaming import (
+    NDJSON_MEDIA_TYPE,
+    STREAM_CHUNK_SIZE,
+    ndjson_response
+)
+
+STREAM_DOCUMENTS = 1_000_000
+# Peak Python heap allowed while streaming, far below the size of the stream itself
+STREAM_MEMORY_BUDGET = 8 * 1024 * 1024
+
+
+async def synthetic_executions(count: int):
+    """ Test execution documents as a database cursor yields them. """
+
+    for i in range(1, count + 1):
+        yield {"_id": f"PRJ1-E{i}", "execution_key": f"PRJ1-E{i}", "seq": i, "project_key": "PRJ1",
+               "test_case_key": f"PRJ1-T{i % 500 + 1}", "test_cycle_key": None, "result": "PASS",
+               "comment": "Executed by the nightly pipeline", "created_at": "2026-01-01T00:00:00Z",
+               "updated_at": "2026-01-01T00:00:00Z"}
+
+
+@pytest.mark.order(15)
+class TestOrbitStreaming:
+
+    def test_ndjson_lines(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            response = ndjson_response(synthetic_executions(2000))
+            assert response.media_type == NDJSON_MEDIA_TYPE
+
+            chunks = [chunk async for chunk in response.body_iterator]
+            assert len(chunks) > 1
+            assert all(len(chunk) < 2 * STREAM_CHUNK_SIZE for chunk in chunks)
+
+            lines = b"".join(chunks).split(b"\n")
+            assert lines[-1] == b""
+            assert [json.loads(line)["seq"] for line in lines[:-1]] == list(range(1, 2001))
+
+            empty = ndjson_response(synthetic_executions(0))
+            assert [chunk async for chunk in empty.body_iterator] == []
+
+        asyncio.run(scenario())
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_ndjson_memory_flat(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        async def scenario():
+            response = ndjson_response(synthetic_executions(STREAM_DOCUMENTS))
+            streamed = lines = 0
+
+            tracemalloc.start()
+            try:
+                async for chunk in response.body_iterator:
+                    streamed += len(chunk)
+                    lines += chunk.count(b"\n")
+
+                _, peak = tracemalloc.get_traced_memory()
+
+            finally:
+                tracemalloc.stop()
+
+            return streamed, lines, peak
+
+        streamed, lines, peak = asyncio.run(scenario())
+        logging.info(f"Streamed {STREAM_DOCUMENTS} executions ({streamed / 1e6:.0f}MB) "
+                     f"with a peak heap of {peak / 1e6:.2f}MB")
+
+        assert lines == STREAM_DOCUMENTS
+        assert peak < STREAM_MEMORY_BUDGET < streamed
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
@@ -0,0 +1,93 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend test script for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+import json
+import logging
+import pathlib
+
+import pytest
+
+from backend.module.webhooks import EVENT_HEADER
+from .test_base import OrbitTMBaseTest
+
+EVENTS_FILE = pathlib.Path(__file__).parent / "data" / "github_webhook_events.json"
+
+
+@pytest.mark.order(9)
+class TestOrbitRunnerWebhooks(OrbitTMBaseTest):
+
+    def test_webhook_rejects_bad_signature(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        events = json.loads(EVENTS_FILE.read_text())
+        response = self.send_webhook(events[2]["event"], events[2]["payload"], secret="wrong")
+        assert response.status_code == 401
+
+        response = self.__class__.session.post(f"{self.url}/runners/webhook",
+                                               data=json.dumps(events[2]["payload"]),
+                                               headers={EVENT_HEADER: "workflow_job"})
+        assert response.status_code == 401
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_webhook_replay(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        # ping, queued, two jobs starting, the first finishing, an unrelated event
+        events = json.loads(EVENTS_FILE.read_text())
+        codes = [self.send_webhook(e["event"], e["payload"]).status_code for e in events]
+        assert codes == [200, 202, 200, 200, 200, 202]
+
+        response = self.__class__.session.get(f"{self.url}/runners/status/orbit-webhook-runner-1")
+        assert response.status_code == 200
+        runner = response.json()
+        assert runner["busy"] is False
+        assert runner["job"] == "-"
+        assert runner["designation"] == "build"
+
+        response = self.__class__.session.get(f"{self.url}/runners/status/orbit-webhook-runner-2")
+        assert response.status_code == 200
+        runner = response.json()
+        assert runner["busy"] is True
+        assert runner["job"] == "Test"
+        assert runner["job_url"].endswith("/job/29000002")
+        assert runner["job_trigger_user"] == "octo-qa"
+        assert runner["designation"] == "test"
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
+
+    def test_webhook_pushes_stream_diff(self, request):
+        logging.info(f"--- Starting test: {request.node.name} ---")
+
+        def read_event(lines) -> tuple:
+            event = data = None
+            for line in lines:
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: "):
+                    data = line[len("data: "):]
+                elif not line and event:
+                    return event, json.loads(data)
+
+        events = json.loads(EVENTS_FILE.read_text())
+        with self.__class__.session.get(f"{self.url}/runners/stream", stream=True, timeout=30) as response:
+            assert response.status_code == 200
+            assert response.headers["Content-Type"].startswith("text/event-stream")
+            lines = response.iter_lines(chunk_size=1, decode_unicode=True)
+
+            event, snapshot = read_event(lines)
+            assert event == "snapshot"
+            assert isinstance(snapshot, list)
+
+            # runner-1 starts a job again: pushed as a change, not a new snapshot
+            assert self.send_webhook(events[2]["event"], events[2]["payload"]).status_code == 200
+            event, diff = read_event(lines)
+            assert event == "diff"
+            assert [r["name"] for r in diff["added"] + diff["changed"]] == ["orbit-webhook-runner-1"]
+            assert (diff["added"] + diff["changed"])[0]["busy"] is True
+
+        logging.info(f"--- Test: {request.node.name} Complete ---")
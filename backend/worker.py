@@ -0,0 +1,64 @@
+# ================================================================
+# Orbit API
+# Description: FastAPI backend for the Orbit application.
+# Author: Jerry
+# License: MIT
+# ================================================================
+
+# worker.py
+#
+# Background worker: polls GitHub runner status and maintains the runner
+# history / usage collections, outside the API processes.
+#
+# Every worker competes for the WORKER_LEASE_NAME lease, so exactly one of
+# them polls at a time however many are started; the others stand by and
+# take over within WORKER_LEASE_TTL seconds if the holder goes away. The API
+# processes read the results from MongoDB (see module/runner_state.py).
+
+import asyncio
+import logging.config
+
+import yaml
+
+from backend.app.app_def import (
+    BACKEND_DIR,
+    WORKER_LEASE_NAME
+)
+from backend.app.build_parser import build_parser
+from backend.app.utility import configure_logging
+from backend.db.mongodb import MongoClient
+from backend.module.lease import Lease
+from backend.module.runners import save_runner_status
+
+logger = logging.getLogger(__name__)
+
+
+async def run_background_jobs(mdb: MongoClient) -> None:
+    """ Run the background jobs whenever this process holds the worker lease. """
+
+    await Lease(mdb, WORKER_LEASE_NAME).run(lambda: save_runner_status(mdb))
+
+
+async def main() -> None:
+    """ Connect to mongo and run the background jobs until cancelled. """
+
+    mongodb_client = MongoClient()
+    await mongodb_client.connect()
+    await mongodb_client.configure()
+
+    logger.info("Started background worker")
+
+    try:
+        await run_background_jobs(mongodb_client)
+
+    finally:
+        await mongodb_client.close()
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+
+    with open(configure_logging(BACKEND_DIR / 'log_conf.yaml', args.debug), 'r') as f:
+        logging.config.dictConfig(yaml.safe_load(f))
+
+    asyncio.run(main())
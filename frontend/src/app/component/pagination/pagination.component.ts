@@ -15,14 +15,22 @@ export class PaginationComponent {
   @Input() pageSize = 100;
   @Input() pageSizeOptions: number[] = [100, 50, 20];
 
+  // Cursor mode: the server pages with opaque cursors, so the total is unknown.
+  // pageItems is the number of rows on the current page, hasMore whether a next cursor exists.
+  @Input() cursorMode = false;
+  @Input() pageItems = 0;
+  @Input() hasMore = false;
+
   @Output() pageIndexChange = new EventEmitter<number>();
   @Output() pageSizeChange = new EventEmitter<number>();
 
   get rangeStart(): number {
+    if (this.cursorMode) return this.pageItems === 0 ? 0 : this.pageIndex * this.pageSize + 1;
     return this.totalItems === 0 ? 0 : this.pageIndex * this.pageSize + 1;
   }
 
   get rangeEnd(): number {
+    if (this.cursorMode) return this.pageIndex * this.pageSize + this.pageItems;
     return Math.min(this.totalItems, (this.pageIndex + 1) * this.pageSize);
   }
 
@@ -31,6 +39,7 @@ export class PaginationComponent {
   }
 
   get hasNextPage(): boolean {
+    if (this.cursorMode) return this.hasMore;
     return this.rangeEnd < this.totalItems;
   }
 
@@ -1,9 +1,8 @@
 import { Component, inject, OnInit, AfterViewInit, OnDestroy, ChangeDetectorRef, ChangeDetectionStrategy } from '@angular/core';
 import { MatTableDataSource, MatTableModule } from '@angular/material/table';
-import { RunnersStatusService, RunnerStatus } from '../../services/runners.status.service';
+import { RunnersStatusService, RunnerStatus, RunnersStreamEvent } from '../../services/runners.status.service';
 import { AutoRefreshService } from '../../services/auto-refresh.service';
 import { Subscription } from 'rxjs/internal/Subscription';
-import { interval } from 'rxjs/internal/observable/interval';
 import { LoaderComponent } from '../loader/loader.component';
 import { ErrorStateComponent } from '../error-state/error.state.component';
 import { EmptyStateComponent } from '../empty-state/empty.state.component';
@@ -28,8 +27,8 @@ import { StatusBadgeComponent } from '../status-badge/status.badge.component';
 
 export class RunnersStatusTableComponent implements OnInit, AfterViewInit, OnDestroy {
   cdr = inject(ChangeDetectorRef);
-  private static readonly AUTO_REFRESH_INTERVAL_MS = 60 * 1000;
   private refreshSubscription?: Subscription;
+  private runnersByName = new Map<string, RunnerStatus>();
   runnersDataSource: MatTableDataSource<RunnerStatus>;
   displayedColumns = ['NAME', 'DESIGNATION', 'STATUS', 'BUSY', 'USER', 'JOB LINK'];
   runners: any[] = [];
@@ -49,9 +48,7 @@ export class RunnersStatusTableComponent implements OnInit, AfterViewInit, OnDes
     this.runnerStatusServices.getRunners().subscribe({
       next: (response) => {
         const data = Array.isArray(response) ? response : [];
-        this.runnersDataSource.data = data.slice().sort((a, b) =>
-          a.name.localeCompare(b.name, undefined, { numeric: true, sensitivity: 'base' })
-        );
+        this.setRunners(data);
         console.log('Runners data received:', this.runnersDataSource.data);
         this.isLoading = false;
         this.cdr.markForCheck();
@@ -65,11 +62,43 @@ export class RunnersStatusTableComponent implements OnInit, AfterViewInit, OnDes
     });
   }
 
+  private setRunners(runners: RunnerStatus[]): void {
+    this.runnersByName = new Map(runners.map(runner => [runner.name, runner]));
+    this.renderRunners();
+  }
+
+  private renderRunners(): void {
+    this.runnersDataSource.data = Array.from(this.runnersByName.values()).sort((a, b) =>
+      a.name.localeCompare(b.name, undefined, { numeric: true, sensitivity: 'base' })
+    );
+  }
+
+  private applyStreamEvent(event: RunnersStreamEvent): void {
+    if (event.type === 'snapshot') {
+      this.setRunners(event.runners);
+      return;
+    }
+
+    event.diff.removed.forEach(name => this.runnersByName.delete(name));
+    [...event.diff.added, ...event.diff.changed].forEach(runner => this.runnersByName.set(runner.name, runner));
+    this.renderRunners();
+  }
+
   private startAutoRefresh(): void {
+    // The server pushes a snapshot and then only what changed, instead of re-fetching on a timer
     if (!this.refreshSubscription) {
-      this.refreshSubscription = interval(RunnersStatusTableComponent.AUTO_REFRESH_INTERVAL_MS).subscribe(() => {
-        this.loadRunners();
-        this.cdr.markForCheck();
+      this.refreshSubscription = this.runnerStatusServices.streamRunners().subscribe({
+        next: (event) => {
+          this.applyStreamEvent(event);
+          this.error = '';
+          this.isLoading = false;
+          this.cdr.markForCheck();
+        },
+        error: (error) => {
+          console.error('Runner status stream failed:', error);
+          this.refreshSubscription = undefined;
+          this.cdr.markForCheck();
+        }
       });
     }
   }
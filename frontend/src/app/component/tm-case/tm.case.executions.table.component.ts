@@ -40,22 +40,28 @@ export class TmCaseExecutionsTableComponent implements OnInit {
   pageSize = 100;
   readonly pageSizeOptions = [100, 50, 20];
 
+  // cursors[i] is the cursor that loads page i (null for the first page)
+  cursors: (string | null)[] = [null];
+
   constructor(private testExecutionsService: TestExecutionsService) {
     this.executionsDataSource = new MatTableDataSource<TestExecutions>([]);
   }
 
-  get totalItems(): number {
-    return this.executionsDataSource.data.length;
+  get hasMore(): boolean {
+    return this.cursors.length > this.pageIndex + 1;
   }
 
-  get pagedExecutions(): TestExecutions[] {
-    const start = this.pageIndex * this.pageSize;
-    return this.executionsDataSource.data.slice(start, start + this.pageSize);
+  onPageIndexChange(index: number): void {
+    if (index < 0 || index >= this.cursors.length) return;
+    this.pageIndex = index;
+    this.loadExecutions();
   }
 
   onPageSizeChange(size: number): void {
     this.pageSize = size;
     this.pageIndex = 0;
+    this.cursors = [null];
+    this.loadExecutions();
   }
 
   formatDate(dateStr: string | null): string {
@@ -82,12 +88,13 @@ export class TmCaseExecutionsTableComponent implements OnInit {
     if (!this.projectKey || !this.caseKey) return;
     this.isLoading = true;
     this.error = '';
-    this.testExecutionsService.getTestExecutionsbyTestCase(this.projectKey, this.caseKey).subscribe({
-      next: (response) => {
-        const data = Array.isArray(response) ? response : [];
-        data.sort((a, b) => b.execution_key.localeCompare(a.execution_key, undefined, { numeric: true, sensitivity: 'base' }));
-        this.executionsDataSource.data = data;
-        this.pageIndex = 0;
+    const after = this.cursors[this.pageIndex];
+    this.testExecutionsService.getTestExecutionsPagebyTestCase(this.projectKey, this.caseKey, this.pageSize, after).subscribe({
+      next: (page) => {
+        // Rows arrive newest first; remember where the following page starts
+        this.executionsDataSource.data = page.items;
+        this.cursors = this.cursors.slice(0, this.pageIndex + 1);
+        if (page.nextCursor) this.cursors.push(page.nextCursor);
         this.isLoading = false;
         this.cdr.markForCheck();
       },
@@ -21,6 +21,16 @@ export interface RunnersResponseModel {
     runners: RunnerStatus[];
 }
 
+export interface RunnersStreamDiff {
+    added: RunnerStatus[];
+    removed: string[];
+    changed: RunnerStatus[];
+}
+
+export type RunnersStreamEvent =
+    { type: 'snapshot', runners: RunnerStatus[] } |
+    { type: 'diff', diff: RunnersStreamDiff };
+
 @Injectable({
     providedIn: 'root'
 })
@@ -42,4 +52,29 @@ export class RunnersStatusService {
 
         return this.http.get<RunnersResponseModel>(`${this.apiUrl}/runners/status`, { headers });
     }
+
+    /**
+    * Stream runner status changes over Server-Sent Events
+    * @returns An observable that emits the full runner list once (and after a resync), then only diffs.
+    * EventSource reconnects by itself; the server starts every connection with a snapshot.
+    */
+    streamRunners(): Observable<RunnersStreamEvent> {
+        return new Observable<RunnersStreamEvent>(subscriber => {
+            const source = new EventSource(`${this.apiUrl}/runners/stream`);
+
+            source.addEventListener('snapshot', (event) => {
+                subscriber.next({ type: 'snapshot', runners: JSON.parse((event as MessageEvent).data) });
+            });
+            source.addEventListener('diff', (event) => {
+                subscriber.next({ type: 'diff', diff: JSON.parse((event as MessageEvent).data) });
+            });
+            source.onerror = () => {
+                if (source.readyState === EventSource.CLOSED) {
+                    subscriber.error('Runner status stream closed');
+                }
+            };
+
+            return () => source.close();
+        });
+    }
 }
\ No newline at end of file
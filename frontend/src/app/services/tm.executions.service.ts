@@ -1,6 +1,6 @@
 import { Injectable } from '@angular/core';
-import { HttpClient, HttpHeaders } from '@angular/common/http';
-import { Observable } from 'rxjs';
+import { HttpClient, HttpHeaders, HttpParams } from '@angular/common/http';
+import { Observable, map } from 'rxjs';
 import { environment } from '../../environments/environment';
 
 export interface TestExecutions {
@@ -16,6 +16,11 @@ export interface TestExecutions {
     links: any[];
 }
 
+export interface TestExecutionsPage {
+    items: TestExecutions[];
+    nextCursor: string | null;
+}
+
 @Injectable({
     providedIn: 'root'
 })
@@ -38,6 +43,31 @@ export class TestExecutionsService {
         return this.http.get<TestExecutions[]>(`${this.apiUrl}/tm/projects/${projectKey}/test-cases/${testCaseKey}/executions`, { headers });
     }
 
+    /**
+    * Get one page of test executions by test case key, newest first
+    * @param limit The maximum number of executions in the page
+    * @param after The cursor returned with the previous page, or null for the first page
+    * @returns An observable that emits the page and the cursor of the next page (null on the last page).
+    */
+    getTestExecutionsPagebyTestCase(projectKey: string, testCaseKey: string,
+                                    limit: number, after: string | null): Observable<TestExecutionsPage> {
+        const headers = new HttpHeaders({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        });
+
+        let params = new HttpParams().set('limit', limit);
+        if (after) params = params.set('after', after);
+
+        return this.http.get<TestExecutions[]>(`${this.apiUrl}/tm/projects/${projectKey}/test-cases/${testCaseKey}/executions`,
+            { headers, params, observe: 'response' }).pipe(
+                map(response => ({
+                    items: response.body ?? [],
+                    nextCursor: response.headers.get('X-Next-Cursor')
+                }))
+            );
+    }
+
     /**
     * Get details of a specific test execution by its key
     * @param executionKey The key of the test execution to retrieve